@@ -0,0 +1,73 @@
+"""
+Service dependencies for API routes
+
+Each service is created once per application and stored on ``app.state``.
+The application lifespan creates them at startup and warms the scraper's
+browser; the getters below fall back to creating a service lazily if it is
+missing (e.g. when the app is driven without running its lifespan). Routes receive services through ``Depends`` so
+tests can swap them with ``app.dependency_overrides``.
+"""
+
+from fastapi import FastAPI, Request
+import logging
+from typing import Any, Callable, Dict, cast
+
+from backend_app.services.retrieval import RetrievalService
+from backend_app.services.kg import KnowledgeGraphService
+from backend_app.services.controller import LLMController
+from backend_app.services.scraper import AdvancedWebScraper
+
+logger = logging.getLogger(__name__)
+
+# app.state attribute name -> service factory
+SERVICE_FACTORIES: Dict[str, Callable[[], Any]] = {
+    "retrieval_service": RetrievalService,
+    "kg_service": KnowledgeGraphService,
+    "llm_controller": LLMController,
+    "scraper_service": AdvancedWebScraper,
+}
+
+def _get_or_create(app: FastAPI, name: str) -> Any:
+    """Return the app-wide service instance, creating it on first use"""
+    service = getattr(app.state, name, None)
+    if service is None:
+        service = SERVICE_FACTORIES[name]()
+        setattr(app.state, name, service)
+    return service
+
+def init_services(app: FastAPI) -> None:
+    """Create all services up front (called from the app lifespan)"""
+    for name in SERVICE_FACTORIES:
+        _get_or_create(app, name)
+    logger.info("API services initialized")
+
+async def startup_services(app: FastAPI) -> None:
+    """Run async warm-up for services that need it (called from the app lifespan)"""
+    scraper = getattr(app.state, "scraper_service", None)
+    if scraper is not None:
+        await scraper.startup()
+
+async def shutdown_services(app: FastAPI) -> None:
+    """Release resources held by services (called from the app lifespan)"""
+    llm_controller = getattr(app.state, "llm_controller", None)
+    if llm_controller is not None:
+        await llm_controller.close()
+    kg_service = getattr(app.state, "kg_service", None)
+    if kg_service is not None:
+        await kg_service.close()
+    scraper = getattr(app.state, "scraper_service", None)
+    if scraper is not None:
+        await scraper.close()
+    logger.info("API services shut down")
+
+def get_retrieval_service(request: Request) -> RetrievalService:
+    return cast(RetrievalService, _get_or_create(request.app, "retrieval_service"))
+
+def get_kg_service(request: Request) -> KnowledgeGraphService:
+    return cast(KnowledgeGraphService, _get_or_create(request.app, "kg_service"))
+
+def get_llm_controller(request: Request) -> LLMController:
+    return cast(LLMController, _get_or_create(request.app, "llm_controller"))
+
+def get_scraper_service(request: Request) -> AdvancedWebScraper:
+    return cast(AdvancedWebScraper, _get_or_create(request.app, "scraper_service"))
@@ -1,22 +1,25 @@
 """
-Pydantic schemas for API request/response models
+Pydantic and msgspec schemas for API request/response models
 
 These schemas define the structure of data exchanged between frontend and backend.
-All fields include proper validation and documentation.
+All fields include proper validation and documentation. Request models are
+Pydantic so client input is validated; the query response carriers are
+msgspec Structs because they only ever hold trusted internal data.
 """
 
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+import msgspec
+from msgspec import Meta
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+from typing import Annotated, List, Optional, Dict, Any, Literal
 from datetime import datetime
 
 # Request Models
 
 class QueryRequest(BaseModel):
-    """Request model for query endpoint"""
+    """Request model for query endpoint (model options are query parameters)"""
+    model_config = ConfigDict(extra='forbid')
+    
     query: str = Field(..., description="User query about education policies", min_length=1, max_length=1000)
-    simulate_failure: Optional[bool] = Field(False, description="Simulate error response for testing")
-    model: Optional[str] = Field("deepseek-r1:7b", description="AI model to use for response generation")
-    thinking_mode: Optional[str] = Field("smart", description="Thinking mode: smart, general, deep, reasoning")
 
 class DocumentRequest(BaseModel):
     """Request model for document ingestion"""
@@ -32,34 +35,63 @@ class FeedbackRequest(BaseModel):
     rating: int = Field(..., description="User rating (1-5)", ge=1, le=5)
     comments: Optional[str] = Field(None, description="Additional comments", max_length=1000)
 
+ScrapingMethod = Literal['auto', 'selenium', 'playwright', 'requests', 'pdf']
+
+class ScrapeRequest(BaseModel):
+    """Request model for single-URL scraping"""
+    url: HttpUrl = Field(..., description="URL to scrape")
+    method: ScrapingMethod = Field('auto', description="Scraping method")
+    max_retries: int = Field(3, description="Maximum number of scraping attempts", ge=1, le=10)
+
+class BatchScrapeRequest(BaseModel):
+    """Request model for batch scraping"""
+    urls: List[HttpUrl] = Field(..., description="URLs to scrape", min_length=1, max_length=50)
+    method: ScrapingMethod = Field('auto', description="Scraping method")
+    max_concurrent: int = Field(5, description="Maximum concurrent scraping operations", ge=1, le=50)
+
+class GovernmentScrapeRequest(BaseModel):
+    """Request model for government website scraping"""
+    url: HttpUrl = Field(..., description="Government website URL to scrape")
+    site_type: Optional[str] = Field(None, description="Site type: indiacode, ugc, aicte, education, egazette")
+    extract_pdfs: bool = Field(True, description="Whether to extract PDF links")
+    extract_acts: bool = Field(True, description="Whether to extract act/section references")
+
 # Response Models
 
-class Citation(BaseModel):
+class ResponseModel(BaseModel):
+    """Base for Pydantic response models: immutable and closed to unknown fields"""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+# Query response carriers are msgspec Structs: they are built only from trusted
+# internal values and encoded straight to JSON, so Pydantic validation is skipped
+
+class Citation(msgspec.Struct, frozen=True):
     """Citation model for document references"""
-    docId: str = Field(..., description="Document identifier")
-    page: int = Field(..., description="Page number", ge=1)
-    span: str = Field(..., description="Text span or section reference")
+    docId: Annotated[str, Meta(description="Document identifier")]
+    page: Annotated[int, Meta(description="Page number", ge=1)]
+    span: Annotated[str, Meta(description="Text span or section reference")]
 
-class RetrievalResult(BaseModel):
+class RetrievalResult(msgspec.Struct, frozen=True):
     """Retrieval result model"""
-    dense: List[str] = Field(default_factory=list, description="Dense retrieval candidates")
-    sparse: List[str] = Field(default_factory=list, description="Sparse retrieval candidates")
+    dense: Annotated[List[str], Meta(description="Dense retrieval candidates")] = msgspec.field(default_factory=list)
+    sparse: Annotated[List[str], Meta(description="Sparse retrieval candidates")] = msgspec.field(default_factory=list)
 
-class ProcessingTrace(BaseModel):
+class ProcessingTrace(msgspec.Struct, frozen=True):
     """Processing trace model for debugging"""
-    language: str = Field(..., description="Detected language")
-    retrieval: RetrievalResult = Field(..., description="Retrieval results")
-    kg_traversal: str = Field(..., description="Knowledge graph traversal result")
-    controller_iterations: int = Field(..., description="Number of LLM controller iterations")
+    language: Annotated[str, Meta(description="Detected language")]
+    retrieval: Annotated[RetrievalResult, Meta(description="Retrieval results")]
+    kg_traversal: Annotated[str, Meta(description="Knowledge graph traversal result")]
+    controller_iterations: Annotated[int, Meta(description="Number of LLM controller iterations")]
+    warnings: Annotated[List[str], Meta(description="Non-fatal pipeline warnings")] = msgspec.field(default_factory=list)
 
-class QueryResponse(BaseModel):
+class QueryResponse(msgspec.Struct, frozen=True):
     """Response model for query endpoint"""
-    answer: str = Field(..., description="AI-generated answer")
-    citations: List[Citation] = Field(default_factory=list, description="Document citations")
-    processing_trace: ProcessingTrace = Field(..., description="Processing trace for debugging")
-    risk_assessment: str = Field(..., description="Risk assessment result")
+    answer: Annotated[str, Meta(description="AI-generated answer")]
+    citations: Annotated[List[Citation], Meta(description="Document citations")]
+    processing_trace: Annotated[ProcessingTrace, Meta(description="Processing trace for debugging")]
+    risk_assessment: Annotated[str, Meta(description="Risk assessment result")]
 
-class DocumentResponse(BaseModel):
+class DocumentResponse(ResponseModel):
     """Response model for document endpoint"""
     id: str = Field(..., description="Document identifier")
     title: str = Field(..., description="Document title")
@@ -68,34 +100,34 @@ class DocumentResponse(BaseModel):
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
 
-class IngestResponse(BaseModel):
+class IngestResponse(ResponseModel):
     """Response model for document ingestion"""
     jobId: str = Field(..., description="Ingestion job identifier")
     status: str = Field(..., description="Job status")
     message: str = Field(..., description="Status message")
 
-class FeedbackResponse(BaseModel):
+class FeedbackResponse(ResponseModel):
     """Response model for feedback submission"""
     status: str = Field(..., description="Submission status")
     message: str = Field(..., description="Status message")
 
 # Error Models
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(ResponseModel):
     """Error response model"""
     error: str = Field(..., description="Error message")
     details: str = Field(..., description="Error details")
 
 # Service Status Models
 
-class ServiceStatus(BaseModel):
+class ServiceStatus(ResponseModel):
     """Service status model"""
     name: str = Field(..., description="Service name")
     status: str = Field(..., description="Service status")
     url: Optional[str] = Field(None, description="Service URL")
     last_check: Optional[datetime] = Field(None, description="Last health check")
 
-class SystemStatus(BaseModel):
+class SystemStatus(ResponseModel):
     """System status model"""
     overall_status: str = Field(..., description="Overall system status")
     services: List[ServiceStatus] = Field(..., description="Individual service statuses")
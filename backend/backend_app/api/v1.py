@@ -5,19 +5,27 @@ This module contains all the API endpoints with proper error handling and valida
 All endpoints return placeholder data until external services are integrated.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Depends, Query, status
+from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 import logging
-from typing import Dict, Any
-import uuid
+import msgspec
+import orjson
+from typing import AsyncIterator, Awaitable, Dict, Any, List, Set, Tuple, Type, TypeVar
 import asyncio
+import os
+import random
 import re
+import time
 from datetime import datetime
 
 from backend_app.api.schemas import (
-    QueryRequest, QueryResponse, DocumentResponse, IngestResponse, 
+    QueryRequest, QueryResponse, DocumentRequest, DocumentResponse, IngestResponse, 
     FeedbackRequest, FeedbackResponse, ErrorResponse, ProcessingTrace,
-    RetrievalResult, Citation
+    RetrievalResult, Citation, ScrapeRequest, BatchScrapeRequest, GovernmentScrapeRequest
+)
+from backend_app.api.dependencies import (
+    get_retrieval_service, get_kg_service, get_llm_controller, get_scraper_service
 )
 from backend_app.services.retrieval import RetrievalService
 from backend_app.services.kg import KnowledgeGraphService
@@ -27,17 +35,100 @@ from backend_app.services.scraper import AdvancedWebScraper, ScrapedContent
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Legal references (acts, sections, notifications, ...) in government content
+LEGAL_PATTERNS = [
+    r'Act No\.?\s*\d+',
+    r'Section\s+\d+',
+    r'Rule\s+\d+',
+    r'Regulation\s+\d+',
+    r'Notification\s+No\.?\s*\d+',
+    r'Circular\s+No\.?\s*\d+',
+]
+
+_LEGAL_RE = re.compile('|'.join(f'(?:{p})' for p in LEGAL_PATTERNS), re.IGNORECASE)
+
+# Optional Hyperscan multi-pattern database (falls back to _LEGAL_RE)
+try:
+    import hyperscan
+    _LEGAL_HS_DB = hyperscan.Database()
+    _LEGAL_HS_DB.compile(
+        expressions=[p.encode() for p in LEGAL_PATTERNS],
+        ids=list(range(len(LEGAL_PATTERNS))),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST] * len(LEGAL_PATTERNS),
+    )
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# Content size above which the legal-reference scan runs in a worker thread
+_LEGAL_SCAN_THREAD_THRESHOLD = 64 * 1024
+
+def _extract_legal_references(content: str) -> List[str]:
+    """Extract unique legal references from content in a single linear scan"""
+    if not HYPERSCAN_AVAILABLE:
+        return list({m.group(0) for m in _LEGAL_RE.finditer(content)})
+    
+    # Hyperscan reports every end offset of a match; keep the longest per start
+    spans: Dict[int, int] = {}
+    
+    def on_match(pattern_id: int, start: int, end: int, flags: int, context: Any) -> None:
+        if end > spans.get(start, -1):
+            spans[start] = end
+    
+    data = content.encode('utf-8')
+    _LEGAL_HS_DB.scan(data, match_event_handler=on_match)
+    return list({data[start:end].decode('utf-8') for start, end in spans.items()})
+
+# Current time truncated to the second as (epoch second, datetime, ISO string)
+_clock_cache: Tuple[int, datetime, str] = (-1, datetime.min, "")
+
+def _cached_now() -> Tuple[datetime, str]:
+    """Return the current local time at second resolution and its ISO string"""
+    global _clock_cache
+    second = int(time.time())
+    if second != _clock_cache[0]:
+        now = datetime.fromtimestamp(second)
+        _clock_cache = (second, now, now.isoformat())
+    return _clock_cache[1], _clock_cache[2]
+
+# Cached /status payload as (monotonic time, encoded JSON body)
+STATUS_CACHE_TTL = 1.0
+_status_cache: Tuple[float, bytes] = (float("-inf"), b"")
+
 # Create router
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# 1 = re-validate every _construct()ed response model (set by the test suite; off in production)
+VALIDATE_RESPONSES = os.getenv("API_VALIDATE_RESPONSES") == "1"
 
-# Initialize services (these will be placeholder implementations)
-retrieval_service = RetrievalService()
-kg_service = KnowledgeGraphService()
-llm_controller = LLMController()
-scraper_service = AdvancedWebScraper()
+def _construct(model: Type[ModelT], **values: Any) -> ModelT:
+    """
+    Build a response model from trusted internal values without validation.
+
+    Safety invariant: only values produced by this module or its services may
+    be passed here. Untrusted client input must still go through the request
+    models (QueryRequest, FeedbackRequest), which FastAPI validates. With
+    API_VALIDATE_RESPONSES=1 the constructed instance is re-validated against
+    its schema so mismatches surface in tests.
+    """
+    instance = model.model_construct(**values)
+    if VALIDATE_RESPONSES:
+        model.model_validate(instance.model_dump())
+    return instance
 
-@router.post("/query", response_model=QueryResponse)
-async def query_policies(request: QueryRequest) -> QueryResponse:
+@router.post("/query")
+async def query_policies(
+    request: QueryRequest,
+    model: str = Query("deepseek-r1:7b", description="AI model to use for response generation"),
+    thinking_mode: str = Query("smart", description="Thinking mode: smart, general, deep, reasoning"),
+    simulate_failure: bool = Query(False, description="Simulate error response for testing"),
+    retrieval_service: RetrievalService = Depends(get_retrieval_service),
+    kg_service: KnowledgeGraphService = Depends(get_kg_service),
+    llm_controller: LLMController = Depends(get_llm_controller),
+) -> Response:
     """
     Query education policies with AI-powered retrieval and response generation.
     
@@ -48,13 +139,14 @@ async def query_policies(request: QueryRequest) -> QueryResponse:
     4. LLM controller for response generation
     5. Citation extraction and risk assessment
     
+    The body is a msgspec-encoded QueryResponse.
     Returns placeholder data until external services are integrated.
     """
     try:
-        logger.info(f"Processing query: {request.query[:100]}...")
+        logger.info("Processing query: %.100s...", request.query)
         
         # Simulate failure if requested
-        if request.simulate_failure:
+        if simulate_failure:
             logger.warning("Simulating failure as requested")
             raise HTTPException(
                 status_code=503,
@@ -65,23 +157,37 @@ async def query_policies(request: QueryRequest) -> QueryResponse:
             )
         
         # TODO: Implement actual query processing pipeline
-        # 1. Language detection
-        detected_language = await retrieval_service.detect_language(request.query)
-        
-        # 2. Retrieval (dense and sparse)
-        dense_results = await retrieval_service.dense_retrieval(request.query)
-        sparse_results = await retrieval_service.sparse_retrieval(request.query)
+        # 1-3. Language detection, dense/sparse retrieval and knowledge graph
+        # traversal are independent, so run them concurrently
+        branches: Dict[str, Tuple[Awaitable[Any], Any]] = {
+            "language_detection": (retrieval_service.detect_language(request.query), "N/A"),
+            "dense_retrieval": (retrieval_service.dense_retrieval(request.query), []),
+            "sparse_retrieval": (retrieval_service.sparse_retrieval(request.query), []),
+            "kg_traversal": (kg_service.traverse_graph(request.query), "N/A"),
+        }
+        outcomes = await asyncio.gather(
+            *(coro for coro, _ in branches.values()), return_exceptions=True
+        )
         
-        # 3. Knowledge graph traversal
-        kg_result = await kg_service.traverse_graph(request.query)
+        # A failed branch degrades to its fallback value and is reported as a warning
+        # (details stay in the server log); a cancelled branch cancels the request
+        warnings: List[str] = []
+        results: List[Any] = []
+        for (name, (_, fallback)), outcome in zip(branches.items(), outcomes):
+            if isinstance(outcome, asyncio.CancelledError):
+                raise outcome
+            if isinstance(outcome, BaseException):
+                logger.warning("Query branch %s failed: %s", name, outcome, exc_info=outcome)
+                warnings.append(f"{name} unavailable")
+                outcome = fallback
+            results.append(outcome)
+        detected_language, dense_results, sparse_results, kg_result = results
         
         # 4. LLM controller processing with selected model and thinking mode
-        model = request.model or "deepseek-r1:7b"
-        thinking_mode = request.thinking_mode or "smart"
         answer = await llm_controller.process_query(request.query, model, thinking_mode)
         
         # 6. Extract citations (placeholder)
-        citations = []
+        citations: List[Citation] = []
         
         # 7. Risk assessment (placeholder)
         risk_assessment = "Coming soon"
@@ -94,7 +200,8 @@ async def query_policies(request: QueryRequest) -> QueryResponse:
                 sparse=sparse_results
             ),
             kg_traversal=kg_result,
-            controller_iterations=1  # Single iteration for now
+            controller_iterations=1,  # Single iteration for now
+            warnings=warnings
         )
         
         response = QueryResponse(
@@ -105,12 +212,13 @@ async def query_policies(request: QueryRequest) -> QueryResponse:
         )
         
         logger.info("Query processed successfully")
-        return response
+        # Encode the Struct directly; there is no untrusted data to validate
+        return Response(content=msgspec.json.encode(response), media_type="application/json")
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error processing query: {e}", exc_info=True)
+        logger.error("Error processing query: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail={
@@ -119,6 +227,34 @@ async def query_policies(request: QueryRequest) -> QueryResponse:
             }
         )
 
+@router.post("/query/stream")
+async def stream_query_policies(
+    request: QueryRequest,
+    model: str = Query("deepseek-r1:7b", description="AI model to use for response generation"),
+    thinking_mode: str = Query("smart", description="Thinking mode: smart, general, deep, reasoning"),
+    llm_controller: LLMController = Depends(get_llm_controller),
+) -> StreamingResponse:
+    """
+    Stream the answer to a query as the model generates it.
+    
+    Streams newline-delimited JSON: {"delta": text} lines as fragments arrive,
+    then {"done": true}, or {"error": message} if generation fails mid-stream
+    (the status code has already been sent by then).
+    """
+    logger.info("Streaming query: %.100s...", request.query)
+    
+    async def stream_answer() -> AsyncIterator[bytes]:
+        try:
+            async for fragment in llm_controller.stream_query(request.query, model, thinking_mode):
+                yield orjson.dumps({"delta": fragment}) + b"\n"
+        except Exception as e:
+            logger.error("Error streaming query: %s", e, exc_info=True)
+            yield orjson.dumps({"error": str(e)}) + b"\n"
+            return
+        yield b'{"done":true}\n'
+    
+    return StreamingResponse(stream_answer(), media_type="application/x-ndjson")
+
 @router.get("/document/{document_id}", response_model=DocumentResponse)
 async def get_document(document_id: str) -> DocumentResponse:
     """
@@ -127,7 +263,7 @@ async def get_document(document_id: str) -> DocumentResponse:
     Returns placeholder document data until document storage is implemented.
     """
     try:
-        logger.info(f"Retrieving document: {document_id}")
+        logger.info("Retrieving document: %s", document_id)
         
         # TODO: Implement actual document retrieval from database
         # For now, return 404-like structure with placeholder data
@@ -141,22 +277,24 @@ async def get_document(document_id: str) -> DocumentResponse:
             )
         
         # Placeholder document response
-        document = DocumentResponse(
+        now, _ = _cached_now()
+        document = _construct(
+            DocumentResponse,
             id=document_id,
             title="N/A",
             content="N/A",
             metadata={"source": "N/A", "type": "N/A"},
-            created_at=datetime.now(),
-            updated_at=datetime.now()
+            created_at=now,
+            updated_at=now
         )
         
-        logger.info(f"Document retrieved: {document_id}")
+        logger.info("Document retrieved: %s", document_id)
         return document
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error retrieving document: {e}", exc_info=True)
+        logger.error("Error retrieving document: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail={
@@ -165,8 +303,43 @@ async def get_document(document_id: str) -> DocumentResponse:
             }
         )
 
+# Pre-generated job IDs, refilled from a single os.urandom read
+_UUID_BATCH_SIZE = 64
+_uuid_pool: List[str] = []
+
+def _fast_uuid4() -> str:
+    """Return a random (version 4) UUID string without building uuid.UUID objects"""
+    if not _uuid_pool:
+        raw = bytearray(os.urandom(16 * _UUID_BATCH_SIZE))
+        for offset in range(0, len(raw), 16):
+            raw[offset + 6] = (raw[offset + 6] & 0x0F) | 0x40  # version 4
+            raw[offset + 8] = (raw[offset + 8] & 0x3F) | 0x80  # RFC 4122 variant
+            h = raw[offset:offset + 16].hex()
+            _uuid_pool.append(f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}")
+    return _uuid_pool.pop()
+
+# Strong references to in-flight background jobs so they are not garbage collected
+_background_tasks: Set[asyncio.Task] = set()
+
+async def _background_ingest(job_id: str, document: DocumentRequest) -> None:
+    """
+    Run the ingestion pipeline for a document outside the request cycle.
+    
+    TODO: Implement actual document ingestion pipeline
+    1. Validate document
+    2. Extract text and metadata
+    3. Generate embeddings
+    4. Index in Elasticsearch
+    5. Update Neo4j knowledge graph
+    6. Store in PostgreSQL
+    """
+    try:
+        logger.info("Ingestion job %s started. Processing pipeline not yet implemented.", job_id)
+    except Exception as e:
+        logger.error("Ingestion job %s failed: %s", job_id, e, exc_info=True)
+
 @router.post("/ingest", response_model=IngestResponse)
-async def ingest_document(request: Dict[str, Any]) -> IngestResponse:
+async def ingest_document(request: DocumentRequest) -> IngestResponse:
     """
     Ingest new document into the system for indexing and retrieval.
     
@@ -182,28 +355,25 @@ async def ingest_document(request: Dict[str, Any]) -> IngestResponse:
     try:
         logger.info("Starting document ingestion")
         
-        # TODO: Implement actual document ingestion pipeline
-        # 1. Validate document
-        # 2. Extract text and metadata
-        # 3. Generate embeddings
-        # 4. Index in Elasticsearch
-        # 5. Update Neo4j knowledge graph
-        # 6. Store in PostgreSQL
+        job_id = _fast_uuid4()
         
-        # Placeholder response
-        job_id = str(uuid.uuid4())
+        # Run the pipeline in the background so the response returns immediately
+        task = asyncio.create_task(_background_ingest(job_id, request))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
         
-        response = IngestResponse(
+        response = _construct(
+            IngestResponse,
             jobId=job_id,
             status="accepted",
             message="Document ingestion job created. Processing pipeline not yet implemented."
         )
         
-        logger.info(f"Document ingestion job created: {job_id}")
+        logger.info("Document ingestion job created: %s", job_id)
         return response
         
     except Exception as e:
-        logger.error(f"Error ingesting document: {e}", exc_info=True)
+        logger.error("Error ingesting document: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail={
@@ -226,7 +396,7 @@ async def submit_feedback(request: FeedbackRequest) -> FeedbackResponse:
     Returns success confirmation.
     """
     try:
-        logger.info(f"Received feedback: rating={request.rating}")
+        logger.info("Received feedback: rating=%d", request.rating)
         
         # TODO: Implement actual feedback storage
         # 1. Validate feedback data
@@ -234,7 +404,8 @@ async def submit_feedback(request: FeedbackRequest) -> FeedbackResponse:
         # 3. Update performance metrics
         # 4. Trigger model retraining if needed
         
-        response = FeedbackResponse(
+        response = _construct(
+            FeedbackResponse,
             status="success",
             message="Feedback received and stored. Analysis pipeline not yet implemented."
         )
@@ -243,7 +414,7 @@ async def submit_feedback(request: FeedbackRequest) -> FeedbackResponse:
         return response
         
     except Exception as e:
-        logger.error(f"Error storing feedback: {e}", exc_info=True)
+        logger.error("Error storing feedback: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail={
@@ -253,7 +424,7 @@ async def submit_feedback(request: FeedbackRequest) -> FeedbackResponse:
         )
 
 @router.get("/status")
-async def get_system_status() -> Dict[str, Any]:
+async def get_system_status() -> Response:
     """
     Get current system status and service health.
     
@@ -263,8 +434,17 @@ async def get_system_status() -> Dict[str, Any]:
     - Knowledge graph (Neo4j)
     - LLM service
     - Database connections
+    
+    The encoded payload is cached for STATUS_CACHE_TTL seconds so frequent
+    monitoring probes skip rebuilding and re-serializing it.
     """
+    global _status_cache
+    
     try:
+        now = time.monotonic()
+        if now - _status_cache[0] < STATUS_CACHE_TTL:
+            return Response(content=_status_cache[1], media_type="application/json")
+        
         logger.info("Checking system status")
         
         # TODO: Implement actual health checks for each service
@@ -279,14 +459,16 @@ async def get_system_status() -> Dict[str, Any]:
                 "llm_service": "not_connected",
                 "database": "not_connected"
             },
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _cached_now()[1],
             "note": "All services return placeholder data until integration is complete"
         }
         
-        return status
+        body = orjson.dumps(status)
+        _status_cache = (now, body)
+        return Response(content=body, media_type="application/json")
         
     except Exception as e:
-        logger.error(f"Error checking system status: {e}", exc_info=True)
+        logger.error("Error checking system status: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail={
@@ -297,8 +479,28 @@ async def get_system_status() -> Dict[str, Any]:
 
 # Web Scraping Endpoints
 
+# Backoff schedule (seconds) between scrape retries, plus up to _RETRY_JITTER extra
+_RETRY_DELAYS = (1.0, 2.0, 4.0, 8.0, 16.0)
+_RETRY_JITTER = 0.25
+
+def _is_retryable(error: Exception) -> bool:
+    """Whether a scrape failure may succeed on retry (client errors and bad URLs won't)"""
+    # Invalid URLs, including requests' InvalidURL/MissingSchema, are ValueErrors
+    if isinstance(error, ValueError):
+        return False
+    
+    # HTTP 4xx other than 429 (rate limiting) is permanent
+    status_code = getattr(getattr(error, 'response', None), 'status_code', None)
+    if status_code is not None and 400 <= status_code < 500 and status_code != 429:
+        return False
+    
+    return True
+
 @router.post("/scrape")
-async def scrape_url(request: Dict[str, Any]) -> Dict[str, Any]:
+async def scrape_url(
+    request: ScrapeRequest,
+    scraper_service: AdvancedWebScraper = Depends(get_scraper_service),
+) -> ORJSONResponse:
     """
     Scrape a single URL using advanced web scraping techniques.
     
@@ -315,66 +517,43 @@ async def scrape_url(request: Dict[str, Any]) -> Dict[str, Any]:
         max_retries: Maximum number of retry attempts (optional, defaults to 3)
     """
     try:
-        url = request.get('url')
-        method = request.get('method', 'auto')
-        max_retries = request.get('max_retries', 3)
-        
-        if not url:
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "error": "URL is required",
-                    "details": "Please provide a valid URL to scrape"
-                }
-            )
+        url = str(request.url)
+        method = request.method
+        max_retries = request.max_retries
         
-        logger.info(f"Scraping URL: {url} with method: {method}")
-        
-        # Perform scraping with retry logic
-        result = None
-        last_error = None
+        logger.info("Scraping URL: %s with method: %s", url, method)
         
+        # Perform scraping with retry logic; the scraper reports failures as status='error'
         for attempt in range(max_retries):
-            try:
-                result = await scraper_service.scrape_url(url, method)
+            result = await scraper_service.scrape_url(url, method)
+            if result.status != 'error':
+                break
+            logger.warning("Scraping attempt %d failed: %s", attempt + 1, result.error)
+            if result.error is not None and not _is_retryable(result.error):
                 break
-            except Exception as e:
-                last_error = e
-                logger.warning(f"Scraping attempt {attempt + 1} failed: {str(e)}")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
+            if attempt < max_retries - 1:
+                # Exponential backoff with jitter to avoid synchronized retries
+                delay = _RETRY_DELAYS[min(attempt, len(_RETRY_DELAYS) - 1)]
+                await asyncio.sleep(delay + random.random() * _RETRY_JITTER)
         
-        if result is None:
+        if result.status == 'error':
             raise HTTPException(
                 status_code=500,
                 detail={
                     "error": "Scraping failed after all retries",
-                    "details": str(last_error) if last_error else "Unknown error"
+                    "details": str(result.error) if result.error else "Unknown error"
                 }
             )
         
-        # Convert ScrapedContent to dict for JSON response
-        response_data = {
-            "url": result.url,
-            "title": result.title,
-            "content": result.content,
-            "images": result.images,
-            "links": result.links,
-            "pdfs": result.pdfs,
-            "metadata": result.metadata,
-            "timestamp": result.timestamp.isoformat(),
-            "status": result.status,
-            "method_used": result.method_used,
-            "processing_time": result.processing_time
-        }
+        response_data = result.to_dict()
         
-        logger.info(f"Successfully scraped {url} using {result.method_used}")
-        return response_data
+        logger.info("Successfully scraped %s using %s", url, result.method_used)
+        return ORJSONResponse(content=response_data)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in scrape_url endpoint: {e}", exc_info=True)
+        logger.error("Error in scrape_url endpoint: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail={
@@ -384,73 +563,49 @@ async def scrape_url(request: Dict[str, Any]) -> Dict[str, Any]:
         )
 
 @router.post("/scrape/batch")
-async def scrape_multiple_urls(request: Dict[str, Any]) -> Dict[str, Any]:
+async def scrape_multiple_urls(
+    request: BatchScrapeRequest,
+    scraper_service: AdvancedWebScraper = Depends(get_scraper_service),
+) -> StreamingResponse:
     """
     Scrape multiple URLs concurrently using advanced web scraping techniques.
     
+    Streams newline-delimited JSON: one line per scraped URL in completion
+    order, followed by a final summary line with total/successful/failed counts.
+    
     Args:
         urls: List of URLs to scrape
         method: Scraping method (optional, defaults to 'auto')
         max_concurrent: Maximum concurrent scraping operations (optional, defaults to 5)
     """
     try:
-        urls = request.get('urls', [])
-        method = request.get('method', 'auto')
-        max_concurrent = request.get('max_concurrent', 5)
-        
-        if not urls or not isinstance(urls, list):
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "error": "URLs list is required",
-                    "details": "Please provide a list of valid URLs to scrape"
-                }
-            )
-        
-        if len(urls) > 50:  # Limit batch size
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "error": "Too many URLs",
-                    "details": "Maximum 50 URLs allowed per batch request"
-                }
-            )
-        
-        logger.info(f"Scraping {len(urls)} URLs with max_concurrent={max_concurrent}")
-        
-        # Perform batch scraping
-        results = await scraper_service.scrape_multiple_urls(urls, max_concurrent)
-        
-        # Convert results to response format
-        response_data = {
-            "total_urls": len(urls),
-            "successful_scrapes": len(results),
-            "failed_scrapes": len(urls) - len(results),
-            "results": []
-        }
+        # Presence, URL format and the 50-URL batch limit are enforced by BatchScrapeRequest
+        urls = [str(url) for url in request.urls]
+        method = request.method
+        max_concurrent = request.max_concurrent
+        
+        logger.info("Scraping %d URLs with max_concurrent=%d", len(urls), max_concurrent)
+        
+        async def stream_results() -> AsyncIterator[bytes]:
+            # Emit each result as soon as its scrape finishes, then a summary line
+            successful = 0
+            async for result in scraper_service.iter_scrape(urls, max_concurrent, method):
+                successful += 1
+                yield orjson.dumps(result.to_dict(preview=True)) + b"\n"
+            
+            logger.info("Batch scraping completed: %d/%d successful", successful, len(urls))
+            yield orjson.dumps({
+                "total_urls": len(urls),
+                "successful_scrapes": successful,
+                "failed_scrapes": len(urls) - successful
+            }) + b"\n"
         
-        for result in results:
-            response_data["results"].append({
-                "url": result.url,
-                "title": result.title,
-                "content": result.content[:1000] + "..." if len(result.content) > 1000 else result.content,
-                "images": result.images,
-                "links": result.links,
-                "pdfs": result.pdfs,
-                "metadata": result.metadata,
-                "timestamp": result.timestamp.isoformat(),
-                "status": result.status,
-                "method_used": result.method_used,
-                "processing_time": result.processing_time
-            })
-        
-        logger.info(f"Batch scraping completed: {len(results)}/{len(urls)} successful")
-        return response_data
+        return StreamingResponse(stream_results(), media_type="application/x-ndjson")
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in scrape_multiple_urls endpoint: {e}", exc_info=True)
+        logger.error("Error in scrape_multiple_urls endpoint: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail={
@@ -460,7 +615,9 @@ async def scrape_multiple_urls(request: Dict[str, Any]) -> Dict[str, Any]:
         )
 
 @router.get("/scrape/health")
-async def get_scraper_health() -> Dict[str, Any]:
+async def get_scraper_health(
+    scraper_service: AdvancedWebScraper = Depends(get_scraper_service),
+) -> Dict[str, Any]:
     """
     Get web scraper service health and dependency status.
     
@@ -479,7 +636,7 @@ async def get_scraper_health() -> Dict[str, Any]:
         return health_status
         
     except Exception as e:
-        logger.error(f"Error checking scraper health: {e}", exc_info=True)
+        logger.error("Error checking scraper health: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail={
@@ -489,7 +646,10 @@ async def get_scraper_health() -> Dict[str, Any]:
         )
 
 @router.post("/scrape/government")
-async def scrape_government_sites(request: Dict[str, Any]) -> Dict[str, Any]:
+async def scrape_government_sites(
+    request: GovernmentScrapeRequest,
+    scraper_service: AdvancedWebScraper = Depends(get_scraper_service),
+) -> ORJSONResponse:
     """
     Specialized endpoint for scraping government education websites.
     
@@ -507,21 +667,12 @@ async def scrape_government_sites(request: Dict[str, Any]) -> Dict[str, Any]:
         extract_acts: Whether to extract act/section references (optional, defaults to True)
     """
     try:
-        site_type = request.get('site_type')
-        url = request.get('url')
-        extract_pdfs = request.get('extract_pdfs', True)
-        extract_acts = request.get('extract_acts', True)
+        site_type = request.site_type
+        url = str(request.url)
+        extract_pdfs = request.extract_pdfs
+        extract_acts = request.extract_acts
         
-        if not url:
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "error": "URL is required",
-                    "details": "Please provide a valid government website URL"
-                }
-            )
-        
-        logger.info(f"Scraping government site: {site_type} - {url}")
+        logger.info("Scraping government site: %s - %s", site_type, url)
         
         # Use selenium for government sites as they often have dynamic content
         method = 'selenium' if scraper_service._determine_scraping_method(url) == 'selenium' else 'auto'
@@ -530,36 +681,16 @@ async def scrape_government_sites(request: Dict[str, Any]) -> Dict[str, Any]:
         
         # Additional government-specific processing
         if extract_acts and result.status == 'success':
-            # Extract legal references from content
-            legal_patterns = [
-                r'Act No\.?\s*\d+',
-                r'Section\s+\d+',
-                r'Rule\s+\d+',
-                r'Regulation\s+\d+',
-                r'Notification\s+No\.?\s*\d+',
-                r'Circular\s+No\.?\s*\d+'
-            ]
-            
-            legal_references = []
-            for pattern in legal_patterns:
-                matches = re.findall(pattern, result.content, re.IGNORECASE)
-                legal_references.extend(matches)
-            
-            result.metadata['legal_references'] = list(set(legal_references))
+            # Extract legal references from content; large pages are scanned off the event loop
+            if len(result.content) > _LEGAL_SCAN_THREAD_THRESHOLD:
+                legal_references = await asyncio.to_thread(_extract_legal_references, result.content)
+            else:
+                legal_references = _extract_legal_references(result.content)
+            result.metadata['legal_references'] = legal_references
         
         # Convert to response format
         response_data = {
-            "url": result.url,
-            "title": result.title,
-            "content": result.content,
-            "images": result.images,
-            "links": result.links,
-            "pdfs": result.pdfs,
-            "metadata": result.metadata,
-            "timestamp": result.timestamp.isoformat(),
-            "status": result.status,
-            "method_used": result.method_used,
-            "processing_time": result.processing_time,
+            **result.to_dict(),
             "government_specific": {
                 "site_type": site_type,
                 "legal_references": result.metadata.get('legal_references', []),
@@ -568,13 +699,13 @@ async def scrape_government_sites(request: Dict[str, Any]) -> Dict[str, Any]:
             }
         }
         
-        logger.info(f"Successfully scraped government site: {url}")
-        return response_data
+        logger.info("Successfully scraped government site: %s", url)
+        return ORJSONResponse(content=response_data)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in scrape_government_sites endpoint: {e}", exc_info=True)
+        logger.error("Error in scrape_government_sites endpoint: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail={
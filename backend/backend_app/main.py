@@ -5,11 +5,15 @@ This module sets up the FastAPI app with CORS, middleware, and route configurati
 All endpoints return placeholder data until vector DB, KG, and LLM services are integrated.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
 import logging
 import os
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -19,13 +23,38 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+from backend_app.api.dependencies import (
+    get_llm_controller, get_retrieval_service, init_services, shutdown_services, startup_services
+)
+from backend_app.services.controller import LLMController
+from backend_app.services.retrieval import RetrievalService
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Create shared services once at startup and release them on shutdown"""
+    init_services(app)
+    await startup_services(app)
+    yield
+    await shutdown_services(app)
+
+# Interactive docs and the OpenAPI schema are only served outside production
+PRODUCTION = os.getenv("ENVIRONMENT", "development") == "production"
+
+def _route_operation_id(route: APIRoute) -> str:
+    """Use the endpoint function name as the OpenAPI operation ID"""
+    return route.name
+
 # Create FastAPI app
 app = FastAPI(
     title="GITAM Education Policy AI",
     description="High-accuracy AI system for querying education policies",
     version="0.1.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
+    docs_url=None if PRODUCTION else "/docs",
+    redoc_url=None if PRODUCTION else "/redoc",
+    openapi_url=None if PRODUCTION else "/openapi.json",
+    generate_unique_id_function=_route_operation_id,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -37,8 +66,9 @@ app.add_middleware(
         # TODO: Add production frontend URLs
     ],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type", "authorization"],
+    max_age=86400,  # Let browsers cache preflight responses for 24h
 )
 
 # Import API routes
@@ -59,22 +89,31 @@ async def root():
         "note": "This is a prototype. All endpoints return placeholder data."
     }
 
+# Last successful /health payload as (monotonic time, response)
+HEALTH_CACHE_TTL = 5.0
+_health_cache: Tuple[float, Optional[Dict[str, Any]]] = (float("-inf"), None)
+
 @app.get("/health")
-async def health_check():
+async def health_check(
+    retrieval_service: RetrievalService = Depends(get_retrieval_service),
+    llm_controller: LLMController = Depends(get_llm_controller),
+):
     """Health check endpoint for monitoring"""
-    from backend_app.services.pinecone_service import PineconeService
-    from backend_app.services.ollama_service import OllamaService
+    global _health_cache
+    
+    # Serve a recent healthy result so probes don't hit Pinecone/Ollama every time
+    now = time.monotonic()
+    if _health_cache[1] is not None and now - _health_cache[0] < HEALTH_CACHE_TTL:
+        return _health_cache[1]
     
     try:
-        # Check Pinecone health
-        pinecone_service = PineconeService()
-        pinecone_health = await pinecone_service.health_check()
+        # Check Pinecone health via the shared retrieval service's client
+        pinecone_health = await retrieval_service.vector_service.health_check()
         
-        # Check Ollama health
-        ollama_service = OllamaService()
-        ollama_health = await ollama_service.health_check()
+        # Check Ollama health via the shared controller's client
+        ollama_health = await llm_controller.ollama_service.health_check()
         
-        return {
+        health = {
             "status": "healthy",
             "services": {
                 "api": "running",
@@ -88,8 +127,10 @@ async def health_check():
                 "ollama": ollama_health
             }
         }
+        _health_cache = (now, health)
+        return health
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
+        logger.error("Health check failed: %s", e)
         return {
             "status": "degraded",
             "services": {
@@ -105,8 +146,8 @@ async def health_check():
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler for unhandled errors"""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
@@ -116,10 +157,20 @@ async def global_exception_handler(request, exc):
 
 if __name__ == "__main__":
     import uvicorn
+    
+    # Auto-reload only in development; it cannot be combined with multiple workers
+    reload = os.getenv("ENVIRONMENT", "development") == "development"
+    workers = 1 if reload else int(os.getenv("WEB_CONCURRENCY") or os.cpu_count() or 1)
+    # Workers inherit this and size their embedding thread pools to their share of the cores
+    os.environ["WEB_CONCURRENCY"] = str(workers)
     uvicorn.run(
         "backend_app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        loop="uvloop",
+        http="httptools",
+        reload=reload,
+        workers=workers,
+        access_log=os.getenv("UVICORN_ACCESS_LOG", "0") == "1",
         log_level="info"
     )
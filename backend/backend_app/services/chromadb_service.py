@@ -5,47 +5,497 @@ This service handles document storage, embedding generation, and vector similari
 using ChromaDB as the vector database backend.
 """
 
+import hashlib
 import logging
 import os
+import time
 import uuid
-from typing import List, Dict, Any, Optional, Tuple
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 import asyncio
+import orjson
 from datetime import datetime
 import chromadb
+from chromadb.api import AsyncClientAPI
+from chromadb.api.models.AsyncCollection import AsyncCollection
 from chromadb.config import Settings
 from sentence_transformers import SentenceTransformer
 import numpy as np
 
+# Optional in-process vector index for unfiltered searches
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+# Optional JIT-compiled scoring kernel for the NumPy index path
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Semantic query cache: max entries and the cosine similarity counted as a hit
+QUERY_CACHE_SIZE = 1024
+QUERY_CACHE_SIMILARITY = 0.97
+
+# (query text, top_k, serialized filter) -> (normalized query embedding, results)
+QueryCacheKey = Tuple[str, int, bytes]
+
+# Seconds between real encoder runs in health_check
+ENCODER_PROBE_INTERVAL = 300.0
+
+# Seconds a collection.count() result is reused by stats and health checks
+COUNT_CACHE_TTL = 5.0
+
+# Batch ingestion: documents per encode call and max encode calls in flight
+EMBED_CHUNK_SIZE = 1000
+EMBED_CONCURRENCY = 10
+
+# Max embeddings remembered by content hash to skip re-encoding repeated text
+EMBEDDING_CACHE_SIZE = 10000
+
+# Micro-batching of single-text encodes: max texts per forward pass and max wait (seconds)
+ENCODE_BATCH_SIZE = 32
+ENCODE_BATCH_WAIT = 0.005
+
+# Pending single-text encode: (text, future receiving its embedding)
+EncodeRequest = Tuple[str, "asyncio.Future[np.ndarray]"]
+
+T = TypeVar("T")
+
+async def _run_sync(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking encoder call in a worker thread"""
+    return await asyncio.to_thread(func, *args, **kwargs)
+
+def _content_key(text: str) -> bytes:
+    """Hash text into an embedding cache key"""
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+# Columns scored per parallel block by the Numba kernel
+_SCORE_BLOCK_SIZE = 4096
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _score_top_k(vectors: np.ndarray, size: int, query: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score the first size columns of a dimension-major matrix against a query.
+        
+        Blocks of columns are scored in parallel, each keeping its own sorted top k,
+        so no n-sized score array is ever selected over.
+        
+        Args:
+            vectors: (dimensions x capacity) float32 matrix of unit vectors
+            size: Number of filled columns
+            query: Unit query vector
+            k: Number of results wanted
+            
+        Returns:
+            (scores, positions) candidates, k per block; unused slots hold -inf / -1
+        """
+        n_blocks = (size + _SCORE_BLOCK_SIZE - 1) // _SCORE_BLOCK_SIZE
+        best_scores = np.full((n_blocks, k), -np.inf, dtype=np.float32)
+        best_positions = np.full((n_blocks, k), -1, dtype=np.int64)
+        
+        for block in prange(n_blocks):
+            start = block * _SCORE_BLOCK_SIZE
+            end = min(start + _SCORE_BLOCK_SIZE, size)
+            scores = np.zeros(end - start, dtype=np.float32)
+            for d in range(vectors.shape[0]):
+                weight = query[d]
+                for j in range(end - start):
+                    scores[j] += weight * vectors[d, start + j]
+            
+            # Insertion into this block's descending top k
+            for j in range(end - start):
+                score = scores[j]
+                if score > best_scores[block, k - 1]:
+                    i = k - 1
+                    while i > 0 and best_scores[block, i - 1] < score:
+                        best_scores[block, i] = best_scores[block, i - 1]
+                        best_positions[block, i] = best_positions[block, i - 1]
+                        i -= 1
+                    best_scores[block, i] = score
+                    best_positions[block, i] = start + j
+        
+        return best_scores.ravel(), best_positions.ravel()
+
+class _LocalVectorIndex:
+    """
+    In-process mirror of the collection used for unfiltered searches.
+    
+    Uses a FAISS flat index when faiss is installed. Otherwise vectors are kept in a
+    dimension-major (dimensions x n) NumPy matrix, so scoring a query against every
+    stored vector is a single BLAS matrix-vector product.
+    """
+    
+    def __init__(self, dimensions: int):
+        self.dimensions = dimensions
+        # Inner product over L2-normalized vectors is cosine similarity
+        self.index = faiss.IndexFlatIP(dimensions) if FAISS_AVAILABLE else None
+        # Column buffer for the NumPy path, filled up to len(self.ids)
+        self.vectors = np.empty((dimensions, 0), dtype=np.float32)
+        self.ids: List[str] = []
+        self.documents: List[str] = []
+        self.metadatas: List[Dict[str, Any]] = []
+    
+    @staticmethod
+    def _normalize(embeddings: np.ndarray) -> np.ndarray:
+        """Return embeddings as a 2-D float32 array of unit rows"""
+        vectors = np.array(embeddings, dtype=np.float32, ndmin=2)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        normalized: np.ndarray = vectors / norms
+        return normalized
+    
+    def add(self,
+            ids: List[str],
+            documents: List[str],
+            metadatas: List[Dict[str, Any]],
+            embeddings: np.ndarray) -> None:
+        """Append documents and their embeddings (one row per document)"""
+        vectors = self._normalize(embeddings)
+        if self.index is not None:
+            self.index.add(vectors)
+        else:
+            size = len(self.ids)
+            needed = size + len(vectors)
+            if needed > self.vectors.shape[1]:
+                # Grow geometrically so repeated single-document adds stay amortized O(1)
+                grown = np.empty((self.dimensions, max(needed, 2 * self.vectors.shape[1], 1024)),
+                                 dtype=np.float32)
+                grown[:, :size] = self.vectors[:, :size]
+                self.vectors = grown
+            self.vectors[:, size:needed] = vectors.T
+        
+        self.ids.extend(ids)
+        self.documents.extend(documents)
+        self.metadatas.extend(metadatas)
+    
+    def _top_k(self, query: np.ndarray, top_k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (similarities, positions) of the best matches, best first"""
+        if self.index is not None:
+            similarities, positions = self.index.search(query[np.newaxis, :], top_k)
+            return similarities[0], positions[0]
+        
+        if NUMBA_AVAILABLE:
+            scores, positions = _score_top_k(self.vectors, len(self.ids), query, top_k)
+            best = np.argsort(-scores)[:top_k]
+            return scores[best], positions[best]
+        
+        scores = query @ self.vectors[:, :len(self.ids)]
+        # O(n) selection of the top_k, then sort only those
+        positions = np.argpartition(-scores, top_k - 1)[:top_k]
+        positions = positions[np.argsort(-scores[positions])]
+        return scores[positions], positions
+    
+    def search(self, query_embedding: np.ndarray, top_k: int) -> List[Dict[str, Any]]:
+        """
+        Find the top_k most similar documents.
+        
+        Args:
+            query_embedding: Query embedding
+            top_k: Number of results to return
+            
+        Returns:
+            Documents in the same format as ChromaDBService.search_similar
+        """
+        if not self.ids:
+            return []
+        
+        query = self._normalize(query_embedding)[0]
+        similarities, positions = self._top_k(query, min(top_k, len(self.ids)))
+        
+        # 2 * cos - 1 equals 1 - d for ChromaDB's default squared-L2 distance on unit vectors
+        return [
+            {
+                'id': self.ids[position],
+                'content': self.documents[position],
+                'metadata': self.metadatas[position],
+                'score': 2 * float(similarity) - 1
+            }
+            for similarity, position in zip(similarities, positions)
+            if position >= 0
+        ]
+
 class ChromaDBService:
     """Service for ChromaDB vector database operations"""
     
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize ChromaDB service with configuration"""
         self.chroma_host = os.getenv("CHROMA_HOST", "localhost")
         self.chroma_port = int(os.getenv("CHROMA_PORT", "8001"))
         self.embedding_model_name = os.getenv("EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
         self.collection_name = os.getenv("CHROMA_COLLECTION", "gitam_policy_documents")
+        self.max_seq_length = int(os.getenv("EMBEDDING_MAX_SEQ_LENGTH", "256"))
+        # "torch" (default) or "onnx" for an int8-quantized ONNX Runtime encoder
+        self.embedding_backend = os.getenv("EMBEDDING_BACKEND", "torch")
+        self.onnx_model_file = os.getenv("EMBEDDING_ONNX_FILE", "onnx/model_qint8_avx512_vnni.onnx")
+        # Local model directory (pre-populated in the Docker image) and whether to skip the Hub
+        self.model_cache_dir = os.getenv("HF_CACHE") or None
+        self.model_local_files_only = os.getenv("EMBEDDING_LOCAL_FILES_ONLY", "0") == "1"
+        # Opt-in: serve unfiltered searches from an in-process mirror (FAISS if installed,
+        # else NumPy). It holds the whole collection in memory and picks up writes from
+        # other processes only when the document count changes (checked every COUNT_CACHE_TTL)
+        self.use_local_index = os.getenv("CHROMA_LOCAL_INDEX", "0") == "1"
         
-        # Initialize ChromaDB client
-        self.client = chromadb.HttpClient(
-            host=self.chroma_host,
-            port=self.chroma_port,
-            settings=Settings(allow_reset=True)
-        )
+        # Async ChromaDB client and collection, connected on first use
+        self.client: Optional[AsyncClientAPI] = None
+        self.collection: Optional[AsyncCollection] = None
+        self._connect_lock = asyncio.Lock()
         
         # Initialize embedding model
-        self.embedding_model = SentenceTransformer(self.embedding_model_name)
+        self.embedding_model = self._load_embedding_model()
+        # Cap sequence length so padding stays bounded for long policy documents
+        self.embedding_model.max_seq_length = self.max_seq_length
+        self._embedding_dim = self.embedding_model.get_sentence_embedding_dimension()
+        self._last_encoder_probe = float("-inf")
         
-        # Get or create collection
-        self.collection = self.client.get_or_create_collection(
-            name=self.collection_name,
-            metadata={"description": "GITAM Education Policy Documents"}
-        )
+        # LRU cache of recent search results, cleared whenever the collection changes
+        self._query_cache: "OrderedDict[QueryCacheKey, Tuple[np.ndarray, List[Dict[str, Any]]]]" = OrderedDict()
+        # (document count, monotonic time it was read)
+        self._count_cache: Tuple[int, float] = (0, float("-inf"))
+        # Built from the collection on first use; dropped when documents change in place
+        self._local_index: Optional[_LocalVectorIndex] = None
+        # LRU cache of content hash -> embedding; text embeddings never go stale
+        self._embedding_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        # Micro-batching queue and worker, started on first encode in the running loop
+        self._encode_queue: Optional["asyncio.Queue[EncodeRequest]"] = None
+        self._encode_worker: Optional[asyncio.Task] = None
         
         logger.info(f"ChromaDB service initialized with collection: {self.collection_name}")
     
+    async def _get_collection(self) -> AsyncCollection:
+        """Connect to ChromaDB and get or create the collection on first use"""
+        if self.collection is None:
+            async with self._connect_lock:
+                if self.collection is None:
+                    self.client = await chromadb.AsyncHttpClient(
+                        host=self.chroma_host,
+                        port=self.chroma_port,
+                        settings=Settings(allow_reset=True)
+                    )
+                    self.collection = await self.client.get_or_create_collection(
+                        name=self.collection_name,
+                        metadata={"description": "GITAM Education Policy Documents"}
+                    )
+                    logger.info(f"Connected to ChromaDB collection: {self.collection_name}")
+        return self.collection
+    
+    def _load_embedding_model(self) -> SentenceTransformer:
+        """
+        Load the sentence embedding model for the configured backend.
+        
+        With EMBEDDING_BACKEND=onnx the model runs on ONNX Runtime using a dynamically
+        int8-quantized export; pooling and normalization still come from the model's
+        SentenceTransformer config, so embeddings stay compatible. Falls back to the
+        PyTorch model if the ONNX backend or quantized file is unavailable.
+        
+        Returns:
+            Loaded SentenceTransformer
+        """
+        load_kwargs = {
+            "cache_folder": self.model_cache_dir,
+            "local_files_only": self.model_local_files_only,
+        }
+        
+        if self.embedding_backend == "onnx":
+            try:
+                model = SentenceTransformer(
+                    self.embedding_model_name,
+                    backend="onnx",
+                    model_kwargs={"file_name": self.onnx_model_file},
+                    **load_kwargs
+                )
+                logger.info(f"Loaded ONNX embedding model: {self.onnx_model_file}")
+                return model
+            except Exception as e:
+                logger.warning(f"ONNX embedding backend unavailable, using PyTorch: {e}")
+        
+        return SentenceTransformer(self.embedding_model_name, **load_kwargs)
+    
+    async def _cached_count(self, ttl: float = COUNT_CACHE_TTL) -> int:
+        """Return the collection's document count, re-reading it after ttl seconds"""
+        cached, fetched_at = self._count_cache
+        now = time.monotonic()
+        if now - fetched_at < ttl:
+            return cached
+        
+        collection = await self._get_collection()
+        count: int = await collection.count()
+        self._count_cache = (count, now)
+        return count
+    
+    def _invalidate_caches(self) -> None:
+        """Drop cached search results and counts after the collection changes"""
+        self._query_cache.clear()
+        self._count_cache = (0, float("-inf"))
+    
+    async def _get_local_index(self) -> Optional[_LocalVectorIndex]:
+        """Return the in-process index, (re)loading it from the collection if needed"""
+        if not self.use_local_index:
+            return None
+        
+        # Rebuild when another process has added or deleted documents
+        if self._local_index is not None and await self._cached_count() != len(self._local_index.ids):
+            logger.info("Collection changed outside this process; rebuilding local vector index")
+            self._local_index = None
+        
+        if self._local_index is None:
+            collection = await self._get_collection()
+            results = await collection.get(include=["embeddings", "documents", "metadatas"])
+            index = _LocalVectorIndex(self._embedding_dim)
+            if len(results['ids']):
+                index.add(results['ids'], results['documents'], results['metadatas'],
+                          np.asarray(results['embeddings']))
+            self._local_index = index
+            logger.info(f"Local vector index built with {len(index.ids)} documents")
+        
+        return self._local_index
+    
+    def _remember_embedding(self, key: bytes, embedding: np.ndarray) -> None:
+        """Cache an embedding, evicting the least recently used entry when full"""
+        self._embedding_cache[key] = embedding
+        self._embedding_cache.move_to_end(key)
+        if len(self._embedding_cache) > EMBEDDING_CACHE_SIZE:
+            self._embedding_cache.popitem(last=False)
+    
+    async def _embed(self, text: str) -> np.ndarray:
+        """Encode a single text via the micro-batching worker (float32 array, passed to ChromaDB as-is)"""
+        key = _content_key(text)
+        embedding = self._embedding_cache.get(key)
+        if embedding is not None:
+            self._embedding_cache.move_to_end(key)
+            return embedding
+        
+        loop = asyncio.get_running_loop()
+        queue = self._encode_queue
+        if (queue is None or self._encode_worker is None or self._encode_worker.done()
+                or self._encode_worker.get_loop() is not loop):
+            queue = self._encode_queue = asyncio.Queue()
+            self._encode_worker = loop.create_task(self._encode_batches(queue))
+        
+        future: "asyncio.Future[np.ndarray]" = loop.create_future()
+        queue.put_nowait((text, future))
+        embedding = await future
+        self._remember_embedding(key, embedding)
+        return embedding
+    
+    async def _encode_batches(self, queue: "asyncio.Queue[EncodeRequest]") -> None:
+        """
+        Encode queued single texts together.
+        
+        Collects requests arriving within ENCODE_BATCH_WAIT of the first one (up to
+        ENCODE_BATCH_SIZE) and runs them through the encoder in one forward pass, so
+        concurrent searches share a batch instead of each paying for its own.
+        
+        Args:
+            queue: Queue of (text, future) requests
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + ENCODE_BATCH_WAIT
+            while len(batch) < ENCODE_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            texts = [text for text, _ in batch]
+            try:
+                embeddings = await _run_sync(
+                    self.embedding_model.encode,
+                    texts,
+                    batch_size=len(texts),
+                    convert_to_numpy=True
+                )
+            except Exception as e:
+                logger.error(f"Error encoding batch of {len(texts)} texts: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for (_, future), embedding in zip(batch, embeddings):
+                if not future.done():
+                    future.set_result(embedding)
+    
+    async def _embed_chunk(self, contents: List[str], semaphore: asyncio.Semaphore) -> np.ndarray:
+        """
+        Encode a chunk of texts in one batched forward pass.
+        
+        Args:
+            contents: Texts to encode
+            semaphore: Bounds how many chunks are encoded at once
+            
+        Returns:
+            2-D array of embeddings, one row per text
+        """
+        async with semaphore:
+            return await _run_sync(
+                self.embedding_model.encode,
+                contents,
+                batch_size=1024,
+                convert_to_numpy=True,
+                normalize_embeddings=False,
+                show_progress_bar=False
+            )
+    
+    def _cached_search(self,
+                       key: QueryCacheKey,
+                       query_embedding: Optional[np.ndarray] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up cached search results for a query.
+        
+        Without an embedding only an exact text match is tried; with one, any cached
+        query using the same top_k and filter whose embedding is within
+        QUERY_CACHE_SIMILARITY (cosine) is also a hit.
+        
+        Args:
+            key: Cache key for the query
+            query_embedding: Optional L2-normalized query embedding
+            
+        Returns:
+            Cached results or None on a miss
+        """
+        entry = self._query_cache.get(key)
+        if entry is not None:
+            self._query_cache.move_to_end(key)
+            return list(entry[1])
+        
+        if query_embedding is None:
+            return None
+        
+        candidates = [k for k in self._query_cache if k[1:] == key[1:]]
+        if not candidates:
+            return None
+        
+        cached_matrix = np.stack([self._query_cache[k][0] for k in candidates])
+        similarities = cached_matrix @ query_embedding
+        best = int(np.argmax(similarities))
+        if similarities[best] < QUERY_CACHE_SIMILARITY:
+            return None
+        
+        self._query_cache.move_to_end(candidates[best])
+        return list(self._query_cache[candidates[best]][1])
+    
+    def _cache_search(self,
+                      key: QueryCacheKey,
+                      query_embedding: np.ndarray,
+                      results: List[Dict[str, Any]]) -> None:
+        """Store search results, evicting the least recently used entry when full"""
+        self._query_cache[key] = (query_embedding, results)
+        self._query_cache.move_to_end(key)
+        if len(self._query_cache) > QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+    
     async def add_document(self, 
                           content: str, 
                           metadata: Dict[str, Any], 
@@ -68,16 +518,20 @@ class ChromaDBService:
             logger.info(f"Adding document to ChromaDB: {doc_id}")
             
             # Generate embedding for the content
-            embedding = self.embedding_model.encode(content).tolist()
+            embedding = await self._embed(content)
             
             # Add document to collection
-            self.collection.add(
+            collection = await self._get_collection()
+            await collection.add(
                 ids=[doc_id],
                 documents=[content],
                 embeddings=[embedding],
                 metadatas=[metadata]
             )
             
+            if self._local_index is not None:
+                self._local_index.add([doc_id], [content], [metadata], embedding)
+            self._invalidate_caches()
             logger.info(f"Document added successfully: {doc_id}")
             return doc_id
             
@@ -103,27 +557,29 @@ class ChromaDBService:
         try:
             logger.info(f"Searching for similar documents: {query[:50]}...")
             
-            # Generate query embedding
-            query_embedding = self.embedding_model.encode(query).tolist()
+            cache_key = (query, top_k, orjson.dumps(filter_metadata, option=orjson.OPT_SORT_KEYS))
+            cached = self._cached_search(cache_key)
+            if cached is not None:
+                return cached
             
-            # Search collection
-            results = self.collection.query(
-                query_embeddings=[query_embedding],
-                n_results=top_k,
-                where=filter_metadata
-            )
+            # Generate query embedding
+            query_embedding = await self._embed(query)
+            normalized = query_embedding / (np.linalg.norm(query_embedding) or 1.0)
+            
+            # Reuse results of a near-duplicate query
+            cached = self._cached_search(cache_key, normalized)
+            if cached is not None:
+                logger.info("Semantic query cache hit")
+                return cached
+            
+            # Metadata filters need ChromaDB; plain similarity can use the local index
+            local_index = await self._get_local_index() if filter_metadata is None else None
+            if local_index is not None:
+                similar_docs = local_index.search(query_embedding, top_k)
+            else:
+                similar_docs = await self._query_collection(query_embedding, top_k, filter_metadata)
             
-            # Format results
-            similar_docs = []
-            if results['ids'] and results['ids'][0]:
-                for i, doc_id in enumerate(results['ids'][0]):
-                    doc_data = {
-                        'id': doc_id,
-                        'content': results['documents'][0][i],
-                        'metadata': results['metadatas'][0][i],
-                        'score': 1 - results['distances'][0][i] if results['distances'] else 0.0
-                    }
-                    similar_docs.append(doc_data)
+            self._cache_search(cache_key, normalized, similar_docs)
             
             logger.info(f"Found {len(similar_docs)} similar documents")
             return similar_docs
@@ -132,6 +588,31 @@ class ChromaDBService:
             logger.error(f"Error searching ChromaDB: {e}")
             raise
     
+    async def _query_collection(self,
+                                query_embedding: np.ndarray,
+                                top_k: int,
+                                filter_metadata: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run a similarity query against the ChromaDB collection"""
+        collection = await self._get_collection()
+        results = await collection.query(
+            query_embeddings=[query_embedding],
+            n_results=top_k,
+            where=filter_metadata
+        )
+        
+        if not (results['ids'] and results['ids'][0]):
+            return []
+        
+        ids = results['ids'][0]
+        # Without distances every score is 0.0
+        distances = results['distances'][0] if results['distances'] else [1.0] * len(ids)
+        return [
+            {'id': doc_id, 'content': content, 'metadata': metadata, 'score': 1 - distance}
+            for doc_id, content, metadata, distance in zip(
+                ids, results['documents'][0], results['metadatas'][0], distances
+            )
+        ]
+    
     async def get_document(self, doc_id: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve a specific document by ID.
@@ -145,7 +626,8 @@ class ChromaDBService:
         try:
             logger.info(f"Retrieving document: {doc_id}")
             
-            results = self.collection.get(ids=[doc_id])
+            collection = await self._get_collection()
+            results = await collection.get(ids=[doc_id])
             
             if results['ids']:
                 doc_data = {
@@ -176,35 +658,31 @@ class ChromaDBService:
             metadata: New metadata (optional)
             
         Returns:
-            True if updated successfully
+            True once the update is issued (ChromaDB ignores unknown IDs)
         """
         try:
             logger.info(f"Updating document: {doc_id}")
             
-            # Get existing document
-            existing = await self.get_document(doc_id)
-            if not existing:
-                return False
+            if content is None and metadata is None:
+                return True
             
-            # Prepare update data
-            new_content = content if content is not None else existing['content']
-            new_metadata = metadata if metadata is not None else existing['metadata']
+            collection = await self._get_collection()
             
-            # Generate new embedding if content changed
-            if content is not None:
-                embedding = self.embedding_model.encode(new_content).tolist()
-                self.collection.update(
-                    ids=[doc_id],
-                    documents=[new_content],
-                    embeddings=[embedding],
-                    metadatas=[new_metadata]
-                )
+            if content is None:
+                # Metadata-only update: no read, no re-embedding
+                await collection.update(ids=[doc_id], metadatas=[metadata])
             else:
-                self.collection.update(
+                # ChromaDB keeps the stored metadata when metadatas is omitted
+                embedding = await self._embed(content)
+                await collection.update(
                     ids=[doc_id],
-                    metadatas=[new_metadata]
+                    documents=[content],
+                    embeddings=[embedding],
+                    metadatas=[metadata] if metadata is not None else None
                 )
             
+            self._local_index = None
+            self._invalidate_caches()
             logger.info(f"Document updated successfully: {doc_id}")
             return True
             
@@ -225,8 +703,11 @@ class ChromaDBService:
         try:
             logger.info(f"Deleting document: {doc_id}")
             
-            self.collection.delete(ids=[doc_id])
+            collection = await self._get_collection()
+            await collection.delete(ids=[doc_id])
             
+            self._local_index = None
+            self._invalidate_caches()
             logger.info(f"Document deleted successfully: {doc_id}")
             return True
             
@@ -242,13 +723,13 @@ class ChromaDBService:
             Collection statistics
         """
         try:
-            count = self.collection.count()
+            count = await self._cached_count()
             
             stats = {
                 'total_documents': count,
                 'collection_name': self.collection_name,
                 'embedding_model': self.embedding_model_name,
-                'embedding_dimensions': self.embedding_model.get_sentence_embedding_dimension(),
+                'embedding_dimensions': self._embedding_dim,
                 'last_updated': datetime.now().isoformat()
             }
             
@@ -268,10 +749,16 @@ class ChromaDBService:
         """
         try:
             # Test connection
-            collections = self.client.list_collections()
+            await self._get_collection()
+            assert self.client is not None  # connected by _get_collection
+            collections = await self.client.list_collections()
             
-            # Test embedding generation
-            test_embedding = self.embedding_model.encode("test query").tolist()
+            # Test embedding generation (at most once per ENCODER_PROBE_INTERVAL); bypasses
+            # the embedding cache so the encoder itself runs
+            now = time.monotonic()
+            if now - self._last_encoder_probe >= ENCODER_PROBE_INTERVAL:
+                await _run_sync(self.embedding_model.encode, ["test query"], convert_to_numpy=True)
+                self._last_encoder_probe = now
             
             health_status = {
                 'chromadb': {
@@ -283,11 +770,11 @@ class ChromaDBService:
                 'embedding_model': {
                     'status': 'loaded',
                     'model': self.embedding_model_name,
-                    'dimensions': len(test_embedding)
+                    'dimensions': self._embedding_dim
                 },
                 'collection': {
                     'name': self.collection_name,
-                    'document_count': self.collection.count()
+                    'document_count': await self._cached_count()
                 }
             }
             
@@ -321,26 +808,57 @@ class ChromaDBService:
         try:
             logger.info(f"Batch adding {len(documents)} documents")
             
-            doc_ids = []
-            contents = []
-            embeddings = []
-            metadatas = []
+            doc_ids = [str(uuid.uuid4()) for _ in documents]
+            contents = [doc['content'] for doc in documents]
+            metadatas = [doc['metadata'] for doc in documents]
+            
+            # Only encode contents not seen before (in the cache or earlier in this batch).
+            # Hits are copied out now: concurrent batches may evict them while we encode.
+            keys = [_content_key(content) for content in contents]
+            cached: Dict[bytes, np.ndarray] = {}
+            missing: Dict[bytes, str] = {}
+            for key, content in zip(keys, contents):
+                if key in cached or key in missing:
+                    continue
+                hit = self._embedding_cache.get(key)
+                if hit is not None:
+                    cached[key] = hit
+                else:
+                    missing[key] = content
+            
+            # Encode chunks concurrently in worker threads
+            to_encode = list(missing.values())
+            semaphore = asyncio.Semaphore(EMBED_CONCURRENCY)
+            chunks = await asyncio.gather(*[
+                self._embed_chunk(to_encode[start:start + EMBED_CHUNK_SIZE], semaphore)
+                for start in range(0, len(to_encode), EMBED_CHUNK_SIZE)
+            ])
+            encoded = dict(zip(missing, np.concatenate(chunks))) if chunks else {}
+            
+            if keys:
+                embeddings = np.stack([
+                    encoded[key] if key in encoded else cached[key]
+                    for key in keys
+                ])
+            else:
+                embeddings = np.empty((0, self._embedding_dim), dtype=np.float32)
+            for key, embedding in encoded.items():
+                self._remember_embedding(key, embedding)
             
-            for doc in documents:
-                doc_id = str(uuid.uuid4())
-                doc_ids.append(doc_id)
-                contents.append(doc['content'])
-                embeddings.append(self.embedding_model.encode(doc['content']).tolist())
-                metadatas.append(doc['metadata'])
+            logger.info(f"Encoded {len(to_encode)} new contents for {len(contents)} documents")
             
             # Add all documents at once
-            self.collection.add(
+            collection = await self._get_collection()
+            await collection.add(
                 ids=doc_ids,
                 documents=contents,
                 embeddings=embeddings,
                 metadatas=metadatas
             )
             
+            if self._local_index is not None:
+                self._local_index.add(doc_ids, contents, metadatas, embeddings)
+            self._invalidate_caches()
             logger.info(f"Batch added {len(doc_ids)} documents successfully")
             return doc_ids
             
@@ -0,0 +1,120 @@
+"""
+Document Content Store for GITAM Education Policy AI
+
+Full document bodies are kept here, keyed by document ID, so the vector index
+only carries lightweight metadata. Backed by a local SQLite file (stdlib only);
+all methods are blocking and are meant to be called via asyncio.to_thread.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# SQLite caps bound parameters per statement; stay well below the limit
+MAX_IDS_PER_QUERY = 500
+
+BUMP_VERSION_SQL = "UPDATE store_version SET version = version + 1"
+
+# backend/data/document_content.db, so the API server and ingest scripts share one file
+# whatever directory they are started from
+DEFAULT_PATH = Path(__file__).resolve().parents[2] / "data" / "document_content.db"
+
+
+class DocumentContentStore:
+    """Key-value store mapping document IDs to their full content"""
+
+    def __init__(self, path: str = ""):
+        """
+        Open (or create) the content store.
+
+        Args:
+            path: SQLite database file; defaults to CONTENT_STORE_PATH, else DEFAULT_PATH
+        """
+        self.path = path or os.getenv("CONTENT_STORE_PATH") or str(DEFAULT_PATH)
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        # One connection shared by worker threads, serialized by the lock
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS document_content (id TEXT PRIMARY KEY, content TEXT NOT NULL)"
+            )
+            # Single-row write counter, bumped in the same transaction as every change
+            self._conn.execute("CREATE TABLE IF NOT EXISTS store_version (version INTEGER NOT NULL)")
+            self._conn.execute(
+                "INSERT INTO store_version (version) SELECT 0 WHERE NOT EXISTS (SELECT 1 FROM store_version)"
+            )
+        logger.info(f"Document content store opened at {self.path}")
+
+    def enable_bulk_load(self) -> None:
+        """
+        Trade durability for write speed during a one-shot bulk load: skip fsync
+        and keep temporary data in memory. A crash or power loss mid-load can
+        corrupt the file, which must then be deleted and the load rerun. WAL
+        and normal locking stay on, so a running API server can keep reading.
+        """
+        with self._lock:
+            self._conn.execute("PRAGMA synchronous=OFF")
+            self._conn.execute("PRAGMA temp_store=MEMORY")
+        logger.warning(f"Bulk-load mode enabled for content store {self.path}; rerun the load after a crash")
+
+    def put_many(self, items: Iterable[Tuple[str, str]]) -> None:
+        """
+        Insert or replace document contents.
+
+        Args:
+            items: (doc_id, content) pairs
+        """
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO document_content (id, content) VALUES (?, ?)", items
+            )
+            self._conn.execute(BUMP_VERSION_SQL)
+
+    def get_many(self, doc_ids: List[str]) -> Dict[str, str]:
+        """
+        Fetch contents for several documents at once.
+
+        Args:
+            doc_ids: Document IDs to look up
+
+        Returns:
+            Mapping of doc_id to content for the IDs that were found
+        """
+        found: Dict[str, str] = {}
+        with self._lock:
+            for start in range(0, len(doc_ids), MAX_IDS_PER_QUERY):
+                chunk = doc_ids[start:start + MAX_IDS_PER_QUERY]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT id, content FROM document_content WHERE id IN ({placeholders})", chunk
+                )
+                found.update(rows)
+        return found
+
+    def items(self) -> List[Tuple[str, str]]:
+        """Return every stored (doc_id, content) pair."""
+        with self._lock:
+            return self._conn.execute("SELECT id, content FROM document_content").fetchall()
+
+    def version(self) -> int:
+        """Write counter for the stored corpus; changes after any write from any process."""
+        with self._lock:
+            return int(self._conn.execute("SELECT version FROM store_version").fetchone()[0])
+
+    def delete(self, doc_id: str) -> None:
+        """Remove a document's content (no-op if it is not stored)."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM document_content WHERE id = ?", (doc_id,))
+            self._conn.execute(BUMP_VERSION_SQL)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
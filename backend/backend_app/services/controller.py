@@ -8,7 +8,7 @@ Now integrated with OllamaService for actual LLM functionality.
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional
 import asyncio
 import os
 from datetime import datetime
@@ -27,6 +27,10 @@ class LLMController:
         
         logger.info("LLMController initialized with Ollama service integration")
     
+    async def close(self) -> None:
+        """Release the LLM service's pooled HTTP connections"""
+        await self.ollama_service.close()
+    
     async def process_query(self, query: str, model: str = "deepseek-r1:7b", thinking_mode: str = "smart", context: Optional[Dict[str, Any]] = None) -> str:
         """
         Process user query through LLM controller with iterative refinement.
@@ -61,6 +65,28 @@ class LLMController:
             logger.error(f"Error in LLM controller: {e}")
             return f"I apologize, but I encountered an error while processing your query: {str(e)}"
     
+    async def stream_query(self, query: str, model: str = "deepseek-r1:7b", thinking_mode: str = "smart") -> AsyncIterator[str]:
+        """
+        Stream the answer to a user query as the model generates it.
+        
+        Args:
+            query: User query
+            model: Model to use for generation
+            thinking_mode: Thinking mode (smart, general, deep, reasoning)
+            
+        Yields:
+            Text fragments of the answer; errors propagate to the caller
+        """
+        logger.info(f"Streaming query through LLM controller: {query[:50]}... with thinking mode: {thinking_mode}")
+        
+        async for fragment in self.ollama_service.generate_response_stream(
+            query=query,
+            model=model,
+            temperature=self.temperature,
+            max_tokens=1000
+        ):
+            yield fragment
+    
     async def generate_initial_response(self, query: str, context: Dict[str, Any]) -> str:
         """
         Generate initial response using LLM with retrieved context.
@@ -4,7 +4,8 @@ Knowledge Graph Service for GITAM Education Policy AI
 This service handles knowledge graph operations including entity extraction,
 relationship mapping, and graph traversal for policy queries.
 
-Currently returns placeholder data until Neo4j integration is complete.
+Graph queries run against Neo4j when the neo4j driver is installed and NEO4J_URL
+is set; otherwise writes are no-ops and traversals use an in-memory adjacency.
 
 TODO: Integration Points:
 1. Neo4j graph database for entity and relationship storage
@@ -12,37 +13,360 @@ TODO: Integration Points:
 3. Custom entity extraction for education policy concepts
 4. Graph traversal algorithms for complex queries
 5. Relationship inference and knowledge completion
+
+NER model choice (English spaCy pipelines, NER F1 on OntoNotes):
+    en_core_web_sm   CNN, ~0.85 F1, fastest on CPU    -> default, request-time extraction
+    en_core_web_lg   CNN + vectors, ~0.85 F1, larger    -> prefer_accuracy, offline batch jobs
+    en_core_web_trf  transformer, ~0.90 F1, >10x slower  -> not used on the API path
+Set KG_NER_MODEL / KG_NER_ACCURATE_MODEL to override either choice.
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Iterable, Optional, Set, Tuple
 import asyncio
 import os
+import time
+import uuid
 from datetime import datetime
 
+# spaCy is optional; without it (or its model) entity extraction returns no entities
+try:
+    import spacy
+    SPACY_AVAILABLE = True
+except ImportError:
+    SPACY_AVAILABLE = False
+
+# Neo4j driver is optional; without it the service works on its in-memory adjacency
+try:
+    from neo4j import AsyncDriver, AsyncGraphDatabase
+    NEO4J_AVAILABLE = True
+except ImportError:
+    NEO4J_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Connections kept by the Neo4j driver's pool
+NEO4J_POOL_SIZE = 50
+# Rows per UNWIND write transaction in batch imports
+NEO4J_WRITE_BATCH_SIZE = 500
+# Type stored for entities given without one (Neo4j cannot MERGE on a null property)
+UNKNOWN_ENTITY_TYPE = "Unknown"
+# Seconds the health check waits for the Neo4j server to answer
+NEO4J_HEALTH_TIMEOUT = 5.0
+# Deepest subgraph traversal with a precompiled Cypher template
+MAX_SUBGRAPH_DEPTH = 5
+
+# Pipeline components not needed for NER (ner in the CNN pipelines has its own tok2vec)
+SPACY_DISABLED_COMPONENTS = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer"]
+
+@lru_cache(maxsize=None)
+def _load_spacy_model(name: str) -> Any:
+    """Load a spaCy pipeline once per process and share it across service instances"""
+    return spacy.load(name, disable=SPACY_DISABLED_COMPONENTS)
+
+def _multi_source_bfs(adjacency: Dict[str, List[str]], sources: List[str], depth: int) -> Dict[str, Set[str]]:
+    """
+    Find the nodes within depth hops of each source in one level-synchronous BFS.
+    
+    All sources share a single frontier and visited map; each node carries a bitmask
+    of the sources that have reached it, so every level scans the adjacency lists once
+    instead of once per source.
+    
+    Args:
+        adjacency: Node -> neighbor nodes
+        sources: Start nodes
+        depth: Maximum number of hops
+        
+    Returns:
+        Source -> set of reached nodes (including the source itself)
+    """
+    bits = {source: 1 << i for i, source in enumerate(dict.fromkeys(sources))}
+    all_sources = (1 << len(bits)) - 1
+    visited: Dict[str, int] = dict(bits)
+    # Frontiers are plain lists of (node, sources that just reached it)
+    frontier: List[Tuple[str, int]] = list(bits.items())
+    # Every node, including leaves that only appear as neighbors
+    total_nodes = len(set(adjacency).union(*adjacency.values(), bits))
+    saturated = sum(1 for mask in visited.values() if mask == all_sources)
+    
+    for _ in range(depth):
+        next_frontier: List[Tuple[str, int]] = []
+        for node, mask in frontier:
+            for neighbor in adjacency.get(node, ()):
+                seen = visited.get(neighbor, 0)
+                new_sources = mask & ~seen
+                if new_sources:
+                    visited[neighbor] = seen | new_sources
+                    next_frontier.append((neighbor, new_sources))
+                    if seen | new_sources == all_sources:
+                        saturated += 1
+        # Stop early once every node has been reached from every source
+        if not next_frontier or saturated == total_nodes:
+            break
+        frontier = next_frontier
+    
+    reached: Dict[str, Set[str]] = {source: set() for source in bits}
+    for node, mask in visited.items():
+        for source, bit in bits.items():
+            if mask & bit:
+                reached[source].add(node)
+    return reached
+
+# Direction-optimizing BFS switches to bottom-up once frontier edges exceed 1/ALPHA
+# of the edges still unexplored (Beamer et al.)
+DO_BFS_ALPHA = 14
+
+def _do_bfs(adjacency: Dict[str, List[str]], 
+            reverse_adjacency: Dict[str, List[str]], 
+            start: str, 
+            depth: int) -> Set[str]:
+    """
+    Find the nodes within depth hops of start using direction-optimizing BFS.
+    
+    Small frontiers are expanded top-down (push along out-edges). When the frontier
+    touches a large share of the remaining edges, as around hub entities, each
+    unvisited node instead checks its in-edges for a frontier parent (pull), which
+    stops at the first hit rather than scanning every hub edge.
+    
+    Args:
+        adjacency: Node -> out-neighbors
+        reverse_adjacency: Node -> in-neighbors (the transpose of adjacency)
+        start: Start node
+        depth: Maximum number of hops
+        
+    Returns:
+        Set of reached nodes (including start)
+    """
+    visited = {start}
+    frontier = [start]
+    # Out-edges of nodes not yet visited, kept up to date as nodes are visited
+    unexplored_edges = sum(len(neighbors) for neighbors in adjacency.values()) - len(adjacency.get(start, ()))
+    
+    for _ in range(depth):
+        frontier_edges = sum(len(adjacency.get(node, ())) for node in frontier)
+        next_frontier: List[str] = []
+        
+        if frontier_edges < unexplored_edges / DO_BFS_ALPHA:
+            # Top-down: push from the frontier
+            for node in frontier:
+                for neighbor in adjacency.get(node, ()):
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        next_frontier.append(neighbor)
+        else:
+            # Bottom-up: unvisited nodes pull from any parent in the frontier
+            frontier_set = set(frontier)
+            for node, parents in reverse_adjacency.items():
+                if node in visited:
+                    continue
+                for parent in parents:
+                    if parent in frontier_set:
+                        next_frontier.append(node)
+                        break
+            visited.update(next_frontier)
+        
+        if not next_frontier:
+            break
+        unexplored_edges -= sum(len(adjacency.get(node, ())) for node in next_frontier)
+        frontier = next_frontier
+    
+    return visited
+
 class KnowledgeGraphService:
     """Service for knowledge graph operations and entity management"""
     
-    def __init__(self):
-        """Initialize knowledge graph service with placeholder configuration"""
+    # Cypher is kept constant and parameterized so Neo4j can reuse cached query plans.
+    # Variable-length bounds cannot be parameters, so subgraphs use one fixed query per depth.
+    _RELATIONSHIPS_CYPHER = (
+        "MATCH path = (a:Entity {name: $entity1})-[r*1..3]-(b:Entity {name: $entity2}) "
+        "RETURN path, length(path) AS path_length "
+        "ORDER BY path_length "
+        "LIMIT 10"
+    )
+    # MERGE alone does not stop two concurrent writers from both creating a node; the
+    # uniqueness constraint below makes the second MERGE match the first one's node
+    _ENTITY_KEY_CONSTRAINT_CYPHER = (
+        "CREATE CONSTRAINT entity_key IF NOT EXISTS "
+        "FOR (e:Entity) REQUIRE (e.name_key, e.type) IS UNIQUE"
+    )
+    _MERGE_ENTITIES_CYPHER = (
+        "UNWIND $rows AS row "
+        "MERGE (e:Entity {name_key: row.name_key, type: row.type}) "
+        "ON CREATE SET e.id = row.id, e.name = row.name, e.created_at = datetime(), e += row.properties "
+        "RETURN row.id AS row_id, e.id AS id"
+    )
+    _ENTITY_KEYS_CYPHER = (
+        "MATCH (e:Entity) "
+        "RETURN coalesce(e.name_key, toLower(e.name)) AS name_key, "
+        "coalesce(e.type, $unknown_type) AS type, e.id AS id"
+    )
+    _CREATE_RELATIONSHIPS_CYPHER = (
+        "UNWIND $rows AS row "
+        "MATCH (a:Entity {id: row.from}), (b:Entity {id: row.to}) "
+        "CREATE (a)-[r:RELATED_TO {type: row.type, created_at: datetime()}]->(b) "
+        "SET r += row.properties "
+        "RETURN count(r) AS created"
+    )
+    _SUBGRAPHS_CYPHER = {
+        depth: (
+            "UNWIND $ids AS id "
+            "MATCH (center:Entity {id: id}) "
+            f"OPTIONAL MATCH (center)-[*1..{depth}]-(connected:Entity) "
+            "RETURN id, collect(DISTINCT connected.id) AS nodes"
+        )
+        for depth in range(1, MAX_SUBGRAPH_DEPTH + 1)
+    }
+    
+    def __init__(self, prefer_accuracy: bool = False):
+        """
+        Initialize knowledge graph service with placeholder configuration.
+        
+        Args:
+            prefer_accuracy: Use the larger NER model (for offline batch jobs, not request time)
+        """
+        # Neo4j is used only when explicitly configured, never against a guessed local default
+        self.neo4j_configured = bool(os.getenv("NEO4J_URL"))
         self.neo4j_url = os.getenv("NEO4J_URL", "bolt://localhost:7687")
         self.neo4j_user = os.getenv("NEO4J_USER", "neo4j")
         self.neo4j_password = os.getenv("NEO4J_PASSWORD", "password")
         
-        # TODO: Initialize actual Neo4j driver
-        # self.driver = GraphDatabase.driver(
-        #     self.neo4j_url,
-        #     auth=(self.neo4j_user, self.neo4j_password)
-        # )
-        
-        # TODO: Initialize NLP models for entity extraction
-        # self.nlp_model = spacy.load("en_core_web_sm")
-        # self.custom_ner_model = self.load_custom_ner_model()
+        # One async driver (and connection pool) for the service's lifetime; it connects lazily
+        self.driver = None
+        if NEO4J_AVAILABLE and self.neo4j_configured:
+            self.driver = AsyncGraphDatabase.driver(
+                self.neo4j_url,
+                auth=(self.neo4j_user, self.neo4j_password),
+                max_connection_pool_size=NEO4J_POOL_SIZE
+            )
+        
+        # Small CNN model keeps request-time extraction fast
+        if prefer_accuracy:
+            self._ner_model_name = os.getenv("KG_NER_ACCURATE_MODEL", "en_core_web_lg")
+        else:
+            self._ner_model_name = os.getenv("KG_NER_MODEL", "en_core_web_sm")
+        
+        # Texts per spaCy batch when extracting entities from many texts
+        self.spacy_batch_size = int(os.getenv("KG_SPACY_BATCH_SIZE", "64"))
+        # Worker processes for bulk (offline) extraction; leave one core for the parent
+        self.spacy_bulk_processes = int(os.getenv("KG_SPACY_PROCESSES", str(max(1, (os.cpu_count() or 2) - 1))))
+        
+        # Client-side adjacency (entity id -> neighbor ids) for traversals
+        # TODO: Populate from Neo4j once the driver is integrated
+        self._adjacency: Dict[str, List[str]] = {}
+        
+        # Known entities, (lower-cased name, type) -> entity id, for deduplicating adds
+        # without a lookup per entity; loaded from Neo4j on first write and reloaded
+        # after KG_ENTITY_CACHE_TTL seconds so entities deleted elsewhere drop out
+        self.entity_cache_ttl = float(os.getenv("KG_ENTITY_CACHE_TTL", "300"))
+        self._entity_ids: Dict[Tuple[str, str], str] = {}
+        self._entity_ids_loaded_at = float("-inf")
+        self._entity_ids_lock = asyncio.Lock()
+        # The entity key constraint is created once, before the first write
+        self._schema_ready = False
+        self._schema_lock = asyncio.Lock()
+        
+        # Initialize NLP models for entity extraction
+        self._nlp = self._load_nlp_model()
+        # TODO: self.custom_ner_model = self.load_custom_ner_model()
         
         logger.info("KnowledgeGraphService initialized with placeholder configuration")
     
+    async def close(self) -> None:
+        """Close the Neo4j driver and its connection pool"""
+        if self.driver is not None:
+            await self.driver.close()
+    
+    def _require_driver(self) -> "AsyncDriver":
+        """The Neo4j driver; graph queries are only issued after checking self.driver"""
+        if self.driver is None:
+            raise RuntimeError("Neo4j is not configured (set NEO4J_URL)")
+        return self.driver
+    
+    @staticmethod
+    async def _collect(tx: Any, cypher: str, params: Dict[str, Any]) -> List[Any]:
+        """Transaction function: run a query and fetch all of its records"""
+        result = await tx.run(cypher, params)
+        return [record async for record in result]
+    
+    async def _read_cypher(self, cypher: str, **params: Any) -> List[Any]:
+        """Run a read query in a managed (retried) read transaction"""
+        async with self._require_driver().session() as session:
+            return await session.execute_read(self._collect, cypher, params)
+    
+    async def _ensure_schema(self) -> None:
+        """Create the entity key uniqueness constraint on first use"""
+        if self._schema_ready:
+            return
+        async with self._schema_lock:
+            # Another writer may have created it while this one waited for the lock
+            if not self._schema_ready:
+                # Schema commands run in an auto-commit transaction of their own
+                async with self._require_driver().session() as session:
+                    result = await session.run(self._ENTITY_KEY_CONSTRAINT_CYPHER)
+                    await result.consume()
+                self._schema_ready = True
+                logger.info("Ensured Neo4j entity key constraint")
+    
+    async def _write_rows(self, cypher: str, rows: List[Dict[str, Any]]) -> List[Any]:
+        """Run an UNWIND write query over rows in batches; returns the records of all batches"""
+        await self._ensure_schema()
+        records: List[Any] = []
+        async with self._require_driver().session() as session:
+            for start in range(0, len(rows), NEO4J_WRITE_BATCH_SIZE):
+                batch = rows[start:start + NEO4J_WRITE_BATCH_SIZE]
+                records.extend(await session.execute_write(self._collect, cypher, {"rows": batch}))
+        return records
+    
+    def _entity_ids_fresh(self) -> bool:
+        return time.monotonic() - self._entity_ids_loaded_at < self.entity_cache_ttl
+    
+    async def _load_entity_ids(self) -> None:
+        """(Re)load the (name, type) keys of existing entities in a single query once the map is stale"""
+        if self._entity_ids_fresh():
+            return
+        async with self._entity_ids_lock:
+            if self._entity_ids_fresh():
+                return
+            records = await self._read_cypher(self._ENTITY_KEYS_CYPHER, unknown_type=UNKNOWN_ENTITY_TYPE)
+            # Replaced wholesale, so entities deleted by other writers stop resolving
+            self._entity_ids = {(record["name_key"], record["type"]): record["id"] for record in records}
+            self._entity_ids_loaded_at = time.monotonic()
+            logger.info(f"Loaded {len(self._entity_ids)} known entities for deduplication")
+    
+    def _load_nlp_model(self) -> Optional[Any]:
+        """Load the spaCy NER pipeline, or return None if spaCy or the model is missing"""
+        if not SPACY_AVAILABLE:
+            logger.warning("spaCy not installed; entity extraction disabled")
+            return None
+        
+        try:
+            return _load_spacy_model(self._ner_model_name)
+        except OSError as e:
+            logger.warning(f"spaCy model could not be loaded; entity extraction disabled: {e}")
+            return None
+    
+    def _extract_entities_sync(self, 
+                               texts: Iterable[str], 
+                               batch_size: int, 
+                               n_process: int = 1) -> List[List[Dict[str, Any]]]:
+        """Run the spaCy pipeline over texts in batches (blocking)"""
+        nlp = self._nlp
+        if nlp is None:
+            return [[] for _ in texts]
+        return [
+            [
+                {
+                    "text": ent.text,
+                    "label": ent.label_,
+                    "start": ent.start_char,
+                    "end": ent.end_char
+                }
+                for ent in doc.ents
+            ]
+            for doc in nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+        ]
+    
     async def traverse_graph(self, query: str) -> str:
         """
         Traverse knowledge graph to find relevant entities and relationships.
@@ -56,15 +380,13 @@ class KnowledgeGraphService:
         """
         logger.info(f"Traversing knowledge graph for query: {query[:50]}...")
         
-        # Placeholder implementation
-        await asyncio.sleep(0.3)  # Simulate processing time
+        # spaCy runs in a worker thread so NER does not block the event loop
+        entities = await self.extract_entities(query)
         
-        # TODO: Actual implementation would be:
-        # 1. entities = self.extract_entities(query)
-        # 2. cypher_query = self.build_traversal_query(entities)
-        # 3. with self.driver.session() as session:
-        # 4.     results = session.run(cypher_query)
-        # 5. return self.format_traversal_results(results)
+        # TODO: Remaining implementation would be:
+        # 1. cypher_query = self.build_traversal_query(entities)
+        # 2. results = await self._read_cypher(cypher_query, entities=entities)
+        # 3. return self.format_traversal_results(results)
         
         traversal_result = "N/A"  # Placeholder: no graph traversal
         
@@ -75,62 +397,89 @@ class KnowledgeGraphService:
         """
         Extract named entities from text using NLP models.
         
-        TODO: Implement entity extraction:
-        1. Use spaCy for general NER (PERSON, ORG, LOC, etc.)
-        2. Apply custom NER for education policy concepts
-        3. Extract policy-specific entities (courses, departments, rules)
-        4. Normalize and link entities to knowledge graph
+        TODO: Extend entity extraction:
+        1. Apply custom NER for education policy concepts
+        2. Extract policy-specific entities (courses, departments, rules)
+        3. Normalize and link entities to knowledge graph
         """
         logger.info(f"Extracting entities from text: {text[:50]}...")
         
-        # Placeholder implementation
-        await asyncio.sleep(0.1)  # Simulate processing time
-        
-        # TODO: Actual implementation would be:
-        # 1. doc = self.nlp_model(text)
-        # 2. entities = []
-        # 3. for ent in doc.ents:
-        # 4.     entities.append({
-        #         "text": ent.text,
-        #         "label": ent.label_,
-        #         "start": ent.start_char,
-        #         "end": ent.end_char,
-        #         "confidence": ent._.confidence
-        #     })
-        # 5. return entities
-        
-        entities = []  # Placeholder: no entities extracted
+        entities = (await self.extract_entities_batch([text]))[0]
         
         logger.info(f"Extracted {len(entities)} entities")
         return entities
     
+    async def extract_entities_batch(self, 
+                                     texts: List[str], 
+                                     batch_size: Optional[int] = None) -> List[List[Dict[str, Any]]]:
+        """
+        Extract named entities from many texts in one spaCy pass.
+        
+        Uses nlp.pipe so tokenization and model calls are batched instead of
+        running the pipeline once per text.
+        
+        Args:
+            texts: Texts to process
+            batch_size: Texts per spaCy batch (defaults to KG_SPACY_BATCH_SIZE)
+            
+        Returns:
+            One list of entities (text, label, start, end) per input text
+        """
+        if self._nlp is None or not texts:
+            return [[] for _ in texts]
+        
+        return await asyncio.to_thread(
+            self._extract_entities_sync, texts, batch_size or self.spacy_batch_size
+        )
+    
+    def extract_entities_bulk(self, 
+                              texts: Iterable[str], 
+                              n_process: Optional[int] = None,
+                              batch_size: int = 128) -> List[List[Dict[str, Any]]]:
+        """
+        Extract named entities from a large corpus using several processes.
+        
+        Meant for offline ingest jobs, not request handling: it blocks, and
+        starting worker processes costs seconds, which only pays off over
+        thousands of documents. Scripts calling it with n_process > 1 need an
+        ``if __name__ == "__main__"`` guard on platforms that spawn processes.
+        
+        Args:
+            texts: Texts to process (may be a generator)
+            n_process: Worker processes (defaults to KG_SPACY_PROCESSES, CPU count - 1)
+            batch_size: Texts sent to a worker at a time
+            
+        Returns:
+            One list of entities (text, label, start, end) per input text
+        """
+        if self._nlp is None:
+            return [[] for _ in texts]
+        
+        return self._extract_entities_sync(texts, batch_size, n_process or self.spacy_bulk_processes)
+    
     async def find_relationships(self, entity1: str, entity2: str) -> List[Dict[str, Any]]:
         """
         Find relationships between two entities in the knowledge graph.
         
-        TODO: Implement relationship discovery:
-        1. Query Neo4j for paths between entities
-        2. Apply relationship scoring algorithms
-        3. Return relationship types and confidence scores
-        4. Handle indirect relationships through intermediate nodes
+        Returns up to 10 paths of 1-3 hops, shortest first.
+        
+        TODO: Extend relationship discovery:
+        1. Apply relationship scoring algorithms
+        2. Return confidence scores alongside relationship types
         """
         logger.info(f"Finding relationships between {entity1} and {entity2}")
         
-        # Placeholder implementation
-        await asyncio.sleep(0.1)  # Simulate processing time
-        
-        # TODO: Actual implementation would be:
-        # 1. cypher_query = """
-        # MATCH path = (a:Entity {name: $entity1})-[r*1..3]-(b:Entity {name: $entity2})
-        # RETURN path, length(path) as path_length
-        # ORDER BY path_length
-        # LIMIT 10
-        # """
-        # 2. with self.driver.session() as session:
-        # 3.     results = session.run(cypher_query, entity1=entity1, entity2=entity2)
-        # 4. return [self.format_relationship(record) for record in results]
-        
-        relationships = []  # Placeholder: no relationships found
+        relationships = []  # No graph database: no relationships found
+        if self.driver is not None:
+            records = await self._read_cypher(self._RELATIONSHIPS_CYPHER, entity1=entity1, entity2=entity2)
+            relationships = [
+                {
+                    "nodes": [node.get("name") for node in record["path"].nodes],
+                    "relationships": [rel.get("type") for rel in record["path"].relationships],
+                    "path_length": record["path_length"]
+                }
+                for record in records
+            ]
         
         logger.info(f"Found {len(relationships)} relationships")
         return relationships
@@ -139,75 +488,122 @@ class KnowledgeGraphService:
         """
         Add new entity to the knowledge graph.
         
-        TODO: Implement entity creation:
+        Args:
+            entity_data: Entity fields: name, type and optional properties
+            
+        Returns:
+            ID of the entity, existing one if already present ("N/A" without a graph database)
+        
+        TODO: Extend entity creation:
         1. Validate entity data and properties
-        2. Check for existing entities (deduplication)
-        3. Create entity node in Neo4j
-        4. Establish relationships with existing entities
-        5. Update entity indices and search capabilities
+        2. Establish relationships with existing entities
+        3. Update entity indices and search capabilities
         """
         logger.info(f"Adding entity: {entity_data.get('name', 'unknown')}")
         
-        # Placeholder implementation
-        await asyncio.sleep(0.1)  # Simulate processing time
-        
-        # TODO: Actual implementation would be:
-        # 1. entity_id = str(uuid.uuid4())
-        # 2. cypher_query = """
-        # CREATE (e:Entity {
-        #     id: $id,
-        #     name: $name,
-        #     type: $type,
-        #     properties: $properties,
-        #     created_at: datetime()
-        # })
-        # RETURN e.id
-        # """
-        # 3. with self.driver.session() as session:
-        # 4.     result = session.run(cypher_query, **entity_data)
-        # 5. return result.single()["e.id"]
-        
-        entity_id = "N/A"  # Placeholder: entity not created
+        entity_id = (await self.add_entities_batch([entity_data]))[0]
         
         logger.info(f"Entity added with ID: {entity_id}")
         return entity_id
     
+    async def add_entities_batch(self, entities: List[Dict[str, Any]]) -> List[str]:
+        """
+        Add many entities with one UNWIND write per NEO4J_WRITE_BATCH_SIZE rows.
+        
+        Entities already in the graph (same lower-cased name and type) are
+        resolved from an in-memory map and not written again. Entities without
+        a type are stored with type UNKNOWN_ENTITY_TYPE.
+        
+        Args:
+            entities: Entity dicts with name, type and optional properties
+            
+        Returns:
+            Entity IDs in input order, existing IDs for duplicates
+            ("N/A" without a graph database)
+        """
+        if self.driver is None:
+            return ["N/A" for _ in entities]
+        
+        await self._load_entity_ids()
+        
+        keys = [
+            ((entity.get("name") or "").lower(), entity.get("type") or UNKNOWN_ENTITY_TYPE)
+            for entity in entities
+        ]
+        # Resolved locally: a concurrent reload may replace self._entity_ids during the write
+        ids: Dict[Tuple[str, str], str] = {}
+        rows: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for key, entity in zip(keys, entities):
+            if key in self._entity_ids:
+                ids[key] = self._entity_ids[key]
+            elif key not in rows:
+                rows[key] = {
+                    "id": str(uuid.uuid4()),
+                    "name": entity.get("name"),
+                    "name_key": key[0],
+                    "type": key[1],
+                    "properties": entity.get("properties") or {}
+                }
+        
+        if rows:
+            records = await self._write_rows(self._MERGE_ENTITIES_CYPHER, list(rows.values()))
+            # MERGE returns the existing ID if another writer created the entity first
+            merged_ids = {record["row_id"]: record["id"] for record in records}
+            for key, row in rows.items():
+                ids[key] = self._entity_ids[key] = merged_ids.get(row["id"], row["id"])
+        
+        return [ids[key] for key in keys]
+    
     async def create_relationship(self, from_entity: str, to_entity: str, 
                                 relationship_type: str, properties: Optional[Dict[str, Any]] = None) -> bool:
         """
         Create relationship between two entities in the knowledge graph.
         
-        TODO: Implement relationship creation:
-        1. Validate entity existence
-        2. Check for existing relationships
-        3. Create relationship with properties
-        4. Update relationship indices
-        5. Trigger relationship inference if needed
+        Returns False when either entity does not exist.
+        
+        TODO: Extend relationship creation:
+        1. Check for existing relationships
+        2. Update relationship indices
+        3. Trigger relationship inference if needed
         """
         logger.info(f"Creating relationship: {from_entity} -[{relationship_type}]-> {to_entity}")
         
-        # Placeholder implementation
-        await asyncio.sleep(0.1)  # Simulate processing time
-        
-        # TODO: Actual implementation would be:
-        # 1. cypher_query = """
-        # MATCH (a:Entity {id: $from_id}), (b:Entity {id: $to_id})
-        # CREATE (a)-[r:RELATIONSHIP_TYPE {
-        #     type: $rel_type,
-        #     properties: $properties,
-        #     created_at: datetime()
-        # }]->(b)
-        # RETURN r
-        # """
-        # 2. with self.driver.session() as session:
-        # 3.     result = session.run(cypher_query, ...)
-        # 4. return result.single() is not None
-        
-        success = False  # Placeholder: relationship not created
+        created = await self.create_relationships_batch([{
+            "from": from_entity,
+            "to": to_entity,
+            "type": relationship_type,
+            "properties": properties
+        }])
+        success = created > 0
         
         logger.info(f"Relationship creation {'successful' if success else 'failed'}")
         return success
     
+    async def create_relationships_batch(self, relationships: List[Dict[str, Any]]) -> int:
+        """
+        Create many relationships with one UNWIND write per NEO4J_WRITE_BATCH_SIZE rows.
+        
+        Args:
+            relationships: Dicts with from / to entity IDs, type and optional properties
+            
+        Returns:
+            Number of relationships created (pairs with a missing entity are skipped)
+        """
+        if self.driver is None:
+            return 0
+        
+        rows = [
+            {
+                "from": relationship["from"],
+                "to": relationship["to"],
+                "type": relationship["type"],
+                "properties": relationship.get("properties") or {}
+            }
+            for relationship in relationships
+        ]
+        records = await self._write_rows(self._CREATE_RELATIONSHIPS_CYPHER, rows)
+        return sum(record["created"] for record in records)
+    
     async def get_entity_subgraph(self, entity_id: str, depth: int = 2) -> Dict[str, Any]:
         """
         Get subgraph around a specific entity up to specified depth.
@@ -220,28 +616,64 @@ class KnowledgeGraphService:
         """
         logger.info(f"Getting subgraph for entity {entity_id} with depth {depth}")
         
-        # Placeholder implementation
-        await asyncio.sleep(0.1)  # Simulate processing time
+        if self.driver is None and depth >= 2:
+            # Deep traversals can hit hub entities; switch BFS direction as needed.
+            # The graph is traversed undirected, so the adjacency is its own transpose.
+            reached = _do_bfs(self._adjacency, self._adjacency, entity_id, depth)
+            subgraph = self._format_subgraph(entity_id, reached, depth)
+        else:
+            subgraph = (await self.get_entity_subgraphs([entity_id], depth))[entity_id]
         
-        # TODO: Actual implementation would be:
-        # 1. cypher_query = f"""
-        # MATCH (center:Entity {{id: $entity_id}})
-        # OPTIONAL MATCH path = (center)-[r*1..{depth}]-(connected)
-        # RETURN center, collect(path) as paths
-        # """
-        # 2. with self.driver.session() as session:
-        # 3.     result = session.run(cypher_query, entity_id=entity_id)
-        # 4. return self.format_subgraph(result.single())
-        
-        subgraph = {
+        logger.info(f"Retrieved subgraph with {len(subgraph['nodes'])} nodes")
+        return subgraph
+    
+    async def get_entity_subgraphs(self, entity_ids: List[str], depth: int = 2) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the subgraphs around several entities in one traversal.
+        
+        Args:
+            entity_ids: Center entity IDs
+            depth: Maximum number of hops from each center
+            
+        Returns:
+            Entity ID -> subgraph (same format as get_entity_subgraph)
+        """
+        logger.info(f"Getting subgraphs for {len(entity_ids)} entities with depth {depth}")
+        
+        if self.driver is not None:
+            # All subgraphs in one round-trip, using the fixed query for this depth
+            records = await self._read_cypher(
+                self._SUBGRAPHS_CYPHER[min(max(depth, 1), MAX_SUBGRAPH_DEPTH)],
+                ids=entity_ids
+            )
+            reached = {entity_id: {entity_id} for entity_id in entity_ids}
+            for record in records:
+                reached[record["id"]].update(record["nodes"])
+        else:
+            reached = _multi_source_bfs(self._adjacency, entity_ids, depth)
+        
+        return {
+            entity_id: self._format_subgraph(entity_id, reached[entity_id], depth)
+            for entity_id in entity_ids
+        }
+    
+    async def _neo4j_status(self) -> str:
+        """Probe the configured Neo4j server once, bounded by NEO4J_HEALTH_TIMEOUT"""
+        try:
+            await asyncio.wait_for(self._require_driver().verify_connectivity(), NEO4J_HEALTH_TIMEOUT)
+            return "connected"
+        except Exception as e:
+            logger.warning(f"Neo4j at {self.neo4j_url} is unavailable: {e}")
+            return "unavailable"
+    
+    def _format_subgraph(self, entity_id: str, reached: Set[str], depth: int) -> Dict[str, Any]:
+        """Build the subgraph response for a center entity and the nodes reached from it"""
+        return {
             "entity_id": entity_id,
-            "nodes": [],
+            "nodes": sorted(reached - {entity_id}),
             "relationships": [],
             "depth": depth
-        }  # Placeholder: empty subgraph
-        
-        logger.info(f"Retrieved subgraph with {len(subgraph['nodes'])} nodes")
-        return subgraph
+        }
     
     async def health_check(self) -> Dict[str, Any]:
         """
@@ -255,10 +687,12 @@ class KnowledgeGraphService:
         """
         logger.info("Checking knowledge graph service health")
         
-        # Placeholder health check
+        neo4j_status = "not_connected" if self.driver is None else await self._neo4j_status()
+        
+        # Placeholder health check (apart from Neo4j connectivity)
         health_status = {
             "neo4j": {
-                "status": "not_connected",
+                "status": neo4j_status,
                 "url": self.neo4j_url,
                 "database": "N/A",
                 "constraints": "N/A"
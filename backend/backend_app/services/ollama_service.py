@@ -7,18 +7,87 @@ Supports both Ollama models and cloud-based models (OpenAI, Anthropic, etc.).
 
 import logging
 import os
-import json
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator, Tuple
 import asyncio
+import time
 import httpx
+import orjson
 from datetime import datetime
+from functools import lru_cache
+
+# HTTP/2 lets concurrent requests to the cloud APIs share one connection
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Connection pool shared by all requests made through the service
+HTTP_TIMEOUT = 60.0
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+# Request bodies are encoded with orjson, so the content type is set explicitly
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Cloud models offered when the provider's API key is configured
+CLOUD_MODELS = {
+    "openai": ["gpt-4o", "gpt-4o-mini", "gpt-4-turbo", "gpt-3.5-turbo"],
+    "anthropic": ["claude-3-5-sonnet-20241022", "claude-3-opus-20240229", "claude-3-sonnet-20240229"],
+    "gemini": ["gemini-2.5-flash", "gemini-2.5-pro", "gemini-1.5-flash", "gemini-1.5-pro"],
+}
+
+# Seconds a model listing / health report is reused before probing again
+MODELS_CACHE_TTL = 60.0
+HEALTH_CACHE_TTL = 5.0
+
+# Number of distinct prompts kept by each prompt cache
+PROMPT_CACHE_SIZE = 256
+
+# Model name substring -> provider, checked in order (first match wins)
+MODEL_PROVIDER_PATTERNS = {
+    # Common Ollama model patterns
+    "llama": "ollama", "deepseek": "ollama", "qwen": "ollama", "gemma": "ollama",
+    "phi": "ollama", "mistral": "ollama", "mixtral": "ollama",
+    "neural-chat": "ollama", "orca": "ollama",
+    "gpt-3": "openai", "gpt-4": "openai",
+    "claude": "anthropic",
+    "gemini": "gemini",
+}
+
+@lru_cache(maxsize=256)
+def _model_provider(model: str) -> Optional[str]:
+    """Return the provider serving ``model``, or None if no pattern matches"""
+    name = model.lower()
+    return next((provider for pattern, provider in MODEL_PROVIDER_PATTERNS.items() if pattern in name), None)
+
+@lru_cache(maxsize=1)
+def _iso_for_second(second: int) -> str:
+    """Format a Unix second as an ISO 8601 local timestamp"""
+    return datetime.fromtimestamp(second).isoformat()
+
+def _iso_timestamp() -> str:
+    """Current time as ISO 8601, formatted at most once per second"""
+    return _iso_for_second(int(time.time()))
+
+# System prompt for education policy queries, shared by every prompt the service builds
+DEFAULT_SYSTEM_PROMPT = (
+    "You are an AI assistant specialized in GITAM Education Policy queries. \n"
+    "Provide accurate, helpful, and detailed responses about education policies, admission procedures, \n"
+    "academic regulations, and university guidelines. Always cite relevant policy documents when possible.\n"
+    "\n"
+    "Guidelines:\n"
+    "- Be precise and factual\n"
+    "- Use clear, professional language\n"
+    "- Provide specific policy references when available\n"
+    "- If uncertain, clearly state limitations\n"
+    "- Focus on GITAM-specific policies and procedures"
+)
+
 class OllamaService:
     """Service for Ollama LLM interactions"""
     
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize Ollama service with configuration"""
         self.ollama_url = os.getenv("OLLAMA_URL", "http://localhost:11434")
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
@@ -31,8 +100,37 @@ class OllamaService:
         self.default_anthropic_model = "claude-3-5-sonnet-20241022"
         self.default_gemini_model = "gemini-2.5-flash"
         
+        # Pooled client: keeps TCP/TLS connections alive across requests
+        self._client = httpx.AsyncClient(
+            timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS, http2=HTTP2_AVAILABLE
+        )
+        
+        # Provider -> response generator, used to dispatch by model name
+        self._generators = {
+            "ollama": self._generate_ollama_response,
+            "openai": self._generate_openai_response,
+            "anthropic": self._generate_anthropic_response,
+            "gemini": self._generate_gemini_response,
+        }
+        self._streamers = {
+            "ollama": self._stream_ollama_response,
+            "openai": self._stream_openai_response,
+            "anthropic": self._stream_anthropic_response,
+            "gemini": self._stream_gemini_response,
+        }
+        
+        # (result, monotonic time it was fetched); the locks coalesce concurrent refreshes
+        self._models_cache: Tuple[Dict[str, List[str]], float] = ({}, float("-inf"))
+        self._health_cache: Tuple[Dict[str, Any], float] = ({}, float("-inf"))
+        self._models_lock = asyncio.Lock()
+        self._health_lock = asyncio.Lock()
+        
         logger.info(f"Ollama service initialized with URL: {self.ollama_url}")
     
+    async def close(self) -> None:
+        """Close the pooled HTTP client (called on application shutdown)"""
+        await self._client.aclose()
+    
     async def generate_response(self, 
                               query: str, 
                               model: str,
@@ -56,23 +154,51 @@ class OllamaService:
             logger.info(f"Generating response with model: {model}")
             
             # Determine model type and route accordingly
-            if self._is_ollama_model(model):
-                return await self._generate_ollama_response(query, model, context, temperature, max_tokens)
-            elif self._is_openai_model(model):
-                return await self._generate_openai_response(query, model, context, temperature, max_tokens)
-            elif self._is_anthropic_model(model):
-                return await self._generate_anthropic_response(query, model, context, temperature, max_tokens)
-            elif self._is_gemini_model(model):
-                return await self._generate_gemini_response(query, model, context, temperature, max_tokens)
-            else:
+            provider = _model_provider(model)
+            if provider is None:
                 # Default to Ollama if model type is unknown
                 logger.warning(f"Unknown model type: {model}, defaulting to Ollama")
-                return await self._generate_ollama_response(query, self.default_ollama_model, context, temperature, max_tokens)
+                provider, model = "ollama", self.default_ollama_model
+            return await self._generators[provider](query, model, context, temperature, max_tokens)
                 
         except Exception as e:
             logger.error(f"Error generating response: {e}")
             raise
     
+    async def generate_response_stream(self, 
+                                     query: str, 
+                                     model: str,
+                                     context: Optional[str] = None,
+                                     temperature: float = 0.7,
+                                     max_tokens: int = 1000) -> AsyncIterator[str]:
+        """
+        Stream a response from the specified model as it is generated.
+        
+        Args:
+            query: User query
+            model: Model identifier (ollama model name or cloud model)
+            context: Optional context for the query
+            temperature: Response randomness (0.0 to 1.0)
+            max_tokens: Maximum tokens in response
+            
+        Yields:
+            Text fragments of the answer in generation order
+        """
+        logger.info(f"Streaming response with model: {model}")
+        
+        provider = _model_provider(model)
+        if provider is None:
+            logger.warning(f"Unknown model type: {model}, defaulting to Ollama")
+            provider, model = "ollama", self.default_ollama_model
+        stream = self._streamers[provider](query, model, context, temperature, max_tokens)
+        
+        try:
+            async for fragment in stream:
+                yield fragment
+        except Exception as e:
+            logger.error(f"Error streaming response: {e}")
+            raise
+    
     async def _generate_ollama_response(self, 
                                      query: str, 
                                      model: str,
@@ -95,23 +221,23 @@ class OllamaService:
                 }
             }
             
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    f"{self.ollama_url}/api/generate",
-                    json=payload
-                )
-                response.raise_for_status()
-                
-                result = response.json()
-                
-                return {
-                    "answer": result.get("response", ""),
-                    "model": model,
-                    "provider": "ollama",
-                    "tokens_used": result.get("eval_count", 0),
-                    "response_time": result.get("total_duration", 0) / 1e9,  # Convert nanoseconds to seconds
-                    "timestamp": datetime.now().isoformat()
-                }
+            response = await self._client.post(
+                f"{self.ollama_url}/api/generate",
+                content=orjson.dumps(payload),
+                headers=JSON_HEADERS
+            )
+            response.raise_for_status()
+            
+            result = orjson.loads(response.content)
+            
+            return {
+                "answer": result.get("response", ""),
+                "model": model,
+                "provider": "ollama",
+                "tokens_used": result.get("eval_count", 0),
+                "response_time": result.get("total_duration", 0) / 1e9,  # Convert nanoseconds to seconds
+                "timestamp": _iso_timestamp()
+            }
                 
         except httpx.ConnectError:
             logger.error(f"Cannot connect to Ollama at {self.ollama_url}")
@@ -145,24 +271,23 @@ class OllamaService:
                 "Content-Type": "application/json"
             }
             
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    "https://api.openai.com/v1/chat/completions",
-                    json=payload,
-                    headers=headers
-                )
-                response.raise_for_status()
-                
-                result = response.json()
-                
-                return {
-                    "answer": result["choices"][0]["message"]["content"],
-                    "model": model,
-                    "provider": "openai",
-                    "tokens_used": result["usage"]["total_tokens"],
-                    "response_time": 0,  # OpenAI doesn't provide response time
-                    "timestamp": datetime.now().isoformat()
-                }
+            response = await self._client.post(
+                "https://api.openai.com/v1/chat/completions",
+                content=orjson.dumps(payload),
+                headers=headers
+            )
+            response.raise_for_status()
+            
+            result = orjson.loads(response.content)
+            
+            return {
+                "answer": result["choices"][0]["message"]["content"],
+                "model": model,
+                "provider": "openai",
+                "tokens_used": result["usage"]["total_tokens"],
+                "response_time": 0,  # OpenAI doesn't provide response time
+                "timestamp": _iso_timestamp()
+            }
                 
         except Exception as e:
             logger.error(f"Error generating OpenAI response: {e}")
@@ -194,24 +319,23 @@ class OllamaService:
                 "anthropic-version": "2023-06-01"
             }
             
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    "https://api.anthropic.com/v1/messages",
-                    json=payload,
-                    headers=headers
-                )
-                response.raise_for_status()
-                
-                result = response.json()
-                
-                return {
-                    "answer": result["content"][0]["text"],
-                    "model": model,
-                    "provider": "anthropic",
-                    "tokens_used": result["usage"]["input_tokens"] + result["usage"]["output_tokens"],
-                    "response_time": 0,
-                    "timestamp": datetime.now().isoformat()
-                }
+            response = await self._client.post(
+                "https://api.anthropic.com/v1/messages",
+                content=orjson.dumps(payload),
+                headers=headers
+            )
+            response.raise_for_status()
+            
+            result = orjson.loads(response.content)
+            
+            return {
+                "answer": result["content"][0]["text"],
+                "model": model,
+                "provider": "anthropic",
+                "tokens_used": result["usage"]["input_tokens"] + result["usage"]["output_tokens"],
+                "response_time": 0,
+                "timestamp": _iso_timestamp()
+            }
                 
         except Exception as e:
             logger.error(f"Error generating Anthropic response: {e}")
@@ -238,145 +362,279 @@ class OllamaService:
                 }
             }
             
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={self.gemini_api_key}",
-                    json=payload
-                )
-                response.raise_for_status()
-                
-                result = response.json()
-                
-                return {
-                    "answer": result["candidates"][0]["content"]["parts"][0]["text"],
-                    "model": model,
-                    "provider": "gemini",
-                    "tokens_used": result["usageMetadata"]["totalTokenCount"],
-                    "response_time": 0,
-                    "timestamp": datetime.now().isoformat()
-                }
+            response = await self._client.post(
+                f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={self.gemini_api_key}",
+                content=orjson.dumps(payload),
+                headers=JSON_HEADERS
+            )
+            response.raise_for_status()
+            
+            result = orjson.loads(response.content)
+            
+            return {
+                "answer": result["candidates"][0]["content"]["parts"][0]["text"],
+                "model": model,
+                "provider": "gemini",
+                "tokens_used": result["usageMetadata"]["totalTokenCount"],
+                "response_time": 0,
+                "timestamp": _iso_timestamp()
+            }
                 
         except Exception as e:
             logger.error(f"Error generating Gemini response: {e}")
             raise
     
-    def _prepare_prompt(self, query: str, context: Optional[str] = None) -> str:
-        """Prepare prompt with context for education policy queries"""
-        system_prompt = """You are an AI assistant specialized in GITAM Education Policy queries. 
-        Provide accurate, helpful, and detailed responses about education policies, admission procedures, 
-        academic regulations, and university guidelines. Always cite relevant policy documents when possible.
+    async def _iter_sse_data(self, response: httpx.Response) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the JSON payload of each ``data:`` line of a server-sent event stream"""
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            data = line[5:].strip()
+            if not data or data == "[DONE]":
+                continue
+            yield orjson.loads(data)
+    
+    async def _stream_ollama_response(self, 
+                                    query: str, 
+                                    model: str,
+                                    context: Optional[str] = None,
+                                    temperature: float = 0.7,
+                                    max_tokens: int = 1000) -> AsyncIterator[str]:
+        """Stream response fragments from Ollama (newline-delimited JSON)"""
+        payload = {
+            "model": model,
+            "prompt": self._prepare_prompt(query, context),
+            "stream": True,
+            "options": {
+                "temperature": temperature,
+                "num_predict": max_tokens
+            }
+        }
         
-        Guidelines:
-        - Be precise and factual
-        - Use clear, professional language
-        - Provide specific policy references when available
-        - If uncertain, clearly state limitations
-        - Focus on GITAM-specific policies and procedures"""
+        try:
+            async with self._client.stream("POST", f"{self.ollama_url}/api/generate",
+                                           content=orjson.dumps(payload), headers=JSON_HEADERS) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    chunk = orjson.loads(line)
+                    if chunk.get("response"):
+                        yield chunk["response"]
+                    if chunk.get("done"):
+                        break
+        except httpx.ConnectError:
+            logger.error(f"Cannot connect to Ollama at {self.ollama_url}")
+            raise Exception(f"Ollama service unavailable at {self.ollama_url}")
+    
+    async def _stream_openai_response(self, 
+                                    query: str, 
+                                    model: str,
+                                    context: Optional[str] = None,
+                                    temperature: float = 0.7,
+                                    max_tokens: int = 1000) -> AsyncIterator[str]:
+        """Stream response fragments from the OpenAI chat completions API"""
+        if not self.openai_api_key:
+            raise Exception("OpenAI API key not configured")
         
-        if context:
-            prompt = f"{system_prompt}\n\nContext:\n{context}\n\nQuery: {query}\n\nResponse:"
-        else:
-            prompt = f"{system_prompt}\n\nQuery: {query}\n\nResponse:"
+        payload = {
+            "model": model,
+            "messages": [{"role": "user", "content": self._prepare_prompt(query, context)}],
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": True
+        }
+        headers = {
+            "Authorization": f"Bearer {self.openai_api_key}",
+            "Content-Type": "application/json"
+        }
         
-        return prompt
+        async with self._client.stream("POST", "https://api.openai.com/v1/chat/completions",
+                                       content=orjson.dumps(payload), headers=headers) as response:
+            response.raise_for_status()
+            async for event in self._iter_sse_data(response):
+                choices = event.get("choices") or [{}]
+                content = choices[0].get("delta", {}).get("content")
+                if content:
+                    yield content
     
-    def _is_ollama_model(self, model: str) -> bool:
-        """Check if model is an Ollama model"""
-        # Common Ollama model patterns
-        ollama_patterns = [
-            "llama", "deepseek", "qwen", "gemma", "phi", "codellama", 
-            "mistral", "mixtral", "neural-chat", "orca"
-        ]
-        return any(pattern in model.lower() for pattern in ollama_patterns)
+    async def _stream_anthropic_response(self, 
+                                       query: str, 
+                                       model: str,
+                                       context: Optional[str] = None,
+                                       temperature: float = 0.7,
+                                       max_tokens: int = 1000) -> AsyncIterator[str]:
+        """Stream response fragments from the Anthropic messages API"""
+        if not self.anthropic_api_key:
+            raise Exception("Anthropic API key not configured")
+        
+        payload = {
+            "model": model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "messages": [{"role": "user", "content": self._prepare_prompt(query, context)}],
+            "stream": True
+        }
+        headers = {
+            "x-api-key": self.anthropic_api_key,
+            "Content-Type": "application/json",
+            "anthropic-version": "2023-06-01"
+        }
+        
+        async with self._client.stream("POST", "https://api.anthropic.com/v1/messages",
+                                       content=orjson.dumps(payload), headers=headers) as response:
+            response.raise_for_status()
+            async for event in self._iter_sse_data(response):
+                if event.get("type") == "content_block_delta":
+                    text = event.get("delta", {}).get("text")
+                    if text:
+                        yield text
+    
+    async def _stream_gemini_response(self, 
+                                    query: str, 
+                                    model: str,
+                                    context: Optional[str] = None,
+                                    temperature: float = 0.7,
+                                    max_tokens: int = 1000) -> AsyncIterator[str]:
+        """Stream response fragments from the Gemini streamGenerateContent API"""
+        if not self.gemini_api_key:
+            raise Exception("Gemini API key not configured")
+        
+        payload = {
+            "contents": [{"parts": [{"text": self._prepare_prompt(query, context)}]}],
+            "generationConfig": {
+                "temperature": temperature,
+                "maxOutputTokens": max_tokens
+            }
+        }
+        
+        url = (f"https://generativelanguage.googleapis.com/v1beta/models/{model}:streamGenerateContent"
+               f"?alt=sse&key={self.gemini_api_key}")
+        async with self._client.stream("POST", url,
+                                       content=orjson.dumps(payload), headers=JSON_HEADERS) as response:
+            response.raise_for_status()
+            async for event in self._iter_sse_data(response):
+                for candidate in event.get("candidates", []):
+                    for part in candidate.get("content", {}).get("parts", []):
+                        if part.get("text"):
+                            yield part["text"]
+    
+    def _prepare_prompt(self, query: str, context: Optional[str] = None) -> str:
+        """Prepare prompt with context for education policy queries"""
+        if context:
+            return self._prepare_prompt_with_ctx(query, context)
+        return self._prepare_prompt_no_ctx(query)
+    
+    @staticmethod
+    @lru_cache(maxsize=PROMPT_CACHE_SIZE)
+    def _prepare_prompt_no_ctx(query: str) -> str:
+        """Prompt for a query without retrieved context (repeated queries come from cache)"""
+        return f"{DEFAULT_SYSTEM_PROMPT}\n\nQuery: {query}\n\nResponse:"
     
-    def _is_openai_model(self, model: str) -> bool:
-        """Check if model is an OpenAI model"""
-        openai_patterns = ["gpt-3", "gpt-4", "gpt-4o"]
-        return any(pattern in model.lower() for pattern in openai_patterns)
+    @staticmethod
+    @lru_cache(maxsize=PROMPT_CACHE_SIZE)
+    def _prepare_prompt_with_ctx(query: str, context: str) -> str:
+        """Prompt for a query with retrieved context (repeated pairs come from cache)"""
+        return f"{DEFAULT_SYSTEM_PROMPT}\n\nContext:\n{context}\n\nQuery: {query}\n\nResponse:"
     
-    def _is_anthropic_model(self, model: str) -> bool:
-        """Check if model is an Anthropic model"""
-        anthropic_patterns = ["claude"]
-        return any(pattern in model.lower() for pattern in anthropic_patterns)
+    def _api_key(self, provider: str) -> Optional[str]:
+        """Return the configured API key for a cloud provider"""
+        return {
+            "openai": self.openai_api_key,
+            "anthropic": self.anthropic_api_key,
+            "gemini": self.gemini_api_key,
+        }[provider]
     
-    def _is_gemini_model(self, model: str) -> bool:
-        """Check if model is a Gemini model"""
-        gemini_patterns = ["gemini"]
-        return any(pattern in model.lower() for pattern in gemini_patterns)
+    async def _probe_ollama(self, timeout: float) -> Optional[List[str]]:
+        """Fetch installed Ollama models; None if Ollama answered with an error status"""
+        response = await self._client.get(f"{self.ollama_url}/api/tags", timeout=timeout)
+        if response.status_code != 200:
+            return None
+        ollama_data = orjson.loads(response.content)
+        return [model["name"] for model in ollama_data.get("models", [])]
+    
+    async def _probe_cloud(self, provider: str) -> List[str]:
+        """List a cloud provider's models (only when its API key is configured)"""
+        return list(CLOUD_MODELS[provider]) if self._api_key(provider) else []
     
     async def list_available_models(self) -> Dict[str, List[str]]:
-        """List available models by provider"""
-        models = {
-            "ollama": [],
-            "openai": [],
-            "anthropic": [],
-            "gemini": []
-        }
+        """List available models by provider (cached for MODELS_CACHE_TTL seconds)"""
+        models, fetched_at = self._models_cache
+        if time.monotonic() - fetched_at < MODELS_CACHE_TTL:
+            return models
         
-        try:
-            # Get Ollama models
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{self.ollama_url}/api/tags")
-                if response.status_code == 200:
-                    ollama_data = response.json()
-                    models["ollama"] = [model["name"] for model in ollama_data.get("models", [])]
-        except Exception as e:
-            logger.warning(f"Could not fetch Ollama models: {e}")
-        
-        # Add cloud models if API keys are configured
-        if self.openai_api_key:
-            models["openai"] = ["gpt-4o", "gpt-4o-mini", "gpt-4-turbo", "gpt-3.5-turbo"]
+        async with self._models_lock:
+            # Another request may have refreshed the cache while we waited
+            models, fetched_at = self._models_cache
+            if time.monotonic() - fetched_at < MODELS_CACHE_TTL:
+                return models
+            models = await self._fetch_available_models()
+            self._models_cache = (models, time.monotonic())
+            return models
+    
+    async def _fetch_available_models(self) -> Dict[str, List[str]]:
+        """Probe every provider for its available models"""
+        ollama_models, *cloud_models = await asyncio.gather(
+            self._probe_ollama(timeout=10.0),
+            *(self._probe_cloud(provider) for provider in CLOUD_MODELS),
+            return_exceptions=True
+        )
         
-        if self.anthropic_api_key:
-            models["anthropic"] = ["claude-3-5-sonnet-20241022", "claude-3-opus-20240229", "claude-3-sonnet-20240229"]
+        if isinstance(ollama_models, BaseException):
+            logger.warning(f"Could not fetch Ollama models: {ollama_models}")
+            ollama_models = []
         
-        if self.gemini_api_key:
-            models["gemini"] = ["gemini-2.5-flash", "gemini-2.5-pro", "gemini-1.5-flash", "gemini-1.5-pro"]
+        models: Dict[str, List[str]] = {"ollama": ollama_models or []}
+        for provider, provider_models in zip(CLOUD_MODELS, cloud_models):
+            if isinstance(provider_models, BaseException):
+                logger.warning(f"Could not list {provider} models: {provider_models}")
+                provider_models = []
+            models[provider] = provider_models or []
         
         return models
     
-    async def health_check(self) -> Dict[str, Any]:
-        """Check Ollama service health"""
-        health_status = {
-            "ollama": {
-                "status": "unknown",
-                "url": self.ollama_url,
-                "models": []
-            },
-            "openai": {
-                "status": "not_configured",
-                "api_key_configured": bool(self.openai_api_key)
-            },
-            "anthropic": {
-                "status": "not_configured", 
-                "api_key_configured": bool(self.anthropic_api_key)
-            },
-            "gemini": {
-                "status": "not_configured",
-                "api_key_configured": bool(self.gemini_api_key)
-            }
-        }
-        
+    async def _check_ollama_health(self) -> Dict[str, Any]:
+        """Health entry for the Ollama server"""
+        status = {"status": "unknown", "url": self.ollama_url, "models": []}
         try:
-            # Test Ollama connection
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self.ollama_url}/api/tags")
-                if response.status_code == 200:
-                    ollama_data = response.json()
-                    health_status["ollama"]["status"] = "connected"
-                    health_status["ollama"]["models"] = [model["name"] for model in ollama_data.get("models", [])]
-                else:
-                    health_status["ollama"]["status"] = "error"
+            ollama_models = await self._probe_ollama(timeout=5.0)
+            if ollama_models is None:
+                status["status"] = "error"
+            else:
+                status["status"] = "connected"
+                status["models"] = ollama_models
         except Exception as e:
-            health_status["ollama"]["status"] = "disconnected"
-            health_status["ollama"]["error"] = str(e)
-        
-        # Check cloud API configurations
-        if self.openai_api_key:
-            health_status["openai"]["status"] = "configured"
-        if self.anthropic_api_key:
-            health_status["anthropic"]["status"] = "configured"
-        if self.gemini_api_key:
-            health_status["gemini"]["status"] = "configured"
+            status["status"] = "disconnected"
+            status["error"] = str(e)
+        return status
+    
+    async def _check_cloud_health(self, provider: str) -> Dict[str, Any]:
+        """Health entry for a cloud provider (configuration only)"""
+        configured = bool(self._api_key(provider))
+        return {
+            "status": "configured" if configured else "not_configured",
+            "api_key_configured": configured
+        }
+    
+    async def health_check(self) -> Dict[str, Any]:
+        """Check Ollama service health (cached for HEALTH_CACHE_TTL seconds)"""
+        health_status, checked_at = self._health_cache
+        if time.monotonic() - checked_at < HEALTH_CACHE_TTL:
+            return health_status
         
-        return health_status
+        async with self._health_lock:
+            health_status, checked_at = self._health_cache
+            if time.monotonic() - checked_at < HEALTH_CACHE_TTL:
+                return health_status
+            health_status = await self._fetch_health()
+            self._health_cache = (health_status, time.monotonic())
+            return health_status
+    
+    async def _fetch_health(self) -> Dict[str, Any]:
+        """Probe every provider for its health status"""
+        providers = ["ollama", *CLOUD_MODELS]
+        results = await asyncio.gather(
+            self._check_ollama_health(),
+            *(self._check_cloud_health(provider) for provider in CLOUD_MODELS)
+        )
+        return dict(zip(providers, results))
@@ -5,23 +5,83 @@ This service handles document storage, embedding generation, and vector similari
 using Pinecone as the vector database backend.
 """
 
+import asyncio
+import contextlib
+import hashlib
 import logging
 import os
+import re
+import threading
 import uuid
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple, Union, cast
 from datetime import datetime
 
+# Server worker processes sharing this machine's cores (uvicorn reads the same variable)
+WEB_CONCURRENCY = max(1, int(os.getenv("WEB_CONCURRENCY") or 1))
+# CPU threads for embedding per process, by default the cores split across the workers so
+# N workers do not run N x cores threads; the OpenMP/MKL pools read these when torch is first imported
+TORCH_NUM_THREADS = int(os.getenv("TORCH_NUM_THREADS") or max(1, (os.cpu_count() or 1) // WEB_CONCURRENCY))
+os.environ.setdefault("OMP_NUM_THREADS", str(TORCH_NUM_THREADS))
+os.environ.setdefault("MKL_NUM_THREADS", str(TORCH_NUM_THREADS))
+
+import numpy as np
 from sentence_transformers import SentenceTransformer
 from pinecone import Pinecone, ServerlessSpec
 
+from backend_app.services.content_store import DocumentContentStore
+
+# torch ships with sentence-transformers; only needed for reduced-precision models
+try:
+    import torch
+    TORCH_AVAILABLE = True
+except ImportError:
+    TORCH_AVAILABLE = False
+
+# ONNX Runtime is optional (sentence-transformers[onnx]); used with EMBEDDING_BACKEND=onnx
+try:
+    import onnxruntime as ort
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
+# pinecone-text is optional; its BM25 encoder enables sparse-dense hybrid queries (PINECONE_HYBRID=1)
+try:
+    from pinecone_text.sparse import BM25Encoder
+    PINECONE_TEXT_AVAILABLE = True
+except ImportError:
+    PINECONE_TEXT_AVAILABLE = False
+
+# rank_bm25 is optional; provides in-process keyword search when hybrid search is disabled
+try:
+    from rank_bm25 import BM25Okapi
+    RANK_BM25_AVAILABLE = True
+except ImportError:
+    RANK_BM25_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Texts per SentenceTransformer forward pass when embedding a list
+ENCODE_BATCH_SIZE = 64
+# Embeddings kept in the content-addressed cache (least recently used evicted first)
+EMBEDDING_CACHE_SIZE = 10000
+# Vectors per upsert request, requests in flight per chunk, and client threads
+UPSERT_BATCH_SIZE = 64
+UPSERT_CHUNK_SIZE = 1000
+UPSERT_POOL_THREADS = 30
+# Query embeddings kept separately, so bulk ingest cannot evict hot queries
+QUERY_CACHE_SIZE = 4096
+# Default hybrid weighting: 1.0 = dense only, 0.0 = sparse (BM25) only
+HYBRID_ALPHA = 0.5
+# Word tokens for the in-process BM25 index
+BM25_TOKEN_RE = re.compile(r"\w+")
+
 
 class PineconeService:
     """Service for Pinecone vector database operations"""
 
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize Pinecone service with configuration"""
         self.pinecone_api_key = os.getenv("PINECONE_API_KEY", "")
         self.pinecone_environment = os.getenv("PINECONE_ENV", "us-east-1")
@@ -29,30 +89,255 @@ class PineconeService:
         self.embedding_model_name = os.getenv(
             "EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2"
         )
+        # fp32 (default), fp16 (CUDA only) or int8 (dynamic quantization, CPU)
+        self.embedding_precision = os.getenv("EMBEDDING_PRECISION", "fp32").lower()
+        # torch (default) or onnx (ONNX Runtime on CPU, using EMBEDDING_ONNX_FILE)
+        self.embedding_backend = os.getenv("EMBEDDING_BACKEND", "torch").lower()
+        self.onnx_model_file = os.getenv("EMBEDDING_ONNX_FILE", "onnx/model.onnx")
+        # Store BM25 sparse values with every vector and serve hybrid queries (needs a dotproduct index)
+        self.hybrid_enabled = os.getenv("PINECONE_HYBRID", "0") == "1"
 
         if not self.pinecone_api_key:
             raise RuntimeError("PINECONE_API_KEY is not set")
 
         # Initialize embedding model
-        self.embedding_model = SentenceTransformer(self.embedding_model_name)
+        self._configure_torch_threads()
+        self.embedding_model = self._load_embedding_model()
+        # Inference only: disable dropout and other training-mode behaviour
+        self.embedding_model.eval()
+        self._warm_up_embedding_model()
+        # Mixed into embedding cache keys so a model, backend or precision change never reuses old vectors
+        self._model_version = f"{self.embedding_model_name}@{self.embedding_backend}:{self.embedding_precision}"
+        # Content hash -> embedding, so identical texts are encoded once
+        self._embedding_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        # (model version, query text) -> query embedding
+        self._query_cache: "OrderedDict[Tuple[str, str], List[float]]" = OrderedDict()
+        self.sparse_encoder = self._load_sparse_encoder() if self.hybrid_enabled else None
 
         # Initialize Pinecone client and ensure index exists
         self.pc = Pinecone(api_key=self.pinecone_api_key)
 
         if self.index_name not in [idx["name"] for idx in self.pc.list_indexes()]:
-            # Create a serverless index with the model's embedding dimension
-            dim = self.embedding_model.get_sentence_embedding_dimension()
+            # Create a serverless index with the model's embedding dimension;
+            # sparse-dense vectors are only supported with the dotproduct metric
             self.pc.create_index(
                 name=self.index_name,
-                dimension=dim,
-                metric="cosine",
+                dimension=self._embedding_dim,
+                metric="dotproduct" if self.sparse_encoder else "cosine",
                 spec=ServerlessSpec(cloud="aws", region=self.pinecone_environment),
             )
 
-        self.index = self.pc.Index(self.index_name)
+        # pool_threads lets upserts run in parallel with async_req=True
+        self.index = self.pc.Index(self.index_name, pool_threads=UPSERT_POOL_THREADS)
+        # Full document text lives outside Pinecone; vectors carry only small metadata
+        self.content_store = DocumentContentStore()
+        # In-process BM25 index over the content store: (store version, index, doc IDs)
+        self._bm25: Optional[Tuple[int, Any, List[str]]] = None
+        self._bm25_lock = threading.Lock()
 
         logger.info(f"Pinecone service initialized with index: {self.index_name}")
 
+    @classmethod
+    async def create(cls) -> "PineconeService":
+        """
+        Construct the service in a worker thread.
+
+        Loading and warming up the embedding model blocks for seconds; use this
+        instead of PineconeService() when constructing from async code.
+        """
+        return await asyncio.to_thread(cls)
+
+    def _configure_torch_threads(self) -> None:
+        """Let PyTorch use TORCH_NUM_THREADS intra-op threads (default: this worker's share of the cores)."""
+        if not TORCH_AVAILABLE:
+            return
+        torch.set_num_threads(TORCH_NUM_THREADS)
+        try:
+            torch.set_num_interop_threads(max(1, TORCH_NUM_THREADS // 2))
+        except RuntimeError:
+            # Can only be set once, before any inter-op work has started
+            pass
+        logger.info(f"PyTorch using {TORCH_NUM_THREADS} threads for embeddings")
+
+    def _load_embedding_model(self) -> SentenceTransformer:
+        """
+        Load the embedding model for the configured EMBEDDING_BACKEND.
+
+        The onnx backend runs the exported model on ONNX Runtime with all graph
+        optimizations and TORCH_NUM_THREADS intra-op threads; pooling and normalization
+        still come from the SentenceTransformer config, so vectors are unchanged.
+        It falls back to PyTorch (with EMBEDDING_PRECISION applied) if ONNX
+        Runtime or the exported file is unavailable.
+        """
+        if self.embedding_backend == "onnx" and ONNXRUNTIME_AVAILABLE:
+            session_options = ort.SessionOptions()
+            session_options.intra_op_num_threads = TORCH_NUM_THREADS
+            session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            try:
+                model = SentenceTransformer(
+                    self.embedding_model_name,
+                    backend="onnx",
+                    model_kwargs={
+                        "file_name": self.onnx_model_file,
+                        "provider": "CPUExecutionProvider",
+                        "session_options": session_options,
+                    },
+                )
+                # The exported graph fixes the precision
+                self.embedding_precision = self.onnx_model_file
+                logger.info(f"Loaded ONNX embedding model: {self.onnx_model_file}")
+                return model
+            except Exception as e:
+                logger.warning(f"ONNX embedding backend unavailable, using PyTorch: {e}")
+        elif self.embedding_backend == "onnx":
+            logger.warning("onnxruntime not installed, using PyTorch for embeddings")
+
+        self.embedding_backend = "torch"
+        return self._apply_precision(SentenceTransformer(self.embedding_model_name))
+
+    def _apply_precision(self, model: SentenceTransformer) -> SentenceTransformer:
+        """
+        Convert the model to the configured EMBEDDING_PRECISION.
+
+        fp16 halves the weights on a CUDA device; int8 dynamically quantizes the
+        Linear layers for CPU inference. Unsupported settings fall back to fp32
+        (and self.embedding_precision records what was actually applied).
+        """
+        precision = self.embedding_precision
+        if precision == "fp16" and TORCH_AVAILABLE and torch.cuda.is_available():
+            model = model.half()
+        elif precision == "int8" and TORCH_AVAILABLE and model.device.type == "cpu":
+            model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        elif precision != "fp32":
+            logger.warning(f"Embedding precision {precision} not supported here, using fp32")
+            precision = "fp32"
+
+        self.embedding_precision = precision
+        logger.info(f"Embedding model loaded with {precision} precision")
+        return model
+
+    def _load_sparse_encoder(self) -> Optional["BM25Encoder"]:
+        """Load the BM25 encoder used for sparse vectors, or None if it is unavailable."""
+        if not PINECONE_TEXT_AVAILABLE:
+            logger.warning("pinecone-text not installed, hybrid search disabled")
+            return None
+        try:
+            params_path = os.getenv("BM25_PARAMS_PATH")
+            # Corpus-fitted parameters if provided, otherwise the MS MARCO defaults
+            encoder = BM25Encoder().load(params_path) if params_path else BM25Encoder.default()
+            logger.info("BM25 sparse encoder loaded for hybrid search")
+            return encoder
+        except Exception as e:
+            logger.warning(f"Could not load BM25 encoder, hybrid search disabled: {e}")
+            return None
+
+    @property
+    def supports_hybrid(self) -> bool:
+        """Whether vectors carry sparse values and hybrid_search runs server-side."""
+        return self.sparse_encoder is not None
+
+    async def _sparse_values(self, texts: List[str]) -> Optional[List[Dict[str, Any]]]:
+        """BM25 sparse vectors for documents, or None when hybrid search is disabled."""
+        if self.sparse_encoder is None:
+            return None
+        return await asyncio.to_thread(self.sparse_encoder.encode_documents, texts)
+
+    @staticmethod
+    def _vector(
+        doc_id: str, embedding: np.ndarray, metadata: Dict[str, Any], sparse: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Build one upsert record, adding sparse values when present."""
+        vector = {"id": doc_id, "values": embedding, "metadata": metadata}
+        if sparse is not None:
+            vector["sparse_values"] = sparse
+        return vector
+
+    def _warm_up_embedding_model(self) -> None:
+        """
+        Run one throwaway encode so the first real request skips lazy kernel and
+        allocator setup. Its output also fixes the embedding dimension reported
+        by stats and health checks, so those never need to run the model.
+        """
+        self._embedding_dim = int(self._encode_sync(["warmup"]).shape[-1])
+        logger.info("Embedding model warmed up")
+
+    def _encode_sync(self, text_or_list: Union[str, List[str]]) -> np.ndarray:
+        """
+        Embed one text or a list of texts (blocking; run it via asyncio.to_thread).
+
+        encode() already sorts a list by length before mini-batching and restores
+        the input order afterwards, so callers should pass whole lists rather than
+        pre-sorting or splitting them. Runs under torch.inference_mode() so no
+        autograd state is recorded, whatever the installed encode() does itself.
+        """
+        with torch.inference_mode() if TORCH_AVAILABLE else contextlib.nullcontext():
+            return cast(np.ndarray, self.embedding_model.encode(
+                text_or_list, batch_size=ENCODE_BATCH_SIZE, convert_to_numpy=True, show_progress_bar=False
+            ).astype(np.float32, copy=False))
+
+    def _content_key(self, text: str) -> bytes:
+        """Hash the model version and text into an embedding cache key."""
+        return hashlib.blake2b(self._model_version.encode() + b"|" + text.encode(), digest_size=16).digest()
+
+    async def _embed_many(self, texts: List[str]) -> List[np.ndarray]:
+        """Embed texts, encoding only cache misses (each distinct text once) in one batched call."""
+        keys = [self._content_key(text) for text in texts]
+        # Hits are copied out before encoding: concurrent calls may evict them meanwhile
+        vectors: Dict[bytes, np.ndarray] = {}
+        missing: Dict[bytes, str] = {}
+        for key, text in zip(keys, texts):
+            if key in vectors or key in missing:
+                continue
+            hit = self._embedding_cache.get(key)
+            if hit is not None:
+                vectors[key] = hit
+            else:
+                missing[key] = text
+
+        if missing:
+            embeddings = await asyncio.to_thread(self._encode_sync, list(missing.values()))
+            vectors.update(zip(missing, embeddings))
+
+        result = [vectors[key] for key in keys]
+        for key in keys:
+            self._embedding_cache[key] = vectors[key]
+            self._embedding_cache.move_to_end(key)
+        while len(self._embedding_cache) > EMBEDDING_CACHE_SIZE:
+            self._embedding_cache.popitem(last=False)
+        return result
+
+    async def embed_documents(self, texts: List[str]) -> List[np.ndarray]:
+        """
+        Embed document texts with the index's model, e.g. to pre-compute a whole
+        corpus once and pass the results to batch_add_documents.
+
+        Args:
+            texts: Document contents
+
+        Returns:
+            One float32 embedding per text, in input order
+        """
+        return await self._embed_many(texts)
+
+    async def _embed(self, text: str) -> np.ndarray:
+        """Embed a single text through the cache."""
+        return (await self._embed_many([text]))[0]
+
+    async def _embed_query(self, query: str) -> List[float]:
+        """Embed a search query, serving repeated queries from a bounded LRU."""
+        key = (self._model_version, query)
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            self._query_cache.move_to_end(key)
+            return cached
+
+        # The query API takes a plain list; one conversion per distinct query
+        embedding: List[float] = (await asyncio.to_thread(self._encode_sync, query)).tolist()
+        self._query_cache[key] = embedding
+        if len(self._query_cache) > QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+        return embedding
+
     async def add_document(
         self, content: str, metadata: Dict[str, Any], doc_id: Optional[str] = None
     ) -> str:
@@ -62,8 +347,12 @@ class PineconeService:
         if not doc_id:
             doc_id = str(uuid.uuid4())
 
-        embedding = self.embedding_model.encode(content).tolist()
-        self.index.upsert(vectors=[{"id": doc_id, "values": embedding, "metadata": {**metadata, "content": content}}])
+        embedding = await self._embed(content)
+        sparse = await self._sparse_values([content])
+        await asyncio.to_thread(self.content_store.put_many, [(doc_id, content)])
+        await asyncio.to_thread(
+            self.index.upsert, vectors=[self._vector(doc_id, embedding, metadata, sparse[0] if sparse else None)]
+        )
         return doc_id
 
     async def search_similar(
@@ -72,21 +361,115 @@ class PineconeService:
         """
         Search for similar documents using vector similarity.
         """
-        query_embedding = self.embedding_model.encode(query).tolist()
+        query_embedding = await self._embed_query(query)
         kwargs = {}
         if filter_metadata:
             kwargs["filter"] = filter_metadata
 
-        res = self.index.query(vector=query_embedding, top_k=top_k, include_metadata=True, **kwargs)
+        res = await asyncio.to_thread(
+            self.index.query, vector=query_embedding, top_k=top_k, include_metadata=True, **kwargs
+        )
+        return await self._hydrate_matches(res.matches or [])
+
+    async def hybrid_search(
+        self,
+        query: str,
+        top_k: int = 10,
+        alpha: float = HYBRID_ALPHA,
+        filter_metadata: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search with a dense embedding and a BM25 sparse vector in one Pinecone query.
+
+        Pinecone scores sparse-dense vectors by dot product, so the weighting is a
+        convex combination applied to the query: dense values are scaled by alpha
+        and sparse values by 1 - alpha. Without a sparse encoder this is a plain
+        dense search.
+
+        Args:
+            query: Search query text
+            top_k: Number of results to return
+            alpha: Dense weight in [0, 1]; 1.0 is dense only, 0.0 sparse only
+            filter_metadata: Optional Pinecone metadata filter
+        """
+        if self.sparse_encoder is None:
+            return await self.search_similar(query, top_k, filter_metadata)
+
+        query_embedding = await self._embed_query(query)
+        sparse = await asyncio.to_thread(self.sparse_encoder.encode_queries, query)
+        kwargs = {}
+        if filter_metadata:
+            kwargs["filter"] = filter_metadata
+
+        res = await asyncio.to_thread(
+            self.index.query,
+            vector=[value * alpha for value in query_embedding],
+            sparse_vector={
+                "indices": sparse["indices"],
+                "values": [value * (1 - alpha) for value in sparse["values"]],
+            },
+            top_k=top_k,
+            include_metadata=True,
+            **kwargs,
+        )
+        return await self._hydrate_matches(res.matches or [])
+
+    async def keyword_search(self, query: str, top_k: int = 10) -> List[str]:
+        """
+        Rank stored documents against the query with BM25 (rank_bm25).
+
+        The index is built from the content store on first use and rebuilt
+        whenever the stored corpus changes. Returns document IDs, best first;
+        empty if rank_bm25 is not installed.
+
+        Args:
+            query: Search query text
+            top_k: Number of results to return
+        """
+        if not RANK_BM25_AVAILABLE:
+            return []
+        return await asyncio.to_thread(self._keyword_search_sync, query, top_k)
+
+    def _keyword_search_sync(self, query: str, top_k: int) -> List[str]:
+        bm25, doc_ids = self._current_bm25()
+        if bm25 is None or top_k <= 0:
+            return []
+        scores = bm25.get_scores(BM25_TOKEN_RE.findall(query.lower()))
+        k = min(top_k, len(doc_ids))
+        # Select the top k without sorting the whole corpus, then order just those
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [doc_ids[i] for i in top if scores[i] > 0]
+
+    def _current_bm25(self) -> Tuple[Optional[Any], List[str]]:
+        """Return the BM25 index and its doc IDs, rebuilding it if the corpus changed."""
+        version = self.content_store.version()
+        with self._bm25_lock:
+            if self._bm25 is None or self._bm25[0] != version:
+                items = self.content_store.items()
+                doc_ids = [doc_id for doc_id, _ in items]
+                corpus = [BM25_TOKEN_RE.findall(content.lower()) for _, content in items]
+                # BM25Okapi cannot be built over an empty corpus
+                bm25 = BM25Okapi(corpus) if any(corpus) else None
+                self._bm25 = (version, bm25, doc_ids)
+                logger.info(f"BM25 index built over {len(doc_ids)} documents")
+            _, bm25, doc_ids = self._bm25
+        return bm25, doc_ids
+
+    async def _hydrate_matches(self, matches: List[Any]) -> List[Dict[str, Any]]:
+        """Turn query matches into result dicts, reading all hits' content in one store lookup."""
+        contents = await asyncio.to_thread(self.content_store.get_many, [match.id for match in matches])
 
         similar_docs: List[Dict[str, Any]] = []
-        for match in res.matches or []:
+        for match in matches:
+            # The response's own metadata dict is reused; only legacy vectors still carry content in it
             md = match.metadata or {}
+            legacy_content = md.pop("content", "")
             similar_docs.append(
                 {
                     "id": match.id,
-                    "content": md.get("content", ""),
-                    "metadata": {k: v for k, v in md.items() if k != "content"},
+                    "content": contents.get(match.id, legacy_content),
+                    "metadata": md,
                     "score": match.score or 0.0,
                 }
             )
@@ -94,44 +477,76 @@ class PineconeService:
 
     async def get_document(self, doc_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve a specific document by ID."""
-        res = self.index.fetch(ids=[doc_id])
-        vec = (res.vectors or {}).get(doc_id)
-        if not vec:
-            return None
-        md = vec.metadata or {}
-        return {
-            "id": doc_id,
-            "content": md.get("content", ""),
-            "metadata": {k: v for k, v in md.items() if k != "content"},
-        }
+        docs = await self.get_documents([doc_id])
+        return docs[0] if docs else None
+
+    async def get_documents(self, doc_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Retrieve several documents with one fetch and one content store lookup.
+
+        Args:
+            doc_ids: Document IDs to retrieve
+
+        Returns:
+            Documents in the order of doc_ids; IDs not in the index are skipped
+        """
+        if not doc_ids:
+            return []
+        res = await asyncio.to_thread(self.index.fetch, ids=doc_ids)
+        vectors = res.vectors or {}
+        contents = await asyncio.to_thread(self.content_store.get_many, doc_ids)
+
+        docs: List[Dict[str, Any]] = []
+        for doc_id in doc_ids:
+            vec = vectors.get(doc_id)
+            if not vec:
+                continue
+            md = vec.metadata or {}
+            legacy_content = md.pop("content", "")
+            docs.append({"id": doc_id, "content": contents.get(doc_id, legacy_content), "metadata": md})
+        return docs
 
     async def update_document(
         self, doc_id: str, content: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None
     ) -> bool:
-        """Update an existing document."""
+        """
+        Update an existing document.
+
+        A metadata-only update is a single Pinecone update call: no fetch and no
+        re-embedding. set_metadata merges into the stored metadata, and Pinecone
+        does not report whether the ID exists, so this path always returns True.
+        """
+        if content is None:
+            if metadata is not None:
+                await asyncio.to_thread(self.index.update, id=doc_id, set_metadata=metadata)
+            return True
+
         existing = await self.get_document(doc_id)
         if not existing:
             return False
-        new_content = content if content is not None else existing["content"]
         new_metadata = metadata if metadata is not None else existing["metadata"]
-        embedding = self.embedding_model.encode(new_content).tolist()
-        md = {**new_metadata, "content": new_content}
-        self.index.upsert(vectors=[{"id": doc_id, "values": embedding, "metadata": md}])
+        embedding = await self._embed(content)
+        sparse = await self._sparse_values([content])
+        await asyncio.to_thread(self.content_store.put_many, [(doc_id, content)])
+        await asyncio.to_thread(
+            self.index.upsert, vectors=[self._vector(doc_id, embedding, new_metadata, sparse[0] if sparse else None)]
+        )
         return True
 
     async def delete_document(self, doc_id: str) -> bool:
         """Delete a document from the database."""
-        self.index.delete(ids=[doc_id])
+        await asyncio.to_thread(self.index.delete, ids=[doc_id])
+        await asyncio.to_thread(self.content_store.delete, doc_id)
         return True
 
     async def get_collection_stats(self) -> Dict[str, Any]:
         """Get index statistics and metadata."""
-        stats = self.index.describe_index_stats()
+        stats = await asyncio.to_thread(self.index.describe_index_stats)
         return {
             "total_vectors": stats.get("total_vector_count", 0),
             "index_name": self.index_name,
             "embedding_model": self.embedding_model_name,
-            "embedding_dimensions": self.embedding_model.get_sentence_embedding_dimension(),
+            "embedding_dimensions": self._embedding_dim,
             "last_updated": datetime.now().isoformat(),
         }
 
@@ -139,8 +554,7 @@ class PineconeService:
         """Check Pinecone service health."""
         try:
             # List indexes as a lightweight health check
-            indexes = self.pc.list_indexes()
-            test_embedding = self.embedding_model.encode("test query").tolist()
+            indexes = await asyncio.to_thread(self.pc.list_indexes)
             return {
                 "pinecone": {
                     "status": "connected",
@@ -148,10 +562,11 @@ class PineconeService:
                     "indexes": len(indexes),
                     "index_name": self.index_name,
                 },
+                # The startup warmup encode already proved the model runs
                 "embedding_model": {
                     "status": "loaded",
                     "model": self.embedding_model_name,
-                    "dimensions": len(test_embedding),
+                    "dimensions": self._embedding_dim,
                 },
             }
         except Exception as e:
@@ -161,17 +576,49 @@ class PineconeService:
             }
 
     async def batch_add_documents(self, documents: List[Dict[str, Any]]) -> List[str]:
-        """Add multiple documents in batch for efficiency."""
-        ids: List[str] = []
-        vectors = []
-        for doc in documents:
-            did = str(uuid.uuid4())
-            ids.append(did)
-            emb = self.embedding_model.encode(doc["content"]).tolist()
-            vectors.append({"id": did, "values": emb, "metadata": {**doc["metadata"], "content": doc["content"]}})
+        """
+        Add multiple documents in batch for efficiency.
+
+        Args:
+            documents: Dicts with content and metadata, plus an optional
+                pre-computed embedding (see embed_documents) that is used as-is
+        """
+        ids: List[str] = [str(uuid.uuid4()) for _ in documents]
+        contents = [doc["content"] for doc in documents]
+        embeddings: List[Any] = [doc.get("embedding") for doc in documents]
+        pending = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        # Remaining contents are encoded in one call (mini-batched by the model), off the
+        # event loop, while the contents are stored
+        encoded, sparse, _ = await asyncio.gather(
+            self._embed_many([contents[i] for i in pending]),
+            self._sparse_values(contents),
+            asyncio.to_thread(self.content_store.put_many, list(zip(ids, contents))),
+        )
+        for i, embedding in zip(pending, encoded):
+            embeddings[i] = embedding
+        sparse = sparse or [None] * len(documents)
+        vectors = [
+            self._vector(did, emb, doc["metadata"], sp)
+            for did, doc, emb, sp in zip(ids, documents, embeddings, sparse)
+        ]
         if vectors:
-            self.index.upsert(vectors=vectors)
+            await asyncio.to_thread(self._upsert_parallel, vectors)
         return ids
 
+    def _upsert_parallel(self, vectors: List[Dict[str, Any]]) -> None:
+        """Upsert vectors as parallel batched requests, one chunk at a time (blocking)."""
+        for start in range(0, len(vectors), UPSERT_CHUNK_SIZE):
+            chunk = vectors[start:start + UPSERT_CHUNK_SIZE]
+            async_results = [
+                self.index.upsert(vectors=chunk[i:i + UPSERT_BATCH_SIZE], async_req=True)
+                for i in range(0, len(chunk), UPSERT_BATCH_SIZE)
+            ]
+            # Wait for the whole chunk (re-raises the first failed request)
+            for result in async_results:
+                result.get()
 
 
+@lru_cache(maxsize=1)
+def get_pinecone_service() -> PineconeService:
+    """Return the process-wide PineconeService, so the embedding model is loaded once."""
+    return PineconeService()
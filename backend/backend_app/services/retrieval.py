@@ -6,39 +6,110 @@ Now integrated with ChromaDBService for actual vector database functionality.
 """
 
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 import asyncio
 import os
 from datetime import datetime
-from backend_app.services.pinecone_service import PineconeService
+import numpy as np
+from backend_app.services.pinecone_service import get_pinecone_service
+
+# fastText language identification is optional; without it a keyword heuristic is used
+try:
+    import fasttext
+    FASTTEXT_AVAILABLE = True
+except ImportError:
+    FASTTEXT_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Predictions below this probability are reported as undetermined
+LANGID_MIN_CONFIDENCE = 0.5
+# Display names for the languages users are expected to query in; others are returned as ISO codes
+LANGUAGE_NAMES = {"en": "English", "hi": "Hindi", "te": "Telugu", "ta": "Tamil", "kn": "Kannada"}
+
+# Reciprocal rank fusion: rank offset and per-source weights (dense, sparse)
+RRF_K = 60
+DENSE_WEIGHT = 1.0
+SPARSE_WEIGHT = 1.0
+
+
+def reciprocal_rank_fusion(
+    ranked_lists: Sequence[List[str]], weights: Sequence[float], top_k: int, k: int = RRF_K
+) -> List[Tuple[str, float]]:
+    """
+    Fuse ranked ID lists with weighted reciprocal rank fusion.
+
+    Each list contributes weight / (k + rank) to every ID it contains (rank
+    starting at 1). Only the best top_k fused scores are selected and sorted.
+
+    Args:
+        ranked_lists: Document IDs per source, best first
+        weights: One weight per source
+        top_k: Number of results to return
+        k: Rank offset damping the influence of top positions
+
+    Returns:
+        (doc_id, score) pairs, best first
+    """
+    scores: Dict[str, float] = {}
+    for ids, weight in zip(ranked_lists, weights):
+        for rank, doc_id in enumerate(ids, start=1):
+            scores[doc_id] = scores.get(doc_id, 0.0) + weight / (k + rank)
+    if not scores or top_k <= 0:
+        return []
+
+    ids_arr = list(scores)
+    score_arr = np.fromiter(scores.values(), dtype=np.float64, count=len(scores))
+    n = min(top_k, len(ids_arr))
+    top = np.argpartition(-score_arr, n - 1)[:n]
+    top = top[np.argsort(-score_arr[top], kind="stable")]
+    return [(ids_arr[i], float(score_arr[i])) for i in top]
+
 class RetrievalService:
     """Service for document retrieval using Pinecone vector database"""
     
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize retrieval service with Pinecone integration"""
-        self.vector_service = PineconeService()
+        # Shared with every other RetrievalService in the process
+        self.vector_service = get_pinecone_service()
+        self.langid_model = self._load_langid_model()
         
         logger.info("RetrievalService initialized with Pinecone integration")
     
+    def _load_langid_model(self) -> Optional[Any]:
+        """Load the fastText language identification model, or None if unavailable."""
+        if not FASTTEXT_AVAILABLE:
+            logger.warning("fasttext not installed, using keyword heuristic for language detection")
+            return None
+        model_path = os.getenv("LANGID_MODEL_PATH", "lid.176.ftz")
+        try:
+            return fasttext.load_model(model_path)
+        except Exception as e:
+            logger.warning(f"Could not load language ID model {model_path}: {e}")
+            return None
+    
+    def _predict_language(self, query: str) -> str:
+        """Run the fastText classifier (blocking; called via asyncio.to_thread)."""
+        assert self.langid_model is not None  # only called once the model has loaded
+        # fastText predicts one line at a time
+        labels, probs = self.langid_model.predict(query.replace("\n", " "), k=1)
+        if not labels or probs[0] < LANGID_MIN_CONFIDENCE:
+            return "N/A"
+        code: str = labels[0].removeprefix("__label__")
+        return LANGUAGE_NAMES.get(code, code)
+    
     async def detect_language(self, query: str) -> str:
         """
         Detect the language of the input query.
         
-        TODO: Implement actual language detection using:
-        - langdetect library
-        - spaCy language models
-        - Custom language classifier
+        Uses the fastText lid.176 model (LANGID_MODEL_PATH) when available,
+        otherwise a keyword heuristic that only recognizes English.
         """
         logger.info(f"Detecting language for query: {query[:50]}...")
         
-        # Placeholder implementation
-        await asyncio.sleep(0.1)  # Simulate processing time
-        
-        # Simple heuristic for demonstration
-        if any(word in query.lower() for word in ['admission', 'policy', 'education', 'university']):
+        if self.langid_model is not None:
+            detected_language = await asyncio.to_thread(self._predict_language, query)
+        elif any(word in query.lower() for word in ['admission', 'policy', 'education', 'university']):
             detected_language = "English"
         else:
             detected_language = "N/A"
@@ -75,36 +146,30 @@ class RetrievalService:
     
     async def sparse_retrieval(self, query: str, top_k: int = 10) -> List[str]:
         """
-        Perform sparse retrieval using keyword matching and BM25 scoring.
+        Perform sparse retrieval using BM25 keyword scoring.
         
-        TODO: Implement actual sparse retrieval:
-        1. Tokenize and preprocess query
-        2. Search Elasticsearch index using BM25
-        3. Apply query expansion and synonyms
-        4. Return ranked document IDs and scores
+        Queries the BM25 sparse values stored in the Pinecone index (a hybrid
+        query with alpha=0). Without them (PINECONE_HYBRID disabled), scores
+        the stored documents with the vector service's in-process BM25 index.
+        
+        Args:
+            query: Search query text
+            top_k: Number of results to return
+            
+        Returns:
+            List of document IDs
         """
         logger.info(f"Performing sparse retrieval for query: {query[:50]}...")
         
-        # Placeholder implementation
-        await asyncio.sleep(0.15)  # Simulate processing time
-        
-        # TODO: Actual implementation would be:
-        # 1. query_tokens = self.preprocess_query(query)
-        # 2. results = self.elasticsearch_client.search(
-        #     index="policy_documents",
-        #     body={
-        #         "query": {
-        #             "multi_match": {
-        #                 "query": query,
-        #                 "fields": ["title^2", "content", "metadata.*"]
-        #             }
-        #         },
-        #         "size": top_k
-        #     }
-        # )
-        # 3. return [hit["_id"] for hit in results["hits"]["hits"]]
-        
-        sparse_candidates = []  # Placeholder: no candidates found
+        sparse_candidates = []
+        try:
+            if self.vector_service.supports_hybrid:
+                results = await self.vector_service.hybrid_search(query, top_k, alpha=0.0)
+                sparse_candidates = [doc['id'] for doc in results]
+            else:
+                sparse_candidates = await self.vector_service.keyword_search(query, top_k)
+        except Exception as e:
+            logger.error(f"Error in sparse retrieval: {e}")
         
         logger.info(f"Sparse retrieval found {len(sparse_candidates)} candidates")
         return sparse_candidates
@@ -113,28 +178,57 @@ class RetrievalService:
         """
         Combine dense and sparse retrieval results using hybrid ranking.
         
-        TODO: Implement hybrid ranking algorithm:
-        1. Get dense and sparse results separately
-        2. Apply reciprocal rank fusion (RRF)
-        3. Combine scores with learned weights
-        4. Re-rank and return final results
+        When the Pinecone index stores sparse values, this is a single
+        sparse-dense query and Pinecone ranks the combined scores server-side.
+        Otherwise dense and in-process BM25 results are fetched concurrently and
+        fused with weighted reciprocal rank fusion.
+        
+        Args:
+            query: Search query text
+            top_k: Number of results to return
+            
+        Returns:
+            Documents (id, content, metadata, score), best first
         """
         logger.info(f"Performing hybrid retrieval for query: {query[:50]}...")
         
-        # Get both dense and sparse results
-        dense_results = await self.dense_retrieval(query, top_k)
-        sparse_results = await self.sparse_retrieval(query, top_k)
-        
-        # Placeholder hybrid ranking
-        await asyncio.sleep(0.1)  # Simulate processing time
+        if self.vector_service.supports_hybrid:
+            try:
+                hybrid_results = await self.vector_service.hybrid_search(query, top_k)
+            except Exception as e:
+                logger.error(f"Error in hybrid retrieval: {e}")
+                hybrid_results = []
+            logger.info(f"Hybrid retrieval found {len(hybrid_results)} results")
+            return hybrid_results
         
-        # TODO: Implement actual hybrid ranking:
-        # 1. Create document score map
-        # 2. Apply RRF formula: score = 1 / (rank + k)
-        # 3. Combine and normalize scores
-        # 4. Return ranked results with metadata
+        # Run dense and sparse retrieval concurrently; a failure in one backend
+        # must not cancel or discard the other's results
+        dense_results, sparse_results = await asyncio.gather(
+            self.dense_retrieval(query, top_k),
+            self.sparse_retrieval(query, top_k),
+            return_exceptions=True,
+        )
+        for outcome in (dense_results, sparse_results):
+            if isinstance(outcome, asyncio.CancelledError):
+                raise outcome
+        if isinstance(dense_results, BaseException):
+            logger.error(f"Dense retrieval failed during hybrid retrieval: {dense_results}")
+            dense_results = []
+        if isinstance(sparse_results, BaseException):
+            logger.error(f"Sparse retrieval failed during hybrid retrieval: {sparse_results}")
+            sparse_results = []
         
-        hybrid_results = []  # Placeholder: no results
+        fused = reciprocal_rank_fusion(
+            [dense_results, sparse_results], [DENSE_WEIGHT, SPARSE_WEIGHT], top_k
+        )
+        hybrid_results = []
+        if fused:
+            try:
+                docs = await self.vector_service.get_documents([doc_id for doc_id, _ in fused])
+                fused_scores = dict(fused)
+                hybrid_results = [{**doc, "score": fused_scores[doc["id"]]} for doc in docs]
+            except Exception as e:
+                logger.error(f"Error loading hybrid retrieval results: {e}")
         
         logger.info(f"Hybrid retrieval found {len(hybrid_results)} results")
         return hybrid_results
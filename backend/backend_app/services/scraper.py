@@ -18,105 +18,308 @@ Features:
 """
 
 import asyncio
+import importlib.util
+import io
 import logging
+import multiprocessing
 import re
+import shutil
+import tempfile
+import threading
 import time
-from typing import Dict, List, Optional, Any, Union
+from functools import lru_cache
+from typing import IO, TYPE_CHECKING, AsyncIterator, Dict, Iterable, List, Optional, Any, Set, Tuple, Union
 from urllib.parse import urljoin, urlparse
 from datetime import datetime
 import json
 import os
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from types import MappingProxyType, SimpleNamespace
 
-# Core scraping libraries
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-from bs4 import BeautifulSoup
-import PyPDF2
-import pdfplumber
+# Core scraping libraries (the PDF parsers are imported on first use)
+import httpx
+from bs4 import BeautifulSoup, Tag
 
-# Advanced scraping libraries
-try:
+if TYPE_CHECKING:
     from selenium import webdriver
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    from selenium.webdriver.chrome.options import Options as ChromeOptions
-    from selenium.webdriver.firefox.options import Options as FirefoxOptions
-    from selenium.common.exceptions import TimeoutException, WebDriverException
-    SELENIUM_AVAILABLE = True
+    from playwright.async_api import Browser
+
+# Advanced scraping libraries: both are slow to import and unused by most
+# scrapes, so availability is probed without importing them
+SELENIUM_AVAILABLE = importlib.util.find_spec('selenium') is not None
+PLAYWRIGHT_AVAILABLE = importlib.util.find_spec('playwright') is not None
+
+# selectolax (lexbor HTML engine in C) is optional; BeautifulSoup + lxml is the fallback
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
 except ImportError:
-    SELENIUM_AVAILABLE = False
+    SELECTOLAX_AVAILABLE = False
 
+# HTTP/2 lets concurrent scrapes of one host share a single connection
 try:
-    from playwright.async_api import async_playwright, Browser, Page
-    PLAYWRIGHT_AVAILABLE = True
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
 except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
+    HTTP2_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Shared HTTP client: per-request timeout and connection pool bounds
+HTTP_TIMEOUT = 30.0
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+# Connection failures are retried by the transport; these statuses are retried
+# with exponential backoff (1s, 2s, 4s)
+HTTP_RETRIES = 3
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_BACKOFF = 1.0
+# Requests in flight per host; with HTTP/2 they share one multiplexed connection
+HTTP_PER_HOST = 6
+
+# Browser contexts (pages) open at once in the shared Playwright browser
+PLAYWRIGHT_MAX_CONTEXTS = 5
+# Chrome drivers kept running for Selenium scrapes
+SELENIUM_POOL_SIZE = 3
+# PDFs with at least this many pages have their text extracted in a process pool
+PDF_PARALLEL_MIN_PAGES = 4
+PDF_WORKERS = os.cpu_count() or 1
+# PDFs are streamed to a spooled temp file: kept in memory up to PDF_SPOOL_BYTES,
+# moved to disk beyond that, and rejected above PDF_MAX_SIZE_MB
+PDF_SPOOL_BYTES = 8 * 1024 * 1024
+MAX_PDF_BYTES = int(os.getenv('PDF_MAX_SIZE_MB', '50')) * 1024 * 1024
+# In-memory PDFs are parsed by pdfplumber and pypdfium2 at once; the first result
+# with at least this much text wins, otherwise the longer text is kept
+PDF_MIN_TEXT_CHARS = 50
+
+# URLs whose validity and scraping method are memoized (batches revisit the same pages)
+URL_CACHE_SIZE = 4096
+
+# Number of content characters kept in ScrapedContent.preview
+PREVIEW_LENGTH = 1000
+
+USER_AGENTS = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+)
+
+# Request headers for plain HTTP scrapes (read-only, shared by every request)
+_DEFAULT_HEADERS = MappingProxyType({
+    'User-Agent': USER_AGENTS[0],
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+})
+
+# Command-line switches for pooled headless Chrome drivers
+_CHROME_OPTIONS_ARGS = (
+    '--headless',
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-web-security',
+    '--disable-features=VizDisplayCompositor',
+    '--window-size=1920,1080',
+    '--disable-extensions',
+    '--disable-plugins',
+    '--disable-images',
+    f'--user-agent={USER_AGENTS[0]}',
+    # Additional options for Docker environment
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+    '--disable-features=TranslateUI',
+    '--disable-ipc-flooding-protection',
+)
+
+# Government website patterns
+GOV_PATTERNS = {
+    'indiacode': r'indiacode\.nic\.in',
+    'ugc': r'ugc\.gov\.in',
+    'aicte': r'aicte-india\.org',
+    'education': r'education\.gov\.in',
+    'egazette': r'egazette\.nic\.in'
+}
+
+# PDF patterns
+PDF_PATTERNS = [
+    r'\.pdf$',
+    r'/pdf/',
+    r'download.*\.pdf',
+    r'document.*\.pdf'
+]
+
+# Legal reference patterns (act numbers, section numbers, etc.)
+ACT_PATTERNS = [
+    r'Act No\.?\s*\d+',
+    r'Section\s+\d+',
+    r'Rule\s+\d+',
+    r'Regulation\s+\d+'
+]
+
+# Compiled once at import instead of on every scraped page
+_GOV_RE = re.compile('|'.join(f'(?:{p})' for p in GOV_PATTERNS.values()), re.IGNORECASE)
+_PDF_RE = re.compile('|'.join(f'(?:{p})' for p in PDF_PATTERNS), re.IGNORECASE)
+_ACT_RE = re.compile('|'.join(f'(?:{p})' for p in ACT_PATTERNS), re.IGNORECASE)
+_WS_RE = re.compile(r'\s+')
+
+# Page sections dropped before extracting text, links and images
+REMOVED_TAGS = frozenset({"script", "style", "nav", "footer", "header"})
+_STRIP_RE = re.compile(r'[^\w\s\.\,\!\?\;\:\-\(\)\[\]\"\']')
+
+@dataclass(slots=True)
 class ScrapedContent:
     """Structured representation of scraped content"""
     url: str
     title: str
     content: str
-    images: List[str]
-    links: List[str]
-    pdfs: List[str]
+    images: Tuple[str, ...]
+    links: Tuple[str, ...]
+    pdfs: Tuple[str, ...]
     metadata: Dict[str, Any]
     timestamp: datetime
     status: str
     method_used: str
     processing_time: float
+    preview: str = ''
+    # Exception behind status='error', for callers deciding whether to retry; not serialized
+    error: Optional[Exception] = None
+    
+    def __post_init__(self) -> None:
+        # Truncated content for list responses, built once when the scrape finishes
+        if not self.preview:
+            if len(self.content) > PREVIEW_LENGTH:
+                self.preview = self.content[:PREVIEW_LENGTH] + '...'
+            else:
+                self.preview = self.content
+    
+    def to_dict(self, preview: bool = False) -> Dict[str, Any]:
+        """
+        Response-ready dict of the scraped fields.
+        
+        Args:
+            preview: Use the truncated preview instead of the full content
+        """
+        # timestamp stays a datetime; orjson serializes it natively
+        return {
+            'url': self.url,
+            'title': self.title,
+            'content': self.preview if preview else self.content,
+            'images': self.images,
+            'links': self.links,
+            'pdfs': self.pdfs,
+            'metadata': self.metadata,
+            'timestamp': self.timestamp,
+            'status': self.status,
+            'method_used': self.method_used,
+            'processing_time': self.processing_time
+        }
+
+# PDFium must not be entered from two threads at once, even for different documents
+_PDFIUM_LOCK = threading.Lock()
+
+def _pdf_metadata(info: Dict[str, Any]) -> Dict[str, str]:
+    """Normalize a PDF document-info dict (either parser) to our metadata keys"""
+    return {
+        'title': info.get('Title', ''),
+        'author': info.get('Author', ''),
+        'subject': info.get('Subject', ''),
+        'creator': info.get('Creator', ''),
+        'producer': info.get('Producer', ''),
+        'creation_date': str(info.get('CreationDate', '')),
+        'modification_date': str(info.get('ModDate', ''))
+    }
+
+@lru_cache(maxsize=1)
+def _selenium() -> SimpleNamespace:
+    """Import the Selenium names the scraper uses, on the first Selenium scrape"""
+    from selenium import webdriver
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.chrome.options import Options as ChromeOptions
+    from selenium.common.exceptions import TimeoutException, WebDriverException
+    return SimpleNamespace(
+        webdriver=webdriver, WebDriverWait=WebDriverWait, ChromeOptions=ChromeOptions,
+        TimeoutException=TimeoutException, WebDriverException=WebDriverException,
+    )
+
+def _extract_page_range(args: Tuple[str, int, int]) -> List[Optional[str]]:
+    """Process-pool worker: reopen the PDF file and extract text for pages [start, stop)"""
+    import pdfplumber
+    
+    path, start, stop = args
+    with pdfplumber.open(path) as pdf:
+        return [pdf.pages[i].extract_text() for i in range(start, stop)]
 
 class AdvancedWebScraper:
     """Advanced web scraper with multiple strategies and fallbacks"""
     
-    def __init__(self):
-        self.session = self._create_session()
-        self.user_agents = [
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        ]
-        self.browser = None
-        self.playwright_browser = None
-        
-        # Government website patterns
-        self.gov_patterns = {
-            'indiacode': r'indiacode\.nic\.in',
-            'ugc': r'ugc\.gov\.in',
-            'aicte': r'aicte-india\.org',
-            'education': r'education\.gov\.in',
-            'egazette': r'egazette\.nic\.in'
-        }
-        
-        # PDF patterns
-        self.pdf_patterns = [
-            r'\.pdf$',
-            r'/pdf/',
-            r'download.*\.pdf',
-            r'document.*\.pdf'
-        ]
-        
-    def _create_session(self) -> requests.Session:
-        """Create requests session with retry strategy"""
-        session = requests.Session()
-        
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
+    def __init__(self) -> None:
+        # One pooled client for all requests; closed by close()
+        self._client = httpx.AsyncClient(
+            timeout=HTTP_TIMEOUT,
+            follow_redirects=True,
+            transport=httpx.AsyncHTTPTransport(
+                retries=HTTP_RETRIES, limits=HTTP_LIMITS, http2=HTTP2_AVAILABLE
+            ),
         )
+        self.user_agents = list(USER_AGENTS)
+        # Per-host request slots, keyed by netloc
+        self._host_slots: Dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(HTTP_PER_HOST)
+        )
+        # Idle Selenium drivers, started on demand up to SELENIUM_POOL_SIZE
+        self._idle_drivers: List[Any] = []
+        self._driver_slots = asyncio.Semaphore(SELENIUM_POOL_SIZE)
+        # Process pool for PDF text extraction, created on the first large PDF
+        self._pdf_pool: Optional[ProcessPoolExecutor] = None
+        # Playwright driver and Chromium, launched on first use and shared by all scrapes
+        self.playwright: Optional[Any] = None
+        self.playwright_browser: Optional[Any] = None
+        self._playwright_lock = asyncio.Lock()
+        self._playwright_slots = asyncio.Semaphore(PLAYWRIGHT_MAX_CONTEXTS)
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        
-        return session
+    async def startup(self) -> None:
+        """
+        Start the browser that auto mode uses for government sites, so the first
+        dynamic scrape does not pay the launch cost. Failures are logged and the
+        browser is started on first use instead.
+        """
+        method = self._determine_scraping_method('https://www.ugc.gov.in/')
+        try:
+            if method == 'selenium':
+                await self._release_driver(await self._acquire_driver())
+            elif method == 'playwright':
+                await self._ensure_playwright()
+        except Exception as e:
+            logger.warning(f"Could not pre-start {method} browser: {e}")
+    
+    async def close(self) -> None:
+        """Close the pooled HTTP client, Selenium drivers and the shared Playwright browser"""
+        await self._client.aclose()
+        while self._idle_drivers:
+            await self._quit_driver(self._idle_drivers.pop())
+        if self._pdf_pool is not None:
+            self._pdf_pool.shutdown(wait=False, cancel_futures=True)
+            self._pdf_pool = None
+        if self.playwright_browser is not None:
+            await self.playwright_browser.close()
+            self.playwright_browser = None
+        if self.playwright is not None:
+            await self.playwright.stop()
+            self.playwright = None
+    
+    async def _get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """GET through the shared client, retrying throttled and server-error responses"""
+        attempt = 0
+        while True:
+            async with self._host_slots[urlparse(url).netloc]:
+                response = await self._client.get(url, **kwargs)
+            if response.status_code not in RETRY_STATUSES or attempt == HTTP_RETRIES:
+                return response
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+            attempt += 1
     
     async def scrape_url(self, url: str, method: str = 'auto') -> ScrapedContent:
         """
@@ -158,9 +361,9 @@ class AdvancedWebScraper:
                 url=url,
                 title=content.get('title', ''),
                 content=content.get('content', ''),
-                images=content.get('images', []),
-                links=content.get('links', []),
-                pdfs=content.get('pdfs', []),
+                images=tuple(content.get('images', ())),
+                links=tuple(content.get('links', ())),
+                pdfs=tuple(content.get('pdfs', ())),
                 metadata=content.get('metadata', {}),
                 timestamp=datetime.now(),
                 status='success',
@@ -176,53 +379,41 @@ class AdvancedWebScraper:
                 url=url,
                 title='Error',
                 content=f'Scraping failed: {str(e)}',
-                images=[],
-                links=[],
-                pdfs=[],
+                images=(),
+                links=(),
+                pdfs=(),
                 metadata={},
                 timestamp=datetime.now(),
                 status='error',
                 method_used=method,
-                processing_time=processing_time
+                processing_time=processing_time,
+                error=e
             )
     
-    def _determine_scraping_method(self, url: str) -> str:
-        """Determine the best scraping method for a URL"""
+    @staticmethod
+    @lru_cache(maxsize=URL_CACHE_SIZE)
+    def _determine_scraping_method(url: str) -> str:
+        """Determine the best scraping method for a URL (repeated URLs come from cache)"""
         
         # Check if it's a PDF
-        if any(re.search(pattern, url, re.IGNORECASE) for pattern in self.pdf_patterns):
+        if _PDF_RE.search(url):
             return 'pdf'
         
         # Check if it's a government website that might need dynamic handling
-        for pattern_name, pattern in self.gov_patterns.items():
-            if re.search(pattern, url, re.IGNORECASE):
-                # Government sites often use dynamic content
-                return 'selenium' if SELENIUM_AVAILABLE else 'playwright' if PLAYWRIGHT_AVAILABLE else 'requests'
+        if _GOV_RE.search(url):
+            # Government sites often use dynamic content
+            return 'selenium' if SELENIUM_AVAILABLE else 'playwright' if PLAYWRIGHT_AVAILABLE else 'requests'
         
         # Default to requests for simple sites
         return 'requests'
     
     async def _scrape_with_requests(self, url: str) -> Dict[str, Any]:
-        """Scrape using requests + BeautifulSoup"""
-        headers = {
-            'User-Agent': self.user_agents[0],
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-        }
-        
-        response = self.session.get(url, headers=headers, timeout=30)
+        """Scrape using the shared HTTP client + BeautifulSoup"""
+        response = await self._get(url, headers=_DEFAULT_HEADERS)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Extract content
-        title = self._extract_title(soup)
-        content = self._extract_text_content(soup)
-        images = self._extract_images(soup, url)
-        links = self._extract_links(soup, url)
-        pdfs = self._extract_pdfs(soup, url)
+        # Raw bytes: the parser detects the charset itself
+        title, content, images, links, pdfs = self._parse_and_extract(response.content, url)
         
         return {
             'title': title,
@@ -242,99 +433,117 @@ class AdvancedWebScraper:
         if not SELENIUM_AVAILABLE:
             raise ImportError("Selenium not available")
         
-        options = ChromeOptions()
-        options.add_argument('--headless')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--disable-web-security')
-        options.add_argument('--disable-features=VizDisplayCompositor')
-        options.add_argument('--window-size=1920,1080')
-        options.add_argument('--remote-debugging-port=9222')
-        options.add_argument('--disable-extensions')
-        options.add_argument('--disable-plugins')
-        options.add_argument('--disable-images')
-        options.add_argument(f'--user-agent={self.user_agents[0]}')
-        
-        # Additional options for Docker environment
-        options.add_argument('--disable-background-timer-throttling')
-        options.add_argument('--disable-backgrounding-occluded-windows')
-        options.add_argument('--disable-renderer-backgrounding')
-        options.add_argument('--disable-features=TranslateUI')
-        options.add_argument('--disable-ipc-flooding-protection')
-        
-        driver = None
+        selenium = _selenium()
+        driver = await self._acquire_driver()
         try:
-            driver = webdriver.Chrome(options=options)
-            driver.get(url)
-            
-            # Wait for page to load
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            
-            # Additional wait for dynamic content
-            time.sleep(2)
-            
-            # Get page source
-            page_source = driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
-            
-            # Extract content
-            title = self._extract_title(soup)
-            content = self._extract_text_content(soup)
-            images = self._extract_images(soup, url)
-            links = self._extract_links(soup, url)
-            pdfs = self._extract_pdfs(soup, url)
-            
-            return {
-                'title': title,
-                'content': content,
-                'images': images,
-                'links': links,
-                'pdfs': pdfs,
-                'metadata': {
-                    'method': 'selenium',
-                    'page_title': driver.title,
-                    'current_url': driver.current_url
-                }
+            # The WebDriver API is fully synchronous, so drive it from a worker thread
+            result = await asyncio.to_thread(self._scrape_with_selenium_sync, driver, url)
+        except selenium.TimeoutException:
+            # A slow page, not a broken browser
+            await self._release_driver(driver)
+            raise
+        except (selenium.WebDriverException, asyncio.CancelledError):
+            # The browser may be unusable or still busy in the worker thread; replace it
+            await self._discard_driver(driver)
+            raise
+        except Exception:
+            await self._release_driver(driver)
+            raise
+        await self._release_driver(driver)
+        return result
+    
+    async def _acquire_driver(self) -> "webdriver.Chrome":
+        """Take an idle pooled driver, starting a new one if none is idle"""
+        # One slot per driver in use, so at most SELENIUM_POOL_SIZE browsers run
+        await self._driver_slots.acquire()
+        if self._idle_drivers:
+            return self._idle_drivers.pop()
+        try:
+            return await asyncio.to_thread(self._create_chrome_driver)
+        except BaseException:
+            self._driver_slots.release()
+            raise
+    
+    async def _release_driver(self, driver: "webdriver.Chrome") -> None:
+        """Clear the driver's session state and return it to the pool"""
+        try:
+            await asyncio.to_thread(driver.delete_all_cookies)
+        except _selenium().WebDriverException:
+            await self._discard_driver(driver)
+            return
+        self._idle_drivers.append(driver)
+        self._driver_slots.release()
+    
+    async def _discard_driver(self, driver: "webdriver.Chrome") -> None:
+        """Quit an in-use driver and free its pool slot"""
+        self._driver_slots.release()
+        await self._quit_driver(driver)
+    
+    async def _quit_driver(self, driver: "webdriver.Chrome") -> None:
+        try:
+            await asyncio.to_thread(driver.quit)
+        except Exception as e:
+            logger.warning(f"Error quitting Selenium driver: {e}")
+    
+    def _create_chrome_driver(self) -> "webdriver.Chrome":
+        """Start a headless Chrome driver (blocking)"""
+        selenium = _selenium()
+        options = selenium.ChromeOptions()
+        for arg in _CHROME_OPTIONS_ARGS:
+            options.add_argument(arg)
+        
+        logger.info("Starting pooled Selenium Chrome driver")
+        return selenium.webdriver.Chrome(options=options)
+    
+    def _scrape_with_selenium_sync(self, driver: "webdriver.Chrome", url: str) -> Dict[str, Any]:
+        """Blocking Selenium scrape with a pooled driver, run via asyncio.to_thread"""
+        driver.get(url)
+        
+        # Wait until the document and its subresources have finished loading,
+        # instead of a fixed sleep after <body> appears
+        _selenium().WebDriverWait(driver, 10).until(
+            lambda d: d.execute_script('return document.readyState') == 'complete'
+        )
+        
+        # Get page source
+        page_source = driver.page_source
+        # Extract content
+        title, content, images, links, pdfs = self._parse_and_extract(page_source, url)
+        
+        return {
+            'title': title,
+            'content': content,
+            'images': images,
+            'links': links,
+            'pdfs': pdfs,
+            'metadata': {
+                'method': 'selenium',
+                'page_title': driver.title,
+                'current_url': driver.current_url
             }
-            
-        finally:
-            if driver:
-                driver.quit()
+        }
     
     async def _scrape_with_playwright(self, url: str) -> Dict[str, Any]:
         """Scrape using Playwright for modern web applications"""
         if not PLAYWRIGHT_AVAILABLE:
             raise ImportError("Playwright not available")
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
+        browser = await self._ensure_playwright()
+        async with self._playwright_slots:
+            # A fresh context per URL isolates cookies and storage at a fraction
+            # of the cost of launching a browser
+            context = await browser.new_context(user_agent=self.user_agents[0])
             
             try:
-                # Set user agent
-                await page.set_extra_http_headers({
-                    'User-Agent': self.user_agents[0]
-                })
+                page = await context.new_page()
                 
-                # Navigate to page
+                # Navigate to page; networkidle already implies domcontentloaded
                 await page.goto(url, wait_until='networkidle')
                 
-                # Wait for content to load
-                await page.wait_for_load_state('domcontentloaded')
-                
                 # Get page content
                 content = await page.content()
-                soup = BeautifulSoup(content, 'html.parser')
-                
                 # Extract content
-                title = self._extract_title(soup)
-                text_content = self._extract_text_content(soup)
-                images = self._extract_images(soup, url)
-                links = self._extract_links(soup, url)
-                pdfs = self._extract_pdfs(soup, url)
+                title, text_content, images, links, pdfs = self._parse_and_extract(content, url)
                 
                 return {
                     'title': title,
@@ -350,140 +559,371 @@ class AdvancedWebScraper:
                 }
                 
             finally:
-                await browser.close()
+                await context.close()
+    
+    async def _ensure_playwright(self) -> "Browser":
+        """Start Playwright and launch Chromium once, relaunching if the browser went away"""
+        async with self._playwright_lock:
+            if self.playwright_browser is None or not self.playwright_browser.is_connected():
+                if self.playwright is None:
+                    from playwright.async_api import async_playwright
+                    self.playwright = await async_playwright().start()
+                self.playwright_browser = await self.playwright.chromium.launch(headless=True)
+                logger.info("Launched shared Playwright browser")
+            return self.playwright_browser
     
     async def _scrape_pdf(self, url: str) -> Dict[str, Any]:
         """Extract content from PDF documents"""
         try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            
-            # Try pdfplumber first (better for complex layouts)
+            pdf_file = await self._download_pdf(url)
             try:
-                import io
-                pdf_file = io.BytesIO(response.content)
-                
-                with pdfplumber.open(pdf_file) as pdf:
-                    text_content = ""
-                    metadata = {}
-                    
-                    # Extract text from all pages
-                    for page in pdf.pages:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text_content += page_text + "\n"
-                    
-                    # Extract metadata
-                    if pdf.metadata:
-                        metadata = {
-                            'title': pdf.metadata.get('Title', ''),
-                            'author': pdf.metadata.get('Author', ''),
-                            'subject': pdf.metadata.get('Subject', ''),
-                            'creator': pdf.metadata.get('Creator', ''),
-                            'producer': pdf.metadata.get('Producer', ''),
-                            'creation_date': str(pdf.metadata.get('CreationDate', '')),
-                            'modification_date': str(pdf.metadata.get('ModDate', ''))
-                        }
-                
-                return {
-                    'title': metadata.get('title', url.split('/')[-1]),
-                    'content': text_content.strip(),
-                    'images': [],
-                    'links': [],
-                    'pdfs': [url],
-                    'metadata': {
-                        'method': 'pdf',
-                        'pdf_metadata': metadata,
-                        'page_count': len(pdf.pages) if 'pdf' in locals() else 0
-                    }
-                }
-                
-            except Exception as e:
-                logger.warning(f"pdfplumber failed, trying PyPDF2: {e}")
-                
-                # Fallback to PyPDF2
-                pdf_file = io.BytesIO(response.content)
-                pdf_reader = PyPDF2.PdfReader(pdf_file)
-                
-                text_content = ""
-                for page in pdf_reader.pages:
-                    text_content += page.extract_text() + "\n"
-                
-                return {
-                    'title': url.split('/')[-1],
-                    'content': text_content.strip(),
-                    'images': [],
-                    'links': [],
-                    'pdfs': [url],
-                    'metadata': {
-                        'method': 'pdf_pypdf2',
-                        'page_count': len(pdf_reader.pages)
-                    }
-                }
-                
+                size = pdf_file.seek(0, os.SEEK_END)
+                pdf_file.seek(0)
+                if size <= PDF_SPOOL_BYTES:
+                    return await self._race_pdf_parsers(url, pdf_file.read())
+                # PDF parsing is CPU-bound; keep it off the event loop
+                return await asyncio.to_thread(self._extract_pdf_content, url, pdf_file)
+            finally:
+                pdf_file.close()
+            
         except Exception as e:
             raise Exception(f"PDF processing failed: {str(e)}")
     
-    def _extract_title(self, soup: BeautifulSoup) -> str:
-        """Extract page title"""
-        title_tag = soup.find('title')
-        if title_tag:
-            return title_tag.get_text().strip()
-        
-        # Try h1 tag as fallback
-        h1_tag = soup.find('h1')
-        if h1_tag:
-            return h1_tag.get_text().strip()
-        
-        return "Untitled"
-    
-    def _extract_text_content(self, soup: BeautifulSoup) -> str:
-        """Extract main text content from page"""
-        # Remove script and style elements
-        for script in soup(["script", "style", "nav", "footer", "header"]):
-            script.decompose()
-        
-        # Get text content
-        text = soup.get_text()
-        
-        # Clean up text
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
-        
-        return text
-    
-    def _extract_images(self, soup: BeautifulSoup, base_url: str) -> List[str]:
-        """Extract image URLs from page"""
-        images = []
-        for img in soup.find_all('img'):
-            src = img.get('src')
-            if src:
-                # Convert relative URLs to absolute
-                absolute_url = urljoin(base_url, src)
-                images.append(absolute_url)
-        return images
-    
-    def _extract_links(self, soup: BeautifulSoup, base_url: str) -> List[str]:
-        """Extract links from page"""
-        links = []
-        for link in soup.find_all('a', href=True):
-            href = link.get('href')
-            if href:
-                # Convert relative URLs to absolute
-                absolute_url = urljoin(base_url, href)
-                links.append(absolute_url)
-        return links
-    
-    def _extract_pdfs(self, soup: BeautifulSoup, base_url: str) -> List[str]:
-        """Extract PDF links from page"""
-        pdfs = []
-        for link in soup.find_all('a', href=True):
-            href = link.get('href')
-            if href and any(re.search(pattern, href, re.IGNORECASE) for pattern in self.pdf_patterns):
+    async def _race_pdf_parsers(self, url: str, data: bytes) -> Dict[str, Any]:
+        """
+        Run pdfplumber and pypdfium2 concurrently and keep the first usable result.
+        
+        pypdfium2 usually wins on well-formed PDFs, pdfplumber on complex layouts.
+        A result with less than PDF_MIN_TEXT_CHARS of text (e.g. a scanned page
+        that one parser handles badly) waits for the other parser.
+        
+        Args:
+            url: Source URL of the PDF
+            data: The downloaded PDF
+        """
+        cancel = threading.Event()
+        pending = {
+            asyncio.create_task(asyncio.to_thread(self._extract_with_pdfium, url, data)),
+            asyncio.create_task(asyncio.to_thread(self._extract_with_pdfplumber, url, io.BytesIO(data), cancel)),
+        }
+        best: Optional[Dict[str, Any]] = None
+        error: Optional[Exception] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        logger.warning(f"PDF parser failed for {url}: {e}")
+                        error = e
+                        continue
+                    if len(result['content']) >= PDF_MIN_TEXT_CHARS:
+                        return result
+                    if best is None or len(result['content']) > len(best['content']):
+                        best = result
+        finally:
+            # Threads cannot be killed; pdfplumber stops at its next page
+            cancel.set()
+            for task in pending:
+                task.cancel()
+        if best is None:
+            assert error is not None  # each parser either failed or produced a result
+            raise error
+        return best
+    
+    async def _download_pdf(self, url: str) -> IO[bytes]:
+        """Stream a PDF into a spooled temp file, rejecting HTML and oversized responses"""
+        attempt = 0
+        while True:
+            async with (
+                self._host_slots[urlparse(url).netloc],
+                self._client.stream('GET', url) as response,
+            ):
+                if response.status_code not in RETRY_STATUSES or attempt == HTTP_RETRIES:
+                    response.raise_for_status()
+                    # Decide from the headers before reading the body
+                    content_type = response.headers.get('Content-Type', '')
+                    if content_type.startswith('text/html'):
+                        raise ValueError(f"Expected a PDF, got {content_type}")
+                    declared = int(response.headers.get('Content-Length') or 0)
+                    if declared > MAX_PDF_BYTES:
+                        raise ValueError(f"PDF too large: {declared} bytes")
+                    
+                    pdf_file = tempfile.SpooledTemporaryFile(max_size=PDF_SPOOL_BYTES)
+                    try:
+                        size = 0
+                        async for chunk in response.aiter_bytes():
+                            size += len(chunk)
+                            if size > MAX_PDF_BYTES:
+                                raise ValueError(f"PDF exceeds {MAX_PDF_BYTES} bytes")
+                            pdf_file.write(chunk)
+                    except BaseException:
+                        pdf_file.close()
+                        raise
+                    pdf_file.seek(0)
+                    return pdf_file
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+            attempt += 1
+    
+    def _extract_pages_parallel(self, pdf_file: IO[bytes], page_count: int) -> List[Optional[str]]:
+        """Extract page texts in the PDF process pool, one contiguous page range per worker (blocking)"""
+        if self._pdf_pool is None:
+            # spawn, not fork: the server process runs threads
+            self._pdf_pool = ProcessPoolExecutor(
+                max_workers=PDF_WORKERS, mp_context=multiprocessing.get_context('spawn')
+            )
+        # Workers reopen the document from a named file instead of each receiving a copy of it
+        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp:
+            pdf_file.seek(0)
+            shutil.copyfileobj(pdf_file, tmp)
+        try:
+            step = -(-page_count // PDF_WORKERS)
+            ranges = [(tmp.name, start, min(start + step, page_count)) for start in range(0, page_count, step)]
+            return [text for texts in self._pdf_pool.map(_extract_page_range, ranges) for text in texts]
+        finally:
+            os.unlink(tmp.name)
+    
+    def _extract_pdf_content(self, url: str, pdf_file: IO[bytes]) -> Dict[str, Any]:
+        """
+        Parse a downloaded PDF with pdfplumber, falling back to pypdfium2 (blocking).
+        
+        Args:
+            url: Source URL, used for the fallback title
+            pdf_file: Seekable binary file holding the PDF
+        """
+        # Try pdfplumber first (better for complex layouts)
+        try:
+            return self._extract_with_pdfplumber(url, pdf_file)
+        except Exception as e:
+            logger.warning(f"pdfplumber failed, trying pypdfium2: {e}")
+            pdf_file.seek(0)
+            return self._extract_with_pdfium(url, pdf_file)
+    
+    def _extract_with_pdfplumber(self, url: str, pdf_file: IO[bytes],
+                                 cancel: Optional[threading.Event] = None) -> Dict[str, Any]:
+        """
+        Extract text and metadata with pdfplumber (blocking).
+        
+        Args:
+            url: Source URL, used for the fallback title
+            pdf_file: Seekable binary file holding the PDF
+            cancel: Set when the result is no longer needed; checked between pages
+        """
+        import pdfplumber
+        
+        # pdfplumber reads any seekable binary file, though its stubs only name BufferedReader/BytesIO
+        with pdfplumber.open(pdf_file) as pdf:  # type: ignore[arg-type]
+            text_content = ""
+            metadata = {}
+            
+            # Extract text from all pages; large PDFs are split across worker processes
+            page_count = len(pdf.pages)
+            if page_count >= PDF_PARALLEL_MIN_PAGES and not (cancel and cancel.is_set()):
+                page_texts = self._extract_pages_parallel(pdf_file, page_count)
+            else:
+                page_texts = []
+                for page in pdf.pages:
+                    if cancel and cancel.is_set():
+                        raise RuntimeError("pdfplumber extraction cancelled")
+                    page_texts.append(page.extract_text())
+            for page_text in page_texts:
+                if page_text:
+                    text_content += page_text + "\n"
+            
+            # Extract metadata
+            if pdf.metadata:
+                metadata = _pdf_metadata(pdf.metadata)
+        
+        return {
+            'title': metadata.get('title', url.split('/')[-1]),
+            'content': _WS_RE.sub(' ', text_content).strip(),
+            'images': [],
+            'links': [],
+            'pdfs': [url],
+            'metadata': {
+                'method': 'pdf',
+                'pdf_metadata': metadata,
+                'page_count': page_count
+            }
+        }
+    
+    def _extract_with_pdfium(self, url: str, source: Union[bytes, IO[bytes]]) -> Dict[str, Any]:
+        """
+        Extract text and metadata with pypdfium2, PDFium's native parser (blocking).
+        
+        Args:
+            url: Source URL, used for the fallback title
+            source: PDF bytes or a seekable binary file
+        """
+        import pypdfium2 as pdfium
+        
+        with _PDFIUM_LOCK:
+            pdf = pdfium.PdfDocument(source)
+            try:
+                page_count = len(pdf)
+                metadata = _pdf_metadata(pdf.get_metadata_dict())
+                page_texts = []
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    page_texts.append(textpage.get_text_range())
+                    textpage.close()
+                    page.close()
+            finally:
+                pdf.close()
+        text_content = "\n".join(page_texts)
+        
+        return {
+            'title': metadata['title'] or url.split('/')[-1],
+            'content': _WS_RE.sub(' ', text_content).strip(),
+            'images': [],
+            'links': [],
+            'pdfs': [url],
+            'metadata': {
+                'method': 'pdf_pdfium',
+                'pdf_metadata': metadata,
+                'page_count': page_count
+            }
+        }
+    
+    def _parse_and_extract(self, html: Union[str, bytes],
+                           base_url: str) -> Tuple[str, str, List[str], List[str], List[str]]:
+        """
+        Parse a page and extract (title, text, images, links, pdfs)
+        
+        Uses selectolax (lexbor, C) when installed and BeautifulSoup with the
+        lxml parser otherwise, or if selectolax fails on the page.
+        """
+        if SELECTOLAX_AVAILABLE:
+            try:
+                return self._extract_all_selectolax(html, base_url)
+            except Exception as e:
+                logger.warning(f"selectolax extraction failed for {base_url}, using BeautifulSoup: {e}")
+        return self._extract_all(BeautifulSoup(html, 'lxml'), base_url)
+    
+    def _extract_all_selectolax(self, html: Union[str, bytes],
+                                base_url: str) -> Tuple[str, str, List[str], List[str], List[str]]:
+        """selectolax version of _extract_all, with the same output"""
+        tree = LexborHTMLParser(html)
+        
+        # Title tag, then the first h1 as fallback (looked up before sections are dropped)
+        title_node = tree.css_first('title')
+        h1_node = tree.css_first('h1')
+        if title_node is not None:
+            title = title_node.text().strip()
+        elif h1_node is not None:
+            title = h1_node.text().strip()
+        else:
+            title = "Untitled"
+        
+        tree.strip_tags(list(REMOVED_TAGS))
+        
+        images: List[str] = []
+        links: List[str] = []
+        pdfs: List[str] = []
+        # Menus and footers repeat the same links; each URL is resolved and kept once
+        seen_srcs: Set[str] = set()
+        seen_images: Set[str] = set()
+        seen_hrefs: Set[str] = set()
+        seen_links: Set[str] = set()
+        for node in tree.css('img'):
+            src = node.attributes.get('src')
+            if src and src not in seen_srcs:
+                seen_srcs.add(src)
+                image_url = urljoin(base_url, src)
+                if image_url not in seen_images:
+                    seen_images.add(image_url)
+                    images.append(image_url)
+        for node in tree.css('a'):
+            href = node.attributes.get('href')
+            if href and href not in seen_hrefs:
+                seen_hrefs.add(href)
                 absolute_url = urljoin(base_url, href)
-                pdfs.append(absolute_url)
-        return pdfs
+                if absolute_url not in seen_links:
+                    seen_links.add(absolute_url)
+                    links.append(absolute_url)
+                    if _PDF_RE.search(href):
+                        pdfs.append(absolute_url)
+        
+        root = tree.root
+        text = _WS_RE.sub(' ', root.text(separator=' ', strip=True)).strip() if root is not None else ''
+        return title, text, images, links, pdfs
+    
+    def _extract_all(self, soup: BeautifulSoup,
+                     base_url: str) -> Tuple[str, str, List[str], List[str], List[str]]:
+        """
+        Extract title, text, images, links and PDF links in one walk of the tree
+        
+        Args:
+            soup: Parsed page; script/style/nav/footer/header elements are removed from it
+            base_url: URL the page was fetched from, for resolving relative URLs
+        
+        Returns:
+            (title, text, images, links, pdfs)
+        """
+        title_tag = None
+        h1_tag = None
+        removed: List[Tag] = []
+        removed_ids: Set[int] = set()
+        images: List[str] = []
+        links: List[str] = []
+        pdfs: List[str] = []
+        # Menus and footers repeat the same links; each URL is resolved and kept once
+        seen_srcs: Set[str] = set()
+        seen_images: Set[str] = set()
+        seen_hrefs: Set[str] = set()
+        seen_links: Set[str] = set()
+        
+        for tag in soup.descendants:
+            if not isinstance(tag, Tag):
+                continue
+            name = tag.name
+            if title_tag is None and name == 'title':
+                title_tag = tag
+            elif h1_tag is None and name == 'h1':
+                h1_tag = tag
+            
+            # Elements inside removed sections are not part of the page content
+            if id(tag.parent) in removed_ids:
+                removed_ids.add(id(tag))
+                continue
+            if name in REMOVED_TAGS:
+                removed.append(tag)
+                removed_ids.add(id(tag))
+            elif name == 'img':
+                src = tag.get('src')
+                if isinstance(src, str) and src and src not in seen_srcs:
+                    seen_srcs.add(src)
+                    image_url = urljoin(base_url, src)
+                    if image_url not in seen_images:
+                        seen_images.add(image_url)
+                        images.append(image_url)
+            elif name == 'a':
+                href = tag.get('href')
+                if isinstance(href, str) and href and href not in seen_hrefs:
+                    seen_hrefs.add(href)
+                    # Convert relative URLs to absolute
+                    absolute_url = urljoin(base_url, href)
+                    if absolute_url not in seen_links:
+                        seen_links.add(absolute_url)
+                        links.append(absolute_url)
+                        if _PDF_RE.search(href):
+                            pdfs.append(absolute_url)
+        
+        # Title tag, then the first h1 as fallback
+        if title_tag is not None:
+            title = title_tag.get_text().strip()
+        elif h1_tag is not None:
+            title = h1_tag.get_text().strip()
+        else:
+            title = "Untitled"
+        
+        for tag in removed:
+            tag.decompose()
+        
+        # Text nodes joined with spaces, whitespace collapsed in one pass
+        text = _WS_RE.sub(' ', soup.get_text(separator=' ', strip=True)).strip()
+        return title, text, images, links, pdfs
     
     def _post_process_content(self, content: Dict[str, Any], url: str) -> Dict[str, Any]:
         """Post-process scraped content"""
@@ -492,18 +932,15 @@ class AdvancedWebScraper:
             content['content'] = self._clean_text(content['content'])
         
         # Add URL-specific processing
-        if any(re.search(pattern, url, re.IGNORECASE) for pattern in self.gov_patterns.values()):
+        if _GOV_RE.search(url):
             content = self._process_government_content(content, url)
         
         return content
     
     def _clean_text(self, text: str) -> str:
-        """Clean and normalize text content"""
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
+        """Clean and normalize text content (whitespace is already collapsed by the extractors)"""
         # Remove special characters that might cause issues
-        text = re.sub(r'[^\w\s\.\,\!\?\;\:\-\(\)\[\]\"\']', '', text)
+        text = _STRIP_RE.sub('', text)
         
         return text.strip()
     
@@ -514,72 +951,92 @@ class AdvancedWebScraper:
         
         # Extract specific patterns for government documents
         if content.get('content'):
-            # Look for act numbers, section numbers, etc.
-            act_patterns = [
-                r'Act No\.?\s*\d+',
-                r'Section\s+\d+',
-                r'Rule\s+\d+',
-                r'Regulation\s+\d+'
-            ]
-            
-            found_patterns = []
-            for pattern in act_patterns:
-                matches = re.findall(pattern, content['content'], re.IGNORECASE)
-                found_patterns.extend(matches)
+            # Look for act numbers, section numbers, etc. in a single pass
+            found_patterns = _ACT_RE.findall(content['content'])
             
             if found_patterns:
-                content['metadata']['legal_references'] = list(set(found_patterns))
+                # Deduplicate, keeping first-occurrence order
+                content['metadata']['legal_references'] = list(dict.fromkeys(found_patterns))
         
         return content
     
-    def _is_valid_url(self, url: str) -> bool:
-        """Validate URL format"""
+    @staticmethod
+    @lru_cache(maxsize=URL_CACHE_SIZE)
+    def _is_valid_url(url: str) -> bool:
+        """Validate URL format (repeated URLs come from cache)"""
         try:
             result = urlparse(url)
             return all([result.scheme, result.netloc])
         except:
             return False
     
-    async def scrape_multiple_urls(self, urls: List[str], max_concurrent: int = 5) -> List[ScrapedContent]:
-        """Scrape multiple URLs concurrently"""
-        semaphore = asyncio.Semaphore(max_concurrent)
-        
-        async def scrape_with_semaphore(url):
-            async with semaphore:
-                return await self.scrape_url(url)
+    async def iter_scrape(self, urls: Iterable[str], max_concurrent: int = 5,
+                          method: str = 'auto') -> AsyncIterator[ScrapedContent]:
+        """
+        Scrape multiple URLs concurrently, yielding results as they complete
         
-        tasks = [scrape_with_semaphore(url) for url in urls]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        A fixed set of max_concurrent workers pulls URLs from the shared iterator,
+        and at most max_concurrent finished results wait for the consumer, so
+        memory stays bounded however many URLs are passed.
+        """
+        url_iter = iter(urls)
+        done = object()  # per-worker end marker
+        results: asyncio.Queue = asyncio.Queue(maxsize=max_concurrent)
         
-        # Filter out exceptions
-        valid_results = []
-        for result in results:
-            if isinstance(result, ScrapedContent):
-                valid_results.append(result)
-            else:
-                logger.error(f"Scraping failed: {result}")
+        async def worker() -> None:
+            try:
+                for url in url_iter:
+                    try:
+                        result = await self.scrape_url(url, method)
+                    except Exception as e:
+                        logger.error(f"Scraping failed: {e}")
+                        continue
+                    await results.put(result)
+            except Exception as e:
+                logger.error(f"URL iterator failed: {e}")
+            # Not reached when cancelled: nobody reads the (possibly full) queue then
+            await results.put(done)
         
-        return valid_results
+        workers = [asyncio.create_task(worker()) for _ in range(max(1, max_concurrent))]
+        try:
+            remaining = len(workers)
+            while remaining:
+                result = await results.get()
+                if result is done:
+                    remaining -= 1
+                else:
+                    yield result
+        finally:
+            # Cancel outstanding scrapes if the consumer stops early, and wait for them to end
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+    
+    async def scrape_multiple_urls(self, urls: List[str], max_concurrent: int = 5) -> List[ScrapedContent]:
+        """Scrape multiple URLs concurrently (results in completion order)"""
+        return [result async for result in self.iter_scrape(urls, max_concurrent)]
     
     async def health_check(self) -> Dict[str, Any]:
         """Check scraper health and dependencies"""
         health_status = {
             'selenium_available': SELENIUM_AVAILABLE,
             'playwright_available': PLAYWRIGHT_AVAILABLE,
-            'requests_session': True,
+            'http_client': not self._client.is_closed,
+            'http2': HTTP2_AVAILABLE,
             'dependencies': {
-                'requests': True,
+                'httpx': True,
                 'beautifulsoup4': True,
+                'selectolax': SELECTOLAX_AVAILABLE,
                 'selenium': SELENIUM_AVAILABLE,
                 'playwright': PLAYWRIGHT_AVAILABLE,
                 'pdfplumber': True,
-                'pypdf2': True
+                'pypdfium2': True
             }
         }
         
         # Test basic functionality
         try:
-            test_response = self.session.get('https://httpbin.org/get', timeout=5)
+            test_response = await self._client.get('https://httpbin.org/get', timeout=5)
             health_status['network_test'] = test_response.status_code == 200
         except:
             health_status['network_test'] = False
@@ -0,0 +1,59 @@
+"""
+Shared fixtures for the backend tests
+
+Session-scoped fixtures are built once per test process (once per worker under
+``pytest -n``).
+"""
+
+import asyncio
+from functools import lru_cache
+
+import os
+
+import httpx
+import pytest
+import pytest_asyncio
+
+# Re-validate constructed response models; read when backend_app.api.v1 is imported
+os.environ.setdefault("API_VALIDATE_RESPONSES", "1")
+
+from backend_app.main import app
+from backend_app.services.retrieval import RetrievalService
+from backend_app.services.kg import KnowledgeGraphService
+from backend_app.services.controller import LLMController
+
+@pytest.fixture(scope="session", autouse=True)
+def content_store_path(tmp_path_factory):
+    """Give each test session (one per xdist worker) its own content store file"""
+    path = tmp_path_factory.mktemp("content_store") / "document_content.db"
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("CONTENT_STORE_PATH", str(path))
+        yield path
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def aclient():
+    """One AsyncClient on the session event loop; the app's lifespan starts and stops once"""
+    async with (
+        app.router.lifespan_context(app),
+        httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver") as client,
+    ):
+        yield client
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def get_cached(aclient):
+    """
+    Memoized GET for deterministic, side-effect-free endpoints.
+
+    Each path is dispatched once per session; the cached task is awaited by
+    every caller, so concurrent first requests share one round-trip. Never
+    use it for POSTs or for endpoints whose response should change.
+    """
+    @lru_cache(maxsize=None)
+    def get(path: str) -> "asyncio.Task[httpx.Response]":
+        return asyncio.ensure_future(aclient.get(path))
+    return get
+
+@pytest.fixture(scope="session")
+def services():
+    """Retrieval, knowledge graph and LLM services, built once per session"""
+    return RetrievalService(), KnowledgeGraphService(), LLMController()
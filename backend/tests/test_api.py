@@ -5,112 +5,189 @@ These tests verify that the API endpoints return the expected placeholder respon
 and that the service structure is working correctly.
 """
 
+import asyncio
+import httpx
+import msgspec
+import orjson
 import pytest
-from fastapi.testclient import TestClient
 from backend_app.main import app
 
-client = TestClient(app)
+def _json(response):
+    """Decode a response body with orjson (same dicts/lists as response.json())"""
+    return orjson.loads(response.content)
 
-def test_root_endpoint():
+# Expected /v1/query response shape; unlike the API schema, no field has a default
+class ExpectedRetrieval(msgspec.Struct):
+    dense: list[str]
+    sparse: list[str]
+
+class ExpectedTrace(msgspec.Struct):
+    language: str
+    retrieval: ExpectedRetrieval
+    kg_traversal: str
+    controller_iterations: int
+
+class ExpectedQueryResponse(msgspec.Struct):
+    answer: str
+    citations: list
+    processing_trace: ExpectedTrace
+    risk_assessment: str
+
+async def test_root_endpoint(get_cached):
     """Test the root endpoint returns API information"""
-    response = client.get("/")
+    response = await get_cached("/")
     assert response.status_code == 200
-    data = response.json()
+    data = _json(response)
     assert "message" in data
     assert "version" in data
     assert data["version"] == "0.1.0"
 
-def test_health_endpoint():
+async def test_health_endpoint(get_cached):
     """Test the health check endpoint"""
-    response = client.get("/health")
+    response = await get_cached("/health")
     assert response.status_code == 200
-    data = response.json()
+    data = _json(response)
     assert "status" in data
     assert data["status"] == "healthy"
     assert "services" in data
 
-def test_query_endpoint_success():
+async def test_query_endpoint_success(aclient):
     """Test the query endpoint with valid request"""
-    response = client.post(
+    response = await aclient.post(
         "/v1/query",
         json={"query": "What is the admission policy?"}
     )
     assert response.status_code == 200
-    data = response.json()
-    
-    # Check response structure
-    assert "answer" in data
-    assert "citations" in data
-    assert "processing_trace" in data
-    assert "risk_assessment" in data
-    
-    # Check processing trace structure
-    trace = data["processing_trace"]
-    assert "language" in trace
-    assert "retrieval" in trace
-    assert "kg_traversal" in trace
-    assert "controller_iterations" in trace
-    
-    # Check retrieval structure
-    retrieval = trace["retrieval"]
-    assert "dense" in retrieval
-    assert "sparse" in retrieval
-    assert isinstance(retrieval["dense"], list)
-    assert isinstance(retrieval["sparse"], list)
+    # Decoding into the expected shape checks every field's presence and type in one call
+    data = msgspec.json.decode(response.content, type=ExpectedQueryResponse)
     
     # Verify placeholder values
-    assert data["answer"] == "N/A - model not connected"
-    assert data["risk_assessment"] == "Coming soon"
-    assert trace["language"] == "N/A"
-    assert trace["kg_traversal"] == "N/A"
-    assert trace["controller_iterations"] == 0
-
-def test_query_endpoint_simulate_failure():
+    assert data.answer == "N/A - model not connected"
+    assert data.risk_assessment == "Coming soon"
+    assert data.processing_trace.language == "N/A"
+    assert data.processing_trace.kg_traversal == "N/A"
+    assert data.processing_trace.controller_iterations == 0
+
+async def test_query_stream_endpoint(aclient):
+    """Test that the streaming query endpoint relays model fragments as NDJSON"""
+    body = b'{"response":"Hel","done":false}\n{"response":"lo","done":false}\n{"response":"","done":true}\n'
+    ollama = app.state.llm_controller.ollama_service
+    original_client = ollama._client
+    ollama._client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body)))
+    try:
+        response = await aclient.post(
+            "/v1/query/stream?model=deepseek-r1:7b",
+            json={"query": "What is the admission policy?"}
+        )
+    finally:
+        await ollama._client.aclose()
+        ollama._client = original_client
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [orjson.loads(line) for line in response.content.splitlines()] == [
+        {"delta": "Hel"}, {"delta": "lo"}, {"done": True}
+    ]
+
+async def test_query_stream_endpoint_reports_errors(aclient):
+    """Test that a model failure mid-stream ends the stream with an error line"""
+    ollama = app.state.llm_controller.ollama_service
+    original_client = ollama._client
+    ollama._client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(500)))
+    try:
+        response = await aclient.post("/v1/query/stream", json={"query": "What is the admission policy?"})
+    finally:
+        await ollama._client.aclose()
+        ollama._client = original_client
+    assert response.status_code == 200
+    lines = [orjson.loads(line) for line in response.content.splitlines()]
+    assert len(lines) == 1 and "error" in lines[0]
+
+@pytest.mark.parametrize("status_code, attempts", [(404, 1), (503, 2)])
+async def test_scrape_endpoint_retries_only_transient_errors(aclient, monkeypatch, status_code, attempts):
+    """Test that a 4xx fails on the first attempt while a 5xx is retried up to max_retries"""
+    from backend_app.api import v1
+    from backend_app.services import scraper as scraper_module
+    monkeypatch.setattr(v1, "_RETRY_DELAYS", (0.0,))
+    monkeypatch.setattr(v1, "_RETRY_JITTER", 0.0)
+    monkeypatch.setattr(scraper_module, "RETRY_BACKOFF", 0.0)
+
+    requests = []
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(status_code)
+
+    scraper = app.state.scraper_service
+    original_client = scraper._client
+    scraper._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        response = await aclient.post(
+            "/v1/scrape",
+            json={"url": "https://example.com/page", "method": "requests", "max_retries": 2}
+        )
+    finally:
+        await scraper._client.aclose()
+        scraper._client = original_client
+    assert response.status_code == 500
+    assert str(status_code) in _json(response)["detail"]["details"]
+    # Throttled and server-error responses are also retried inside each attempt
+    per_attempt = 1 if status_code == 404 else scraper_module.HTTP_RETRIES + 1
+    assert len(requests) == attempts * per_attempt
+
+async def test_query_endpoint_simulate_failure(aclient):
     """Test the query endpoint with failure simulation"""
-    response = client.post(
+    response = await aclient.post(
         "/v1/query",
-        json={"query": "Test query", "simulate_failure": True}
+        params={"simulate_failure": True},
+        json={"query": "Test query"}
     )
     assert response.status_code == 503
-    data = response.json()
+    data = _json(response)
     assert "error" in data
     assert "details" in data
 
-def test_query_endpoint_invalid_request():
+async def test_query_endpoint_invalid_request(aclient):
     """Test the query endpoint with invalid request"""
-    response = client.post(
+    response = await aclient.post(
         "/v1/query",
         json={"invalid_field": "test"}
     )
     assert response.status_code == 422  # Validation error
 
-def test_document_endpoint_not_found():
+async def test_query_endpoint_rejects_unknown_fields(aclient):
+    """Test the query endpoint rejects options sent in the request body"""
+    response = await aclient.post(
+        "/v1/query",
+        json={"query": "Test query", "model": "deepseek-r1:7b"}
+    )
+    assert response.status_code == 422
+
+async def test_document_endpoint_not_found(aclient):
     """Test the document endpoint returns 404 for non-existent document"""
-    response = client.get("/v1/document/nonexistent")
+    response = await aclient.get("/v1/document/nonexistent")
     assert response.status_code == 404
-    data = response.json()
+    data = _json(response)
     assert "error" in data
 
-def test_document_endpoint_placeholder():
+async def test_document_endpoint_placeholder(aclient):
     """Test the document endpoint with placeholder ID"""
-    response = client.get("/v1/document/N/A")
+    response = await aclient.get("/v1/document/N/A")
     assert response.status_code == 404
 
-def test_ingest_endpoint():
+async def test_ingest_endpoint(aclient):
     """Test the document ingestion endpoint"""
-    response = client.post(
+    response = await aclient.post(
         "/v1/ingest",
         json={"title": "Test Document", "content": "Test content"}
     )
     assert response.status_code == 200
-    data = response.json()
+    data = _json(response)
     assert "jobId" in data
     assert "status" in data
     assert data["status"] == "accepted"
 
-def test_feedback_endpoint():
+async def test_feedback_endpoint(aclient):
     """Test the feedback submission endpoint"""
-    response = client.post(
+    response = await aclient.post(
         "/v1/feedback",
         json={
             "query": "Test query",
@@ -120,49 +197,43 @@ def test_feedback_endpoint():
         }
     )
     assert response.status_code == 200
-    data = response.json()
+    data = _json(response)
     assert "status" in data
     assert data["status"] == "success"
 
-def test_system_status_endpoint():
+async def test_system_status_endpoint(get_cached):
     """Test the system status endpoint"""
-    response = client.get("/v1/status")
+    response = await get_cached("/v1/status")
     assert response.status_code == 200
-    data = response.json()
+    data = _json(response)
     assert "overall_status" in data
     assert "services" in data
     assert "timestamp" in data
 
-def test_cors_headers():
+async def test_cors_headers(aclient):
     """Test that CORS headers are properly set"""
-    response = client.options("/v1/query")
+    response = await aclient.options("/v1/query")
     assert response.status_code == 200
     # CORS headers should be present (handled by middleware)
 
-def test_api_documentation():
+@pytest.mark.slow
+async def test_api_documentation(aclient):
     """Test that API documentation is accessible"""
-    response = client.get("/docs")
-    assert response.status_code == 200
-    
-    response = client.get("/redoc")
-    assert response.status_code == 200
+    docs, redoc = await asyncio.gather(aclient.get("/docs"), aclient.get("/redoc"))
+    assert docs.status_code == 200
+    assert redoc.status_code == 200
 
 @pytest.mark.asyncio
-async def test_service_initialization():
+async def test_service_initialization(services):
     """Test that services can be initialized without errors"""
-    from backend_app.services.retrieval import RetrievalService
-    from backend_app.services.kg import KnowledgeGraphService
-    from backend_app.services.controller import LLMController
+    retrieval_service, kg_service, llm_controller = services
     
-    # Initialize services
-    retrieval_service = RetrievalService()
-    kg_service = KnowledgeGraphService()
-    llm_controller = LLMController()
-    
-    # Test health checks
-    retrieval_health = await retrieval_service.health_check()
-    kg_health = await kg_service.health_check()
-    controller_health = await llm_controller.health_check()
+    # Test health checks (independent backends, so probe them concurrently)
+    retrieval_health, kg_health, controller_health = await asyncio.gather(
+        retrieval_service.health_check(),
+        kg_service.health_check(),
+        llm_controller.health_check(),
+    )
     
     # Verify health check structure
     assert "qdrant" in retrieval_health
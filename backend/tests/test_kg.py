@@ -0,0 +1,72 @@
+"""
+Tests for the knowledge graph traversal helpers
+
+The BFS helpers are checked against a plain per-source BFS on directed
+graphs, including graphs whose leaves never appear as adjacency keys.
+"""
+
+import random
+
+from backend_app.services.kg import _do_bfs, _multi_source_bfs
+
+def _reference_bfs(adjacency, start, depth):
+    """Nodes within depth hops of start, one level at a time"""
+    reached = {start}
+    frontier = [start]
+    for _ in range(depth):
+        frontier = [n for node in frontier for n in adjacency.get(node, ()) if n not in reached]
+        reached.update(frontier)
+    return reached
+
+def _transpose(adjacency):
+    reverse = {}
+    for node, neighbors in adjacency.items():
+        for neighbor in neighbors:
+            reverse.setdefault(neighbor, []).append(node)
+    return reverse
+
+def _random_graph(rng, nodes, edges):
+    """Directed graph as adjacency lists; nodes without out-edges are not keys"""
+    adjacency = {}
+    for _ in range(edges):
+        a, b = rng.randrange(nodes), rng.randrange(nodes)
+        if a != b and str(b) not in adjacency.get(str(a), ()):
+            adjacency.setdefault(str(a), []).append(str(b))
+    return adjacency
+
+def test_multi_source_bfs_reaches_leaf_only_nodes():
+    """A leaf that is not an adjacency key is still reached"""
+    assert _multi_source_bfs({"A": ["X"], "X": ["Y"]}, ["A"], 2) == {"A": {"A", "X", "Y"}}
+
+def test_multi_source_bfs_is_directed():
+    """Edges are followed from key to neighbor only"""
+    adjacency = {"A": ["B"], "C": ["B"]}
+    assert _multi_source_bfs(adjacency, ["A", "B"], 3) == {"A": {"A", "B"}, "B": {"B"}}
+
+def test_multi_source_bfs_matches_reference():
+    """Every source reaches exactly what a separate BFS from it would"""
+    rng = random.Random(0)
+    for _ in range(50):
+        adjacency = _random_graph(rng, 30, 60)
+        sources = [str(rng.randrange(30)) for _ in range(5)]
+        depth = rng.randrange(1, 5)
+        reached = _multi_source_bfs(adjacency, sources, depth)
+        for source in sources:
+            assert reached[source] == _reference_bfs(adjacency, source, depth)
+
+def test_do_bfs_matches_reference():
+    """Top-down and bottom-up steps together give the plain BFS result"""
+    rng = random.Random(1)
+    for _ in range(50):
+        # A hub with many out-edges forces some bottom-up steps
+        adjacency = _random_graph(rng, 40, 80)
+        adjacency["0"] = [str(n) for n in range(1, 40)]
+        reverse = _transpose(adjacency)
+        start = str(rng.randrange(40))
+        depth = rng.randrange(1, 5)
+        assert _do_bfs(adjacency, reverse, start, depth) == _reference_bfs(adjacency, start, depth)
+
+def test_do_bfs_stops_at_depth():
+    """Nodes further than depth hops are not reached"""
+    adjacency = {"A": ["B"], "B": ["C"], "C": ["D"]}
+    assert _do_bfs(adjacency, _transpose(adjacency), "A", 2) == {"A", "B", "C"}
@@ -0,0 +1,68 @@
+"""
+Tests for OllamaService response streaming
+
+Provider APIs are replaced with httpx.MockTransport, so the NDJSON and
+server-sent event parsing runs without network access.
+"""
+
+import httpx
+import pytest
+
+from backend_app.services.ollama_service import OllamaService
+
+def _sse(*events: bytes) -> bytes:
+    return b"".join(b"data: " + event + b"\n\n" for event in events) + b"data: [DONE]\n\n"
+
+# (model, API key attribute, provider response body)
+STREAM_CASES = [
+    (
+        "deepseek-r1:7b",
+        None,
+        b'{"response":"Hel","done":false}\n\n{"response":"lo","done":false}\n{"response":"","done":true}\n',
+    ),
+    (
+        "gpt-4o",
+        "openai_api_key",
+        _sse(b'{"choices":[{"delta":{"role":"assistant"}}]}',
+             b'{"choices":[{"delta":{"content":"Hel"}}]}',
+             b'{"choices":[{"delta":{"content":"lo"}}]}'),
+    ),
+    (
+        "claude-3-5-sonnet-20241022",
+        "anthropic_api_key",
+        _sse(b'{"type":"message_start","message":{}}',
+             b'{"type":"content_block_delta","delta":{"type":"text_delta","text":"Hel"}}',
+             b'{"type":"content_block_delta","delta":{"type":"text_delta","text":"lo"}}',
+             b'{"type":"message_stop"}'),
+    ),
+    (
+        "gemini-2.5-flash",
+        "gemini_api_key",
+        _sse(b'{"candidates":[{"content":{"parts":[{"text":"Hel"}]}}]}',
+             b'{"candidates":[{"content":{"parts":[{"text":"lo"}]}}]}'),
+    ),
+]
+
+@pytest.mark.parametrize("model, key_attribute, body", STREAM_CASES)
+async def test_generate_response_stream(model, key_attribute, body):
+    """Each provider's stream format is parsed into the answer's text fragments"""
+    service = OllamaService()
+    if key_attribute:
+        setattr(service, key_attribute, "test-key")
+    await service.close()
+    service._client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body)))
+    try:
+        fragments = [fragment async for fragment in service.generate_response_stream("query", model)]
+    finally:
+        await service.close()
+    assert fragments == ["Hel", "lo"]
+
+async def test_generate_response_stream_requires_api_key():
+    """Cloud models fail before any request when their API key is missing"""
+    service = OllamaService()
+    service.openai_api_key = None
+    try:
+        with pytest.raises(Exception, match="OpenAI API key not configured"):
+            [fragment async for fragment in service.generate_response_stream("query", "gpt-4o")]
+    finally:
+        await service.close()
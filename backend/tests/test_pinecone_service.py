@@ -0,0 +1,53 @@
+"""
+Tests for PineconeService embedding caching
+
+The service is built without __init__, so no model is loaded and no index is
+contacted; a fake encoder stands in for the sentence-transformers model.
+"""
+
+import asyncio
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from backend_app.services import pinecone_service
+from backend_app.services.pinecone_service import PineconeService
+
+class FakeEncoder:
+    """Encodes each text to [len(text)]; texts in `block_on` wait for `release`"""
+
+    def __init__(self, block_on: str):
+        self.block_on = block_on
+        self.release = threading.Event()
+
+    def encode(self, texts, **kwargs):
+        if self.block_on in texts:
+            assert self.release.wait(timeout=5)
+        return np.array([[float(len(text))] for text in texts])
+
+def _service(encoder: FakeEncoder) -> PineconeService:
+    service = PineconeService.__new__(PineconeService)
+    service.embedding_model = encoder
+    service._model_version = "fake"
+    service._embedding_cache = OrderedDict()
+    return service
+
+async def test_embed_many_survives_eviction_by_concurrent_call(monkeypatch):
+    """Test that a cache hit evicted while another call encodes is still returned"""
+    monkeypatch.setattr(pinecone_service, "EMBEDDING_CACHE_SIZE", 2)
+    encoder = FakeEncoder(block_on="slow miss")
+    service = _service(encoder)
+    await service._embed_many(["hit"])
+
+    # The first call finds "hit" cached, then blocks encoding its miss
+    first = asyncio.create_task(service._embed_many(["hit", "slow miss"]))
+    await asyncio.sleep(0)
+    # Meanwhile a second call fills the two-entry cache and evicts "hit"
+    await service._embed_many(["other one", "other two"])
+    assert service._content_key("hit") not in service._embedding_cache
+
+    encoder.release.set()
+    embeddings = await first
+    assert [float(embedding[0]) for embedding in embeddings] == [3.0, 9.0]
+    assert len(service._embedding_cache) == 2
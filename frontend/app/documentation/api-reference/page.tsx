@@ -48,12 +48,11 @@ export default function ApiReferencePage() {
                 </CardHeader>
                 <CardContent className="text-sm text-gray-700 space-y-2">
                   <p>Submit a natural language policy question.</p>
-                  <pre className="bg-muted p-3 rounded text-xs overflow-auto">{`{
-  "query": "What are the UGC guidelines for PhD supervision?",
-  "model": "deepseek-r1:7b",
-  "thinking_mode": "smart",
-  "simulate_failure": false
+                  <pre className="bg-muted p-3 rounded text-xs overflow-auto">{`POST /query?model=deepseek-r1:7b&thinking_mode=smart
+{
+  "query": "What are the UGC guidelines for PhD supervision?"
 }`}</pre>
+                  <p className="text-xs text-muted-foreground">Optional query parameters: <code>model</code>, <code>thinking_mode</code>, <code>simulate_failure</code>.</p>
                   <p className="text-xs text-muted-foreground">Response includes <code>answer</code>, <code>citations</code>, and <code>processing_trace</code>.</p>
                 </CardContent>
               </Card>